@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+"""
+EuroStyle Fashion - Finance Chart of Accounts
+=============================================
+Static IFRS-compliant chart of accounts used by the finance data generator.
+
+The chart is fixed, so it is kept as a precomputed table rather than being
+rebuilt from a nested structure on every run. Accounts are ordered parent
+first (type -> category -> subcategory -> leaf) with sequential account IDs.
+
+Author: EuroStyle Fashion Data Team
+Date: 2024-10-10
+"""
+
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
+
+_CREATED_DATE = '2024-01-01 00:00:00'
+
+
+class Account(NamedTuple):
+    """Chart of accounts entry (field order matches the CSV schema)."""
+    account_id: str
+    account_code: str
+    account_name: str
+    account_type: str
+    account_category: str
+    account_subcategory: str
+    parent_account_id: str
+    account_level: int
+    is_leaf_account: bool
+    normal_balance: str
+    is_active: bool
+    consolidation_account: str
+    created_date: str
+
+
+# Fields: account_id, account_code, account_name, account_type, account_category,
+# account_subcategory, parent_account_id, account_level, is_leaf_account,
+# normal_balance, is_active, consolidation_account, created_date
+CHART_OF_ACCOUNTS: Tuple[Account, ...] = (
+    # ASSETS (1000-1999)
+    Account('ACC_000001', '1000', 'ASSETS', 'ASSETS', 'ASSETS', '', '', 1, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000002', '1100', 'Current Assets', 'ASSETS', 'Current Assets', '', 'ACC_000001', 2, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000003', '1110', 'Cash and Cash Equivalents', 'ASSETS', 'Current Assets', 'Cash and Cash Equivalents', 'ACC_000002', 3, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000004', '1111', 'Cash', 'ASSETS', 'Current Assets', 'Cash and Cash Equivalents', 'ACC_000003', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000005', '1112', 'Bank Current Account', 'ASSETS', 'Current Assets', 'Cash and Cash Equivalents', 'ACC_000003', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000006', '1113', 'Short-term Deposits', 'ASSETS', 'Current Assets', 'Cash and Cash Equivalents', 'ACC_000003', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000007', '1114', 'Trade Receivables', 'ASSETS', 'Current Assets', 'Trade Receivables', 'ACC_000002', 3, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000008', '1115', 'Accounts Receivable', 'ASSETS', 'Current Assets', 'Trade Receivables', 'ACC_000007', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000009', '1116', 'Allowance for Doubtful Accounts', 'ASSETS', 'Current Assets', 'Trade Receivables', 'ACC_000007', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000010', '1117', 'Inventory', 'ASSETS', 'Current Assets', 'Inventory', 'ACC_000002', 3, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000011', '1118', 'Raw Materials', 'ASSETS', 'Current Assets', 'Inventory', 'ACC_000010', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000012', '1119', 'Finished Goods', 'ASSETS', 'Current Assets', 'Inventory', 'ACC_000010', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000013', '1120', 'Inventory Provision', 'ASSETS', 'Current Assets', 'Inventory', 'ACC_000010', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000014', '1121', 'Other Current Assets', 'ASSETS', 'Current Assets', 'Other Current Assets', 'ACC_000002', 3, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000015', '1122', 'Prepaid Expenses', 'ASSETS', 'Current Assets', 'Other Current Assets', 'ACC_000014', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000016', '1123', 'VAT Receivable', 'ASSETS', 'Current Assets', 'Other Current Assets', 'ACC_000014', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000017', '1124', 'Other Receivables', 'ASSETS', 'Current Assets', 'Other Current Assets', 'ACC_000014', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000018', '1125', 'Non-current Assets', 'ASSETS', 'Non-current Assets', '', 'ACC_000001', 2, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000019', '1135', 'Property, Plant & Equipment', 'ASSETS', 'Non-current Assets', 'Property, Plant & Equipment', 'ACC_000018', 3, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000020', '1136', 'Land & Buildings', 'ASSETS', 'Non-current Assets', 'Property, Plant & Equipment', 'ACC_000019', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000021', '1137', 'Equipment', 'ASSETS', 'Non-current Assets', 'Property, Plant & Equipment', 'ACC_000019', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000022', '1138', 'Accumulated Depreciation', 'ASSETS', 'Non-current Assets', 'Property, Plant & Equipment', 'ACC_000019', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000023', '1139', 'Intangible Assets', 'ASSETS', 'Non-current Assets', 'Intangible Assets', 'ACC_000018', 3, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000024', '1140', 'Software', 'ASSETS', 'Non-current Assets', 'Intangible Assets', 'ACC_000023', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000025', '1141', 'Trademarks', 'ASSETS', 'Non-current Assets', 'Intangible Assets', 'ACC_000023', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000026', '1142', 'Goodwill', 'ASSETS', 'Non-current Assets', 'Intangible Assets', 'ACC_000023', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000027', '1143', 'Financial Assets', 'ASSETS', 'Non-current Assets', 'Financial Assets', 'ACC_000018', 3, False, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000028', '1144', 'Long-term Investments', 'ASSETS', 'Non-current Assets', 'Financial Assets', 'ACC_000027', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+    Account('ACC_000029', '1145', 'Deferred Tax Assets', 'ASSETS', 'Non-current Assets', 'Financial Assets', 'ACC_000027', 4, True, 'DEBIT', True, 'ASSETS', _CREATED_DATE),
+
+    # LIABILITIES (2000-2999)
+    Account('ACC_000030', '1146', 'LIABILITIES', 'LIABILITIES', 'LIABILITIES', '', '', 1, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000031', '1246', 'Current Liabilities', 'LIABILITIES', 'Current Liabilities', '', 'ACC_000030', 2, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000032', '1256', 'Trade Payables', 'LIABILITIES', 'Current Liabilities', 'Trade Payables', 'ACC_000031', 3, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000033', '1257', 'Accounts Payable', 'LIABILITIES', 'Current Liabilities', 'Trade Payables', 'ACC_000032', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000034', '1258', 'Accrued Expenses', 'LIABILITIES', 'Current Liabilities', 'Trade Payables', 'ACC_000032', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000035', '1259', 'Tax Liabilities', 'LIABILITIES', 'Current Liabilities', 'Tax Liabilities', 'ACC_000031', 3, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000036', '1260', 'VAT Payable', 'LIABILITIES', 'Current Liabilities', 'Tax Liabilities', 'ACC_000035', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000037', '1261', 'Income Tax Payable', 'LIABILITIES', 'Current Liabilities', 'Tax Liabilities', 'ACC_000035', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000038', '1262', 'Payroll Tax Payable', 'LIABILITIES', 'Current Liabilities', 'Tax Liabilities', 'ACC_000035', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000039', '1263', 'Other Current Liabilities', 'LIABILITIES', 'Current Liabilities', 'Other Current Liabilities', 'ACC_000031', 3, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000040', '1264', 'Short-term Debt', 'LIABILITIES', 'Current Liabilities', 'Other Current Liabilities', 'ACC_000039', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000041', '1265', 'Customer Deposits', 'LIABILITIES', 'Current Liabilities', 'Other Current Liabilities', 'ACC_000039', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000042', '1266', 'Non-current Liabilities', 'LIABILITIES', 'Non-current Liabilities', '', 'ACC_000030', 2, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000043', '1276', 'Long-term Debt', 'LIABILITIES', 'Non-current Liabilities', 'Long-term Debt', 'ACC_000042', 3, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000044', '1277', 'Long-term Loans', 'LIABILITIES', 'Non-current Liabilities', 'Long-term Debt', 'ACC_000043', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000045', '1278', 'Bonds Payable', 'LIABILITIES', 'Non-current Liabilities', 'Long-term Debt', 'ACC_000043', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000046', '1279', 'Provisions', 'LIABILITIES', 'Non-current Liabilities', 'Provisions', 'ACC_000042', 3, False, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000047', '1280', 'Warranty Provisions', 'LIABILITIES', 'Non-current Liabilities', 'Provisions', 'ACC_000046', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+    Account('ACC_000048', '1281', 'Restructuring Provisions', 'LIABILITIES', 'Non-current Liabilities', 'Provisions', 'ACC_000046', 4, True, 'CREDIT', True, 'LIABILITIES', _CREATED_DATE),
+
+    # EQUITY (3000-3999)
+    Account('ACC_000049', '1282', 'EQUITY', 'EQUITY', 'EQUITY', '', '', 1, False, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000050', '1382', 'Share Capital', 'EQUITY', 'Share Capital', '', 'ACC_000049', 2, False, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000051', '1392', 'Capital', 'EQUITY', 'Share Capital', 'Capital', 'ACC_000050', 3, False, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000052', '1393', 'Share Capital', 'EQUITY', 'Share Capital', 'Capital', 'ACC_000051', 4, True, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000053', '1394', 'Share Premium', 'EQUITY', 'Share Capital', 'Capital', 'ACC_000051', 4, True, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000054', '1395', 'Reserves', 'EQUITY', 'Share Capital', 'Reserves', 'ACC_000050', 3, False, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000055', '1396', 'Legal Reserves', 'EQUITY', 'Share Capital', 'Reserves', 'ACC_000054', 4, True, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000056', '1397', 'Retained Earnings', 'EQUITY', 'Share Capital', 'Reserves', 'ACC_000054', 4, True, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+    Account('ACC_000057', '1398', 'Currency Translation Reserve', 'EQUITY', 'Share Capital', 'Reserves', 'ACC_000054', 4, True, 'CREDIT', True, 'EQUITY', _CREATED_DATE),
+
+    # REVENUE (4000-4999)
+    Account('ACC_000058', '1399', 'REVENUE', 'REVENUE', 'REVENUE', '', '', 1, False, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000059', '1499', 'Sales Revenue', 'REVENUE', 'Sales Revenue', '', 'ACC_000058', 2, False, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000060', '1509', 'Product Sales', 'REVENUE', 'Sales Revenue', 'Product Sales', 'ACC_000059', 3, False, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000061', '1510', 'Retail Sales', 'REVENUE', 'Sales Revenue', 'Product Sales', 'ACC_000060', 4, True, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000062', '1511', 'Wholesale Sales', 'REVENUE', 'Sales Revenue', 'Product Sales', 'ACC_000060', 4, True, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000063', '1512', 'Online Sales', 'REVENUE', 'Sales Revenue', 'Product Sales', 'ACC_000060', 4, True, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000064', '1513', 'Other Revenue', 'REVENUE', 'Sales Revenue', 'Other Revenue', 'ACC_000059', 3, False, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000065', '1514', 'License Revenue', 'REVENUE', 'Sales Revenue', 'Other Revenue', 'ACC_000064', 4, True, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+    Account('ACC_000066', '1515', 'Interest Income', 'REVENUE', 'Sales Revenue', 'Other Revenue', 'ACC_000064', 4, True, 'CREDIT', True, 'REVENUE', _CREATED_DATE),
+
+    # EXPENSES (5000-9999)
+    Account('ACC_000067', '1516', 'EXPENSES', 'EXPENSES', 'EXPENSES', '', '', 1, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000068', '1616', 'Cost of Sales', 'EXPENSES', 'Cost of Sales', '', 'ACC_000067', 2, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000069', '1626', 'Direct Costs', 'EXPENSES', 'Cost of Sales', 'Direct Costs', 'ACC_000068', 3, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000070', '1627', 'Cost of Goods Sold', 'EXPENSES', 'Cost of Sales', 'Direct Costs', 'ACC_000069', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000071', '1628', 'Purchase Discounts', 'EXPENSES', 'Cost of Sales', 'Direct Costs', 'ACC_000069', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000072', '1629', 'Operating Expenses', 'EXPENSES', 'Operating Expenses', '', 'ACC_000067', 2, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000073', '1639', 'Personnel', 'EXPENSES', 'Operating Expenses', 'Personnel', 'ACC_000072', 3, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000074', '1640', 'Salaries', 'EXPENSES', 'Operating Expenses', 'Personnel', 'ACC_000073', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000075', '1641', 'Social Security', 'EXPENSES', 'Operating Expenses', 'Personnel', 'ACC_000073', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000076', '1642', 'Pension Costs', 'EXPENSES', 'Operating Expenses', 'Personnel', 'ACC_000073', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000077', '1643', 'Facilities', 'EXPENSES', 'Operating Expenses', 'Facilities', 'ACC_000072', 3, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000078', '1644', 'Rent', 'EXPENSES', 'Operating Expenses', 'Facilities', 'ACC_000077', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000079', '1645', 'Utilities', 'EXPENSES', 'Operating Expenses', 'Facilities', 'ACC_000077', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000080', '1646', 'Insurance', 'EXPENSES', 'Operating Expenses', 'Facilities', 'ACC_000077', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000081', '1647', 'Marketing', 'EXPENSES', 'Operating Expenses', 'Marketing', 'ACC_000072', 3, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000082', '1648', 'Advertising', 'EXPENSES', 'Operating Expenses', 'Marketing', 'ACC_000081', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000083', '1649', 'Promotions', 'EXPENSES', 'Operating Expenses', 'Marketing', 'ACC_000081', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000084', '1650', 'Trade Shows', 'EXPENSES', 'Operating Expenses', 'Marketing', 'ACC_000081', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000085', '1651', 'General', 'EXPENSES', 'Operating Expenses', 'General', 'ACC_000072', 3, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000086', '1652', 'Professional Services', 'EXPENSES', 'Operating Expenses', 'General', 'ACC_000085', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000087', '1653', 'IT Costs', 'EXPENSES', 'Operating Expenses', 'General', 'ACC_000085', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000088', '1654', 'Travel', 'EXPENSES', 'Operating Expenses', 'General', 'ACC_000085', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000089', '1655', 'Financial', 'EXPENSES', 'Financial', '', 'ACC_000067', 2, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000090', '1665', 'Finance Costs', 'EXPENSES', 'Financial', 'Finance Costs', 'ACC_000089', 3, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000091', '1666', 'Interest Expense', 'EXPENSES', 'Financial', 'Finance Costs', 'ACC_000090', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000092', '1667', 'Bank Charges', 'EXPENSES', 'Financial', 'Finance Costs', 'ACC_000090', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000093', '1668', 'FX Losses', 'EXPENSES', 'Financial', 'Finance Costs', 'ACC_000090', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000094', '1669', 'Tax', 'EXPENSES', 'Tax', '', 'ACC_000067', 2, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000095', '1679', 'Income Tax', 'EXPENSES', 'Tax', 'Income Tax', 'ACC_000094', 3, False, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000096', '1680', 'Current Tax', 'EXPENSES', 'Tax', 'Income Tax', 'ACC_000095', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+    Account('ACC_000097', '1681', 'Deferred Tax', 'EXPENSES', 'Tax', 'Income Tax', 'ACC_000095', 4, True, 'DEBIT', True, 'EXPENSES', _CREATED_DATE),
+)
+
+# Read-only lookup by account_id
+CHART_BY_ID = MappingProxyType({a.account_id: a for a in CHART_OF_ACCOUNTS})
@@ -19,24 +19,546 @@ Author: EuroStyle Fashion Data Team
 Date: 2024-10-10
 """
 
+import argparse
 import csv
+import gzip
+import io
+import itertools
 import random
 import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from datetime import datetime, date, timedelta
-from decimal import Decimal, ROUND_HALF_UP
 import os
 import sys
-from typing import Dict, List, Tuple, Optional
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
 import json
 
+import numpy as np
+
+# Parquet output is optional (--format parquet)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from finance_chart_of_accounts import Account, CHART_OF_ACCOUNTS, CHART_BY_ID
+
+# Amounts are computed as floats and only formatted to 2 decimals when stored
+_ONE_HUNDRED = '100.00'
+_ZERO_AMOUNT = '0.00'
+_UNIT_RATE = '1.000000'
+_MAX_DEPRECIATION_RATIO = 0.95
+_SALVAGE_RATIO = 0.05
+
+# Output to data/csv directory
+OUTPUT_DIR = Path("data/csv")
+
+# gzip level for output files (1 is several times faster for dev runs)
+DEFAULT_COMPRESS_LEVEL = 6
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Supported output formats; Parquet files are Snappy-compressed and written in row batches
+OUTPUT_FORMATS = ('csv', 'parquet')
+PARQUET_BATCH_SIZE = 100_000
+
+# Parquet column types as (pyarrow type factory, args), keyed by column name;
+# columns not listed are strings. Amounts, rates and dates are generated as
+# strings (money() output, ISO dates) and cast to these types per batch
+_AMOUNT = ('decimal128', 18, 2)
+_DATE = ('date32',)
+PARQUET_COLUMN_TYPES = {
+    **dict.fromkeys([
+        'period_year', 'period_month', 'fiscal_year', 'account_level',
+        'decimal_places', 'useful_life_years', 'line_number'
+    ], ('int64',)),
+    **dict.fromkeys(['is_active', 'is_leaf_account', 'is_posted', 'is_adjustment_period'], ('bool_',)),
+    **dict.fromkeys([
+        'budget_amount', 'depreciation_amount', 'accumulated_depreciation', 'book_value',
+        'purchase_cost', 'salvage_value', 'total_debit', 'total_credit', 'debit_amount',
+        'credit_amount', 'transaction_amount', 'ownership_percentage'
+    ], _AMOUNT),
+    'exchange_rate': ('decimal128', 18, 6),
+    **dict.fromkeys([
+        'approval_date', 'depreciation_date', 'effective_date', 'effective_from', 'effective_to',
+        'purchase_date', 'warranty_expiry', 'disposal_date', 'journal_date', 'posting_date',
+        'incorporation_date', 'period_start_date', 'period_end_date'
+    ], _DATE),
+    **dict.fromkeys(['created_date', 'posted_date'], ('timestamp', 's')),
+}
+
+# Shared values repeated across generated rows
+_CREATED_DATE = sys.intern('2024-01-01 00:00:00')
+_SYSTEM = sys.intern('SYSTEM')
+_POSTED = sys.intern('POSTED')
+
+# Cost center (type, name, PROFIT/COST classification) created for every entity
+COST_CENTER_TYPES = {
+    'SALES': ['Retail Stores', 'Online Sales', 'Wholesale'],
+    'MARKETING': ['Digital Marketing', 'Traditional Advertising', 'Events'],
+    'OPERATIONS': ['Warehousing', 'Logistics', 'Customer Service'],
+    'ADMIN': ['Finance', 'HR', 'IT', 'Legal'],
+    'MANAGEMENT': ['Executive', 'Strategy']
+}
+COST_CENTER_PAIRS = [
+    (cc_type, cc_name, 'PROFIT' if cc_type == 'SALES' else 'COST')
+    for cc_type, cc_names in COST_CENTER_TYPES.items()
+    for cc_name in cc_names
+]
+
+# Pre-formatted ID pools for randomly assigned references
+COST_CENTER_ID_POOL = [f"CC_{i:06d}" for i in range(1, 76)]
+DEPARTMENT_ID_POOL = [f"DEPT_{i:03d}" for i in range(1, 21)]
+SUPPLIER_NAME_POOL = [f"Supplier {i:02d}" for i in range(1, 21)]
+
+# Column order for tables whose rows are generated as plain tuples
+EXCHANGE_RATE_FIELDS = [
+    'exchange_rate_id', 'effective_date', 'base_currency', 'target_currency',
+    'exchange_rate', 'rate_type', 'data_source', 'created_date'
+]
+GL_JOURNAL_LINE_FIELDS = [
+    'journal_line_id', 'journal_header_id', 'line_id', 'journal_id', 'line_number', 'entity_id',
+    'account_id', 'cost_center_id', 'debit_amount', 'credit_amount', 'currency_code',
+    'functional_currency', 'transaction_currency', 'transaction_amount', 'exchange_rate',
+    'line_description', 'reference_1', 'reference_2', 'cost_center', 'project_id',
+    'customer_id', 'vendor_id', 'created_date'
+]
+BUDGET_DATA_FIELDS = [
+    'budget_line_id', 'budget_version_id', 'entity_id', 'account_id', 'cost_center_id',
+    'period_year', 'period_month', 'budget_amount', 'currency_code', 'functional_currency',
+    'budget_type', 'scenario', 'cost_center', 'project_id', 'department_id', 'comments',
+    'created_by', 'created_date'
+]
+DEPRECIATION_FIELDS = [
+    'depreciation_id', 'asset_id', 'period_id', 'depreciation_date', 'depreciation_amount',
+    'accumulated_depreciation', 'book_value', 'is_posted', 'journal_header_id', 'created_date'
+]
+
+
+class JournalHeader(NamedTuple):
+    """GL journal header (field order matches the CSV schema)."""
+    journal_header_id: str
+    journal_id: str
+    entity_id: str
+    period_id: str
+    journal_number: str
+    journal_date: str
+    posting_date: str
+    period_year: int
+    period_month: int
+    journal_type: str
+    journal_source: str
+    description: str
+    reference_number: str
+    currency_code: str
+    total_debit: str
+    total_credit: str
+    functional_currency: str
+    journal_status: str
+    created_by: str
+    created_date: str
+    posted_by: str
+    posted_date: str
+    approved_by: str
+
+
+class FixedAsset(NamedTuple):
+    """Fixed asset register entry (field order matches the CSV schema)."""
+    asset_id: str
+    asset_code: str
+    asset_name: str
+    entity_id: str
+    asset_category: str
+    cost_center_id: str
+    purchase_date: str
+    purchase_cost: str
+    currency_code: str
+    useful_life_years: int
+    depreciation_method: str
+    salvage_value: str
+    accumulated_depreciation: str
+    book_value: str
+    asset_location: str
+    serial_number: str
+    supplier_name: str
+    warranty_expiry: str
+    asset_status: str
+    disposal_date: Optional[str]
+    created_date: str
+
+
+
+def write_compressed_csv(output_dir: Path, filename: str, data: Iterable, fieldnames: Optional[List[str]] = None,
+                         compress_level: int = DEFAULT_COMPRESS_LEVEL) -> Optional[Dict]:
+    """Stream records into a gzip-compressed CSV file and return its size info.
+    
+    ``data`` may be a list or any iterator of records; rows are consumed one
+    at a time. Kept at module level so it can run in a worker process.
+    Returns None when there is no data to write.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        return None
+    
+    # Tuple records (including the named tuple records) are written positionally in field order
+    records_are_tuples = isinstance(first, tuple)
+    
+    if fieldnames is None:
+        fieldnames = _record_fieldnames(filename, first)
+    
+    # Count rows as they pass through; zip stops before advancing the counter
+    counter = itertools.count()
+    rows = (row for row, _ in zip(itertools.chain([first], rows), counter))
+    
+    # Write the CSV straight into gzip in one pass, with a large buffer on the raw file
+    compressed_filepath = output_dir / (filename + '.gz')
+    
+    with open(compressed_filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as raw_file, \
+            gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=compress_level) as gz_file, \
+            io.TextIOWrapper(gz_file, encoding='utf-8', newline='') as csvfile:
+        if records_are_tuples:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+        else:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+    
+    return {
+        'records': next(counter),
+        'original_size': _gzip_uncompressed_size(compressed_filepath),
+        'size': os.path.getsize(compressed_filepath),
+        'path': str(compressed_filepath)
+    }
+
+
+def _parquet_schema(fieldnames: List[str]):
+    """Build the Parquet schema for a file's columns from PARQUET_COLUMN_TYPES."""
+    fields = []
+    for name in fieldnames:
+        factory, *args = PARQUET_COLUMN_TYPES.get(name, ('string',))
+        fields.append((name, getattr(pa, factory)(*args)))
+    return pa.schema(fields)
+
+
+def _parquet_column(values: List, field):
+    """Convert one batch column to an array of the field's type.
+    
+    Decimal, date and timestamp columns hold strings and are parsed by a
+    pyarrow cast; '' (written as an empty CSV field) becomes null.
+    """
+    if pa.types.is_decimal(field.type) or pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+        return pa.array([None if value == '' else value for value in values], type=pa.string()).cast(field.type)
+    return pa.array(values, type=field.type)
+
+
+def write_parquet(output_dir: Path, filename: str, data: Iterable,
+                  fieldnames: Optional[List[str]] = None) -> Optional[Dict]:
+    """Write records to a Snappy-compressed Parquet file and return its size info.
+    
+    Accepts the same records as write_compressed_csv. Rows are converted to
+    columns one batch at a time, so row streams are never fully materialized.
+    Every batch is converted to the file's schema from PARQUET_COLUMN_TYPES,
+    so amounts are decimals and dates are dates, and a column that is all
+    None keeps its declared type. Requires pyarrow.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        return None
+    
+    if fieldnames is None:
+        fieldnames = _record_fieldnames(filename, first)
+    
+    # Bring every record into field-ordered tuples
+    rows = itertools.chain([first], rows)
+    if not isinstance(first, tuple):
+        rows = map(itemgetter(*fieldnames), rows)
+    
+    parquet_filepath = output_dir / (filename.removesuffix('.csv') + '.parquet')
+    schema = _parquet_schema(fieldnames)
+    records = 0
+    original_size = 0
+    
+    with pq.ParquetWriter(parquet_filepath, schema, compression='snappy', use_dictionary=True) as writer:
+        while batch := list(itertools.islice(rows, PARQUET_BATCH_SIZE)):
+            table = pa.Table.from_arrays(
+                [_parquet_column(list(column), field) for column, field in zip(zip(*batch), schema)],
+                schema=schema
+            )
+            records += len(batch)
+            original_size += table.nbytes
+            writer.write_table(table)
+    
+    return {
+        'records': records,
+        'original_size': original_size,
+        'size': os.path.getsize(parquet_filepath),
+        'path': str(parquet_filepath)
+    }
+
+
+def write_output_file(output_dir: Path, filename: str, data: Iterable, fieldnames: Optional[List[str]] = None,
+                      compress_level: int = DEFAULT_COMPRESS_LEVEL, output_format: str = 'csv') -> Optional[Dict]:
+    """Write records as gzip CSV or Parquet, depending on ``output_format``."""
+    if output_format == 'parquet':
+        return write_parquet(output_dir, filename, data, fieldnames)
+    return write_compressed_csv(output_dir, filename, data, fieldnames, compress_level)
+
+
+def _record_fieldnames(filename: str, first) -> List[str]:
+    """Derive column names from the first record (named tuple fields or dict keys)."""
+    if hasattr(first, '_fields'):
+        return list(first._fields)
+    if isinstance(first, tuple):
+        raise ValueError(f"fieldnames are required for tuple records ({filename})")
+    return list(first.keys())
+
+
+def _gzip_uncompressed_size(path: Path) -> int:
+    """Read the uncompressed size from the gzip trailer (ISIZE, RFC 1952; modulo 2**32)."""
+    with open(path, 'rb') as f:
+        f.seek(-4, os.SEEK_END)
+        return int.from_bytes(f.read(4), 'little')
+
+
+def money(x: float) -> str:
+    """Format an amount as a 2-decimal string for output."""
+    return f"{x:.2f}"
+
+
+def _make_journal_line(journal_header_id: str, journal_id: str, line_number: int, entity_id: str,
+                       account_id: str, cost_center_id: str, debit_amount: str, credit_amount: str,
+                       currency_code: str, transaction_amount: str, line_description: str,
+                       reference_1: str, cost_center: str) -> Tuple:
+    """Build a journal line tuple in GL_JOURNAL_LINE_FIELDS order, minus the line ID columns."""
+    return (
+        journal_header_id, journal_id, line_number, entity_id, account_id, cost_center_id,
+        debit_amount, credit_amount,
+        currency_code, currency_code, currency_code, transaction_amount, _UNIT_RATE,
+        line_description, reference_1, '',
+        cost_center, '', '', '', _CREATED_DATE
+    )
+
+
+def generate_entity_gl_transactions(entity_id: str, entity: Dict, cc_codes: List[str], accounts: Tuple[Account, ...],
+                                    accounts_by_type: Dict[str, List[Account]],
+                                    period_ids: Dict[Tuple[int, int], str],
+                                    journal_counts: Dict[Tuple[int, int], int],
+                                    first_journal_id: int, seed: int) -> Tuple[List[JournalHeader], List[Tuple]]:
+    """Generate GL journal headers and lines for one BV entity.
+    
+    Kept at module level so each entity can run in its own worker process.
+    ``journal_counts`` maps (year, month) to the number of journals, numbered
+    from ``first_journal_id``. ``accounts_by_type`` holds the leaf accounts
+    per account type. Line tuples are in GL_JOURNAL_LINE_FIELDS order
+    without the leading journal_line_id/line_id columns, which the caller
+    numbers across entities.
+    """
+    rnd = random.Random(seed)
+    rng = np.random.default_rng(seed)
+    
+    # Local aliases for the hot loops
+    choice = rnd.choice
+    choices = rnd.choices
+    
+    # Get revenue and expense accounts for realistic transactions
+    revenue_accounts = accounts_by_type['REVENUE']
+    expense_accounts = accounts_by_type['EXPENSES']
+    asset_accounts = accounts_by_type['ASSETS']
+    liability_accounts = accounts_by_type['LIABILITIES']
+    cash_receivable_accounts = [a for a in asset_accounts if 'cash' in a.account_name.lower() or 'receivable' in a.account_name.lower()]
+    
+    # Line pickers return (account, is_debit), or None to skip the line
+    def sales_line(line_num):
+        if line_num == 1:  # Debit cash/receivables
+            return choice(cash_receivable_accounts), True
+        return choice(revenue_accounts), False  # Credit revenue
+    
+    def purchase_line(line_num):
+        if line_num == 1:  # Debit expense/inventory
+            return choice(expense_accounts), True
+        return choice(liability_accounts), False  # Credit cash/payables
+    
+    def random_line(line_num):
+        # Random account selection; non-leaf picks are skipped
+        account = choice(accounts)
+        if not account.is_leaf_account:
+            return None
+        return account, choice((True, False))
+    
+    line_pickers = {'SALES': sales_line, 'PURCHASE': purchase_line}
+    
+    # Amount ranges per transaction type (other types use the default range)
+    amount_ranges = {'SALES': (50, 2000), 'PURCHASE': (100, 5000), 'PAYROLL': (2000, 8000)}
+    default_amount_range = (100, 3000)
+    
+    # Transaction types for journal entries
+    transaction_types = [
+        ('SALES', 'Sales transaction'),
+        ('PURCHASE', 'Purchase transaction'),
+        ('PAYROLL', 'Payroll entry'),
+        ('DEPRECIATION', 'Depreciation entry'),
+        ('BANK', 'Bank transaction'),
+        ('ADJUSTMENT', 'Manual adjustment')
+    ]
+    journal_days = range(1, 29)
+    line_counts = range(2, 7)
+    
+    # (low, high) amount range for each transaction type
+    amount_range_by_type = {
+        trans_type: amount_ranges.get(trans_type, default_amount_range)
+        for trans_type, _ in transaction_types
+    }
+    
+    headers = []
+    lines = []
+    journal_id = first_journal_id
+    entity_currency = entity['functional_currency']
+    entity_cc_codes = cc_codes or ['DEFAULT']
+    
+    for (year, month), num_journals in journal_counts.items():
+        journal_number_prefix = f"{entity['entity_code']}-{year}-"
+        period_id = period_ids[(year, month)]
+        
+        # Draw day, transaction type and line count for the whole month at once
+        days = choices(journal_days, k=num_journals)
+        journal_types = choices(transaction_types, k=num_journals)
+        journal_line_counts = choices(line_counts, k=num_journals)
+        
+        # Batch the per-line draws: each journal gets one slot per line plus one
+        # for a balancing line, and amounts are scaled to its type's range at once
+        slot_counts = [num_lines + 1 for num_lines in journal_line_counts]
+        max_lines = sum(slot_counts)
+        slot_ranges = np.repeat(
+            np.array([amount_range_by_type[trans_type] for trans_type, _ in journal_types], dtype=float),
+            slot_counts, axis=0
+        )
+        amount_draws = np.round(
+            slot_ranges[:, 0] + rng.random(max_lines) * (slot_ranges[:, 1] - slot_ranges[:, 0]), 2
+        ).tolist()
+        cc_id_draws = rng.integers(0, len(COST_CENTER_ID_POOL), size=max_lines).tolist()
+        cc_code_draws = rng.integers(0, len(entity_cc_codes), size=max_lines).tolist()
+        first_slot = 0
+        
+        for day, (trans_type, description), num_lines in zip(days, journal_types, journal_line_counts):
+            journal_date = date(year, month, day)
+            
+            # Journal IDs are formatted once and shared by the header and its lines
+            current_journal_id = f"JE_{journal_id:08d}"
+            journal_header_id = f"JH_{journal_id:08d}"
+            reference_number = f"REF-{journal_id:06d}"
+            journal_date_str = journal_date.strftime('%Y-%m-%d')
+            
+            # Generate journal lines (2-6 lines per journal)
+            journal_lines = []
+            total_debit = 0.0
+            total_credit = 0.0
+            
+            # Resolve account selection once per journal
+            pick_line = line_pickers.get(trans_type, random_line)
+            
+            for line_num in range(1, num_lines + 1):
+                # Select accounts based on transaction type
+                picked = pick_line(line_num)
+                if picked is None:
+                    continue
+                account, is_debit = picked
+                
+                # Realistic amounts are pre-drawn for this line's slot
+                slot = first_slot + line_num - 1
+                amount = amount_draws[slot]
+                amount_str = money(amount)
+                
+                if is_debit:
+                    total_debit += amount
+                else:
+                    total_credit += amount
+                
+                # Get random cost center for this entity
+                cost_center = entity_cc_codes[cc_code_draws[slot]]
+                
+                journal_lines.append(_make_journal_line(
+                    journal_header_id, current_journal_id, line_num, entity_id, account.account_id,
+                    COST_CENTER_ID_POOL[cc_id_draws[slot]],
+                    amount_str if is_debit else _ZERO_AMOUNT,
+                    _ZERO_AMOUNT if is_debit else amount_str,
+                    entity_currency, amount_str,
+                    f"Line {line_num} - {description}", f"{reference_number}-{line_num}", cost_center
+                ))
+            
+            # Balance the journal entry if needed
+            balance_amount = round(abs(total_debit - total_credit), 2)
+            if balance_amount:
+                balance_str = money(balance_amount)
+                if total_debit > total_credit:
+                    # Add credit line
+                    account = choice(liability_accounts)
+                    debit_str, credit_str = _ZERO_AMOUNT, balance_str
+                    total_credit += balance_amount
+                else:
+                    # Add debit line
+                    account = choice(asset_accounts)
+                    debit_str, credit_str = balance_str, _ZERO_AMOUNT
+                    total_debit += balance_amount
+                
+                journal_lines.append(_make_journal_line(
+                    journal_header_id, current_journal_id, len(journal_lines) + 1, entity_id, account.account_id,
+                    COST_CENTER_ID_POOL[cc_id_draws[first_slot + num_lines]],
+                    debit_str, credit_str,
+                    entity_currency, balance_str,
+                    "Balancing entry", f"{reference_number}-BAL", cost_center
+                ))
+            
+            first_slot += num_lines + 1
+            
+            # Journal header, built once the totals are known
+            headers.append(JournalHeader(
+                journal_header_id=journal_header_id,  # Fixed: add missing journal_header_id
+                journal_id=current_journal_id,
+                entity_id=entity_id,
+                period_id=period_id,  # Fixed: add missing period_id
+                journal_number=f"{journal_number_prefix}{journal_id:06d}",
+                journal_date=journal_date_str,
+                posting_date=journal_date_str,
+                period_year=year,
+                period_month=month,
+                journal_type='STANDARD',
+                journal_source=trans_type,
+                description=description,
+                reference_number=reference_number,  # Fixed: correct field name
+                currency_code=entity_currency,  # Fixed: add missing currency_code
+                total_debit=money(total_debit),
+                total_credit=money(total_credit),
+                functional_currency=entity_currency,
+                journal_status=_POSTED,
+                created_by=_SYSTEM,
+                created_date=_CREATED_DATE,
+                posted_by=_SYSTEM,
+                posted_date=_CREATED_DATE,
+                approved_by=_SYSTEM  # Fixed: add missing approved_by
+            ))
+            lines.extend(journal_lines)
+            
+            journal_id += 1
+    
+    return headers, lines
+
 
 class EuroStyleFinanceGenerator:
     """Generates comprehensive finance data for EuroStyle Fashion multi-country structure."""
     
-    def __init__(self):
-        """Initialize the finance data generator."""
+    def __init__(self, output_format: str = 'csv', seed: Optional[int] = None):
+        """Initialize the finance data generator (pass a seed for reproducible output)."""
         print("🏦 Initializing EuroStyle Fashion Finance Data Generator...")
         
         # Configuration
@@ -44,16 +566,34 @@ class EuroStyleFinanceGenerator:
         self.num_years = 2  # 2023-2024
         self.reporting_currency = 'EUR'
         
+        # Random state is seeded once here: scalar draws use self.random, the
+        # vectorized draws for the high-volume generators use self.rng
+        self.random = random.Random(seed)
+        self.rng = np.random.default_rng(seed)
+        
+        # Period IDs shared by reporting periods and GL journals, keyed by (year, month)
+        self._period_id_cache = {
+            (year, month): sys.intern(f"{year}_{month:02d}")
+            for year in range(self.base_year, self.base_year + self.num_years + 1)
+            for month in range(1, 13)
+        }
+        
         # File paths  
-        self.output_dir = "data/csv"  # Output to data/csv directory
+        self.output_dir = OUTPUT_DIR
+        self.compress_level = DEFAULT_COMPRESS_LEVEL
+        self.output_format = output_format
         self.csv_files = {}
         
         # Data containers
         self.entities = {}
+        self._bv_entities = []
         self.accounts = {}
+        self._accounts_by_type = {}
         self.currencies = {}
         self.exchange_rates = {}
         self.cost_centers = {}
+        self.cost_centers_by_entity = {}
+        self.cc_codes_by_entity = {}
         self.periods = {}
         
         # External data references (loaded from other systems)
@@ -80,34 +620,24 @@ class EuroStyleFinanceGenerator:
         """Load existing data from operational systems for referential integrity."""
         print("\n📊 Loading external data for referential integrity...")
         
+        # Operational extracts to load, keyed by the attribute they populate
+        external_files = {
+            'customers': "eurostyle_operational.customers.csv",
+            'orders': "eurostyle_operational.orders.csv",
+            'campaigns': "eurostyle_operational.campaigns.csv",
+            'stores': "eurostyle_operational.stores.csv"
+        }
+        
         try:
-            # Load customer data
-            if os.path.exists("eurostyle_operational.customers.csv"):
-                with open("eurostyle_operational.customers.csv", 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.customers = list(reader)
-                print(f"Loaded {len(self.customers):,} customers")
-            
-            # Load order data
-            if os.path.exists("eurostyle_operational.orders.csv"):
-                with open("eurostyle_operational.orders.csv", 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.orders = list(reader)
-                print(f"Loaded {len(self.orders):,} orders")
-            
-            # Load campaign data
-            if os.path.exists("eurostyle_operational.campaigns.csv"):
-                with open("eurostyle_operational.campaigns.csv", 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.campaigns = list(reader)
-                print(f"Loaded {len(self.campaigns):,} campaigns")
+            # One directory scan instead of an exists() check per file
+            present = {entry.name for entry in os.scandir('.') if entry.is_file()}
             
-            # Load store data
-            if os.path.exists("eurostyle_operational.stores.csv"):
-                with open("eurostyle_operational.stores.csv", 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.stores = list(reader)
-                print(f"Loaded {len(self.stores):,} stores")
+            for attribute, filename in external_files.items():
+                if filename in present:
+                    with open(filename, 'r', encoding='utf-8') as f:
+                        reader = csv.DictReader(f)
+                        setattr(self, attribute, list(reader))
+                    print(f"Loaded {len(getattr(self, attribute)):,} {attribute}")
                 
         except Exception as e:
             print(f"⚠️ Could not load all external data: {e}")
@@ -135,7 +665,7 @@ class EuroStyleFinanceGenerator:
             'fiscal_year_end': self.fiscal_year_end,
             'legal_address': 'Herengracht 123, 1015 BD Amsterdam, Netherlands',
             'is_active': True,
-            'created_date': '2024-01-01 00:00:00'
+            'created_date': _CREATED_DATE
         })
         
         # 2. Operating BV entities - EuroStyle countries: DE, FR, BE, LU
@@ -174,15 +704,16 @@ class EuroStyleFinanceGenerator:
                 'tax_id': bv['tax_id'],
                 'functional_currency': self.countries[bv['country']]['currency'],
                 'parent_entity_id': holding_id,
-                'incorporation_date': f"2016-0{random.randint(3, 8)}-{random.randint(10, 28)}",
+                'incorporation_date': f"2016-0{self.random.randint(3, 8)}-{self.random.randint(10, 28)}",
                 'fiscal_year_end': self.fiscal_year_end,
                 'legal_address': bv['address'],
                 'is_active': True,
-                'created_date': '2024-01-01 00:00:00'
+                'created_date': _CREATED_DATE
             })
         
         # Store for later reference
         self.entities = {e['entity_id']: e for e in entities}
+        self._bv_entities = [e for e in entities if e['entity_type'] == 'BV']  # Operating entities only
         
         print(f"Generated {len(entities)} legal entities (1 holding + {len(entities)-1} BVs)")
         return entities
@@ -195,224 +726,55 @@ class EuroStyleFinanceGenerator:
         holding_id = "ENTITY_NL_HOLDING"
         
         # Holding owns 100% of all BVs
-        for entity_id, entity in self.entities.items():
-            if entity['entity_type'] == 'BV':
-                relationships.append({
-                    'relationship_id': f"REL_{entity_id}",
-                    'parent_entity_id': holding_id,
-                    'child_entity_id': entity_id,
-                    'ownership_percentage': Decimal('100.00'),
-                    'consolidation_method': 'FULL',
-                    'effective_from': '2016-01-01',
-                    'effective_to': '',
-                    'created_date': '2024-01-01 00:00:00'
-                })
+        for entity in self._bv_entities:
+            relationships.append({
+                'relationship_id': f"REL_{entity['entity_id']}",
+                'parent_entity_id': holding_id,
+                'child_entity_id': entity['entity_id'],
+                'ownership_percentage': _ONE_HUNDRED,
+                'consolidation_method': 'FULL',
+                'effective_from': '2016-01-01',
+                'effective_to': '',
+                'created_date': _CREATED_DATE
+            })
         
         print(f"Generated {len(relationships)} ownership relationships")
         return relationships
     
-    def generate_chart_of_accounts(self) -> List[Dict]:
+    def generate_chart_of_accounts(self) -> Tuple[Account, ...]:
         """Generate comprehensive chart of accounts following IFRS."""
         print("📈 Generating chart of accounts...")
         
-        accounts = []
-        
-        # IFRS-compliant chart of accounts structure
-        account_structure = {
-            # ASSETS (1000-1999)
-            'ASSETS': {
-                'range': (1000, 1999),
-                'normal_balance': 'DEBIT',
-                'categories': {
-                    'Current Assets': {
-                        'Cash and Cash Equivalents': ['Cash', 'Bank Current Account', 'Short-term Deposits'],
-                        'Trade Receivables': ['Accounts Receivable', 'Allowance for Doubtful Accounts'],
-                        'Inventory': ['Raw Materials', 'Finished Goods', 'Inventory Provision'],
-                        'Other Current Assets': ['Prepaid Expenses', 'VAT Receivable', 'Other Receivables']
-                    },
-                    'Non-current Assets': {
-                        'Property, Plant & Equipment': ['Land & Buildings', 'Equipment', 'Accumulated Depreciation'],
-                        'Intangible Assets': ['Software', 'Trademarks', 'Goodwill'],
-                        'Financial Assets': ['Long-term Investments', 'Deferred Tax Assets']
-                    }
-                }
-            },
-            
-            # LIABILITIES (2000-2999)
-            'LIABILITIES': {
-                'range': (2000, 2999),
-                'normal_balance': 'CREDIT',
-                'categories': {
-                    'Current Liabilities': {
-                        'Trade Payables': ['Accounts Payable', 'Accrued Expenses'],
-                        'Tax Liabilities': ['VAT Payable', 'Income Tax Payable', 'Payroll Tax Payable'],
-                        'Other Current Liabilities': ['Short-term Debt', 'Customer Deposits']
-                    },
-                    'Non-current Liabilities': {
-                        'Long-term Debt': ['Long-term Loans', 'Bonds Payable'],
-                        'Provisions': ['Warranty Provisions', 'Restructuring Provisions']
-                    }
-                }
-            },
-            
-            # EQUITY (3000-3999)
-            'EQUITY': {
-                'range': (3000, 3999),
-                'normal_balance': 'CREDIT',
-                'categories': {
-                    'Share Capital': {
-                        'Capital': ['Share Capital', 'Share Premium'],
-                        'Reserves': ['Legal Reserves', 'Retained Earnings', 'Currency Translation Reserve']
-                    }
-                }
-            },
-            
-            # REVENUE (4000-4999)
-            'REVENUE': {
-                'range': (4000, 4999),
-                'normal_balance': 'CREDIT',
-                'categories': {
-                    'Sales Revenue': {
-                        'Product Sales': ['Retail Sales', 'Wholesale Sales', 'Online Sales'],
-                        'Other Revenue': ['License Revenue', 'Interest Income']
-                    }
-                }
-            },
-            
-            # EXPENSES (5000-9999)
-            'EXPENSES': {
-                'range': (5000, 9999),
-                'normal_balance': 'DEBIT',
-                'categories': {
-                    'Cost of Sales': {
-                        'Direct Costs': ['Cost of Goods Sold', 'Purchase Discounts']
-                    },
-                    'Operating Expenses': {
-                        'Personnel': ['Salaries', 'Social Security', 'Pension Costs'],
-                        'Facilities': ['Rent', 'Utilities', 'Insurance'],
-                        'Marketing': ['Advertising', 'Promotions', 'Trade Shows'],
-                        'General': ['Professional Services', 'IT Costs', 'Travel']
-                    },
-                    'Financial': {
-                        'Finance Costs': ['Interest Expense', 'Bank Charges', 'FX Losses']
-                    },
-                    'Tax': {
-                        'Income Tax': ['Current Tax', 'Deferred Tax']
-                    }
-                }
-            }
-        }
-        
-        account_id = 1
-        account_code = 1000
-        
-        for account_type, type_info in account_structure.items():
-            # Create parent account for each type
-            parent_account_id = f"ACC_{account_id:06d}"
-            accounts.append({
-                'account_id': parent_account_id,
-                'account_code': str(account_code),
-                'account_name': account_type,
-                'account_type': account_type,
-                'account_category': account_type,
-                'account_subcategory': '',
-                'parent_account_id': '',
-                'account_level': 1,
-                'is_leaf_account': False,
-                'normal_balance': type_info['normal_balance'],
-                'is_active': True,
-                'consolidation_account': account_type,
-                'created_date': '2024-01-01 00:00:00'
-            })
-            
-            account_id += 1
-            account_code += 100
-            
-            # Create category and subcategory accounts
-            for category, subcategories in type_info['categories'].items():
-                category_account_id = f"ACC_{account_id:06d}"
-                accounts.append({
-                    'account_id': category_account_id,
-                    'account_code': str(account_code),
-                    'account_name': category,
-                    'account_type': account_type,
-                    'account_category': category,
-                    'account_subcategory': '',
-                    'parent_account_id': parent_account_id,
-                    'account_level': 2,
-                    'is_leaf_account': False,
-                    'normal_balance': type_info['normal_balance'],
-                    'is_active': True,
-                    'consolidation_account': account_type,
-                    'created_date': '2024-01-01 00:00:00'
-                })
-                
-                account_id += 1
-                account_code += 10
-                
-                for subcategory, account_names in subcategories.items():
-                    subcategory_account_id = f"ACC_{account_id:06d}"
-                    accounts.append({
-                        'account_id': subcategory_account_id,
-                        'account_code': str(account_code),
-                        'account_name': subcategory,
-                        'account_type': account_type,
-                        'account_category': category,
-                        'account_subcategory': subcategory,
-                        'parent_account_id': category_account_id,
-                        'account_level': 3,
-                        'is_leaf_account': False,
-                        'normal_balance': type_info['normal_balance'],
-                        'is_active': True,
-                        'consolidation_account': account_type,
-                        'created_date': '2024-01-01 00:00:00'
-                    })
-                    
-                    account_id += 1
-                    account_code += 1
-                    
-                    # Create leaf accounts
-                    for account_name in account_names:
-                        leaf_account_id = f"ACC_{account_id:06d}"
-                        accounts.append({
-                            'account_id': leaf_account_id,
-                            'account_code': str(account_code),
-                            'account_name': account_name,
-                            'account_type': account_type,
-                            'account_category': category,
-                            'account_subcategory': subcategory,
-                            'parent_account_id': subcategory_account_id,
-                            'account_level': 4,
-                            'is_leaf_account': True,
-                            'normal_balance': type_info['normal_balance'],
-                            'is_active': True,
-                            'consolidation_account': account_type,
-                            'created_date': '2024-01-01 00:00:00'
-                        })
-                        
-                        account_id += 1
-                        account_code += 1
+        # The chart is static and precomputed in finance_chart_of_accounts
+        accounts = CHART_OF_ACCOUNTS
         
         # Store for later reference
-        self.accounts = {a['account_id']: a for a in accounts}
+        self.accounts = CHART_BY_ID
+        
+        # Immutable sequence for random sampling in the GL hot path, and the
+        # leaf accounts grouped by account type in a single pass
+        self._accounts_seq = accounts
+        self._accounts_by_type = defaultdict(list)
+        for account in accounts:
+            if account.is_leaf_account:
+                self._accounts_by_type[account.account_type].append(account)
         
         print(f"Generated {len(accounts)} chart of accounts entries")
         return accounts
     
-    def generate_currencies_and_rates(self) -> Tuple[List[Dict], List[Dict]]:
+    def generate_currencies_and_rates(self) -> Tuple[List[Dict], List[Tuple]]:
         """Generate currencies and exchange rates."""
         print("💱 Generating currencies and exchange rates...")
         
         # Currencies
         currencies = [
-            {'currency_code': 'EUR', 'currency_name': 'Euro', 'currency_symbol': '€', 'decimal_places': 2, 'is_active': True, 'created_date': '2024-01-01 00:00:00'},
-            {'currency_code': 'USD', 'currency_name': 'US Dollar', 'currency_symbol': '$', 'decimal_places': 2, 'is_active': True, 'created_date': '2024-01-01 00:00:00'},
-            {'currency_code': 'GBP', 'currency_name': 'British Pound', 'currency_symbol': '£', 'decimal_places': 2, 'is_active': True, 'created_date': '2024-01-01 00:00:00'},
-            {'currency_code': 'CHF', 'currency_name': 'Swiss Franc', 'currency_symbol': 'CHF', 'decimal_places': 2, 'is_active': True, 'created_date': '2024-01-01 00:00:00'}
+            {'currency_code': 'EUR', 'currency_name': 'Euro', 'currency_symbol': '€', 'decimal_places': 2, 'is_active': True, 'created_date': _CREATED_DATE},
+            {'currency_code': 'USD', 'currency_name': 'US Dollar', 'currency_symbol': '$', 'decimal_places': 2, 'is_active': True, 'created_date': _CREATED_DATE},
+            {'currency_code': 'GBP', 'currency_name': 'British Pound', 'currency_symbol': '£', 'decimal_places': 2, 'is_active': True, 'created_date': _CREATED_DATE},
+            {'currency_code': 'CHF', 'currency_name': 'Swiss Franc', 'currency_symbol': 'CHF', 'decimal_places': 2, 'is_active': True, 'created_date': _CREATED_DATE}
         ]
         
         # Exchange rates (daily for 2 years)
-        exchange_rates = []
         base_rates = {
             ('EUR', 'USD'): 1.1000,
             ('EUR', 'GBP'): 0.8500,
@@ -424,30 +786,43 @@ class EuroStyleFinanceGenerator:
         
         start_date = date(self.base_year, 1, 1)
         end_date = date(self.base_year + self.num_years, 12, 31)
-        current_date = start_date
+        num_days = (end_date - start_date).days + 1
+        rate_types = ['SPOT', 'CLOSING']
+        
+        # Build the pre-sized rate columns first, then zip them into rows (see EXCHANGE_RATE_FIELDS)
+        num_rates = num_days * len(base_rates) * len(rate_types)
+        effective_dates = [None] * num_rates
+        base_currencies = [None] * num_rates
+        target_currencies = [None] * num_rates
+        rates = [None] * num_rates
         
-        rate_id = 1
+        uniform = self.random.uniform
         
-        while current_date <= end_date:
+        idx = 0
+        for day_offset in range(num_days):
+            effective_date = (start_date + timedelta(days=day_offset)).strftime('%Y-%m-%d')
             for (from_curr, to_curr), base_rate in base_rates.items():
                 # Add some realistic volatility (±2%)
-                volatility = random.uniform(-0.02, 0.02)
-                rate = base_rate * (1 + volatility)
+                volatility = uniform(-0.02, 0.02)
+                rate = f"{base_rate * (1 + volatility):.6f}"
                 
-                for rate_type in ['SPOT', 'CLOSING']:
-                    exchange_rates.append({
-                        'exchange_rate_id': f"EXR_{rate_id:08d}",  # Fixed: add missing exchange_rate_id
-                        'effective_date': current_date.strftime('%Y-%m-%d'),
-                        'base_currency': from_curr,  # Fixed: correct field name
-                        'target_currency': to_curr,  # Fixed: correct field name
-                        'exchange_rate': round(Decimal(str(rate)), 6),
-                        'rate_type': rate_type,
-                        'data_source': 'ECB',  # Fixed: correct field name
-                        'created_date': '2024-01-01 00:00:00'
-                    })
-                    rate_id += 1
-            
-            current_date += timedelta(days=1)
+                for _ in rate_types:
+                    effective_dates[idx] = effective_date
+                    base_currencies[idx] = from_curr
+                    target_currencies[idx] = to_curr
+                    rates[idx] = rate
+                    idx += 1
+        
+        exchange_rates = list(zip(
+            [f"EXR_{rate_id:08d}" for rate_id in range(1, num_rates + 1)],
+            effective_dates,
+            base_currencies,
+            target_currencies,
+            rates,
+            rate_types * (num_rates // len(rate_types)),
+            ['ECB'] * num_rates,
+            [_CREATED_DATE] * num_rates
+        ))
         
         self.currencies = {c['currency_code']: c for c in currencies}
         
@@ -462,7 +837,7 @@ class EuroStyleFinanceGenerator:
         
         for year in range(self.base_year, self.base_year + self.num_years + 1):
             for month in range(1, 13):
-                period_id = f"{year}_{month:02d}"
+                period_id = self._period_id_cache[(year, month)]
                 
                 # Calculate period dates
                 period_start = date(year, month, 1)
@@ -481,7 +856,7 @@ class EuroStyleFinanceGenerator:
                     'period_end_date': period_end.strftime('%Y-%m-%d'),
                     'is_adjustment_period': False,
                     'period_status': 'CLOSED' if year < 2024 else 'OPEN',
-                    'created_date': '2024-01-01 00:00:00'
+                    'created_date': _CREATED_DATE
                 })
         
         # Add adjustment periods for year-end
@@ -495,7 +870,7 @@ class EuroStyleFinanceGenerator:
                 'period_end_date': f"{year}-12-31",
                 'is_adjustment_period': True,
                 'period_status': 'CLOSED',
-                'created_date': '2024-01-01 00:00:00'
+                'created_date': _CREATED_DATE
             })
         
         self.periods = {p['period_id']: p for p in periods}
@@ -508,281 +883,109 @@ class EuroStyleFinanceGenerator:
         print("🏭 Generating cost centers...")
         
         cost_centers = []
-        cost_center_types = {
-            'SALES': ['Retail Stores', 'Online Sales', 'Wholesale'],
-            'MARKETING': ['Digital Marketing', 'Traditional Advertising', 'Events'],
-            'OPERATIONS': ['Warehousing', 'Logistics', 'Customer Service'],
-            'ADMIN': ['Finance', 'HR', 'IT', 'Legal'],
-            'MANAGEMENT': ['Executive', 'Strategy']
-        }
-        
-        cc_id = 1
         
-        for entity_id, entity in self.entities.items():
-            entity_code = entity['entity_code']
-            
-            # Entity-level cost centers
-            for cc_type, cc_names in cost_center_types.items():
-                for cc_name in cc_names:
-                    cost_centers.append({
-                        'cost_center_id': f"CC_{cc_id:06d}",
-                        'entity_id': entity_id,
-                        'cost_center_code': f"{entity_code}_{cc_type}_{cc_id:03d}",
-                        'cost_center_name': f"{cc_name} - {entity['country_code']}",
-                        'cost_center_type': 'PROFIT' if cc_type == 'SALES' else 'COST',
-                        'parent_cost_center_id': '',
-                        'manager_name': f"Manager {cc_id}",
-                        'is_active': True,
-                        'created_date': '2024-01-01 00:00:00'
-                    })
-                    cc_id += 1
+        # Entity-level cost centers: every entity gets every (type, name) pair
+        for cc_id, (entity, (cc_type, cc_name, center_type)) in enumerate(
+                itertools.product(self.entities.values(), COST_CENTER_PAIRS), start=1):
+            cost_centers.append({
+                'cost_center_id': f"CC_{cc_id:06d}",
+                'entity_id': entity['entity_id'],
+                'cost_center_code': f"{entity['entity_code']}_{cc_type}_{cc_id:03d}",
+                'cost_center_name': f"{cc_name} - {entity['country_code']}",
+                'cost_center_type': center_type,
+                'parent_cost_center_id': '',
+                'manager_name': f"Manager {cc_id}",
+                'is_active': True,
+                'created_date': _CREATED_DATE
+            })
         
         self.cost_centers = {cc['cost_center_id']: cc for cc in cost_centers}
         
+        # Per-entity indices so line generation does not rescan all cost centers
+        self.cost_centers_by_entity = {}
+        self.cc_codes_by_entity = {}
+        for cc in cost_centers:
+            self.cost_centers_by_entity.setdefault(cc['entity_id'], []).append(cc)
+            self.cc_codes_by_entity.setdefault(cc['entity_id'], []).append(cc['cost_center_code'])
+        
         print(f"Generated {len(cost_centers)} cost centers")
         return cost_centers
     
-    def generate_gl_transactions(self) -> Tuple[List[Dict], List[Dict]]:
-        """Generate general ledger transactions."""
+    def generate_gl_transactions(self, headers: List[JournalHeader]) -> Iterator[Tuple]:
+        """Generate general ledger transactions, yielding journal line tuples.
+        
+        Each BV entity is generated in its own worker process. Journal headers
+        are filled into ``headers`` as the lines are consumed.
+        """
         print("📚 Generating GL transactions...")
         
-        headers = []
-        lines = []
+        bv_entities = self._bv_entities
+        if not bv_entities:
+            print("Generated 0 journal headers and 0 journal lines")
+            return
+        
+        # Draw 50-100 journal entries per entity per month up front so every
+        # entity knows where its journal IDs start
+        randint = self.random.randint
+        journal_counts = [
+            {
+                (year, month): randint(50, 100)
+                for year in range(self.base_year, self.base_year + self.num_years)
+                for month in range(1, 13)
+            }
+            for _ in bv_entities
+        ]
+        first_journal_ids = list(itertools.accumulate(
+            (sum(counts.values()) for counts in journal_counts[:-1]), initial=1
+        ))
         
-        # Get revenue and expense accounts for realistic transactions
-        revenue_accounts = [a for a in self.accounts.values() if a['account_type'] == 'REVENUE' and a['is_leaf_account']]
-        expense_accounts = [a for a in self.accounts.values() if a['account_type'] == 'EXPENSES' and a['is_leaf_account']]
-        asset_accounts = [a for a in self.accounts.values() if a['account_type'] == 'ASSETS' and a['is_leaf_account']]
-        liability_accounts = [a for a in self.accounts.values() if a['account_type'] == 'LIABILITIES' and a['is_leaf_account']]
+        # A separate seed per entity keeps the workers' random streams independent
+        seeds = self.rng.integers(0, 2**32, size=len(bv_entities)).tolist()
         
-        journal_id = 1
+        headers.clear()
         line_id = 1
-        
-        # Generate monthly transactions for each entity
-        for entity_id, entity in self.entities.items():
-            if entity['entity_type'] != 'BV':  # Skip holding company
-                continue
-                
-            entity_currency = entity['functional_currency']
+        max_workers = min(len(bv_entities), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            shards = executor.map(
+                generate_entity_gl_transactions,
+                [entity['entity_id'] for entity in bv_entities],
+                bv_entities,
+                [self.cc_codes_by_entity.get(entity['entity_id']) for entity in bv_entities],
+                itertools.repeat(self._accounts_seq),
+                itertools.repeat(self._accounts_by_type),
+                itertools.repeat(self._period_id_cache),
+                journal_counts,
+                first_journal_ids,
+                seeds
+            )
             
-            for year in range(self.base_year, self.base_year + self.num_years):
-                for month in range(1, 13):
-                    period_id = f"{year}_{month:02d}"
-                    
-                    # Generate 50-100 journal entries per entity per month
-                    num_journals = random.randint(50, 100)
-                    
-                    for _ in range(num_journals):
-                        journal_date = date(year, month, random.randint(1, 28))
-                        
-                        # Journal header
-                        current_journal_id = f"JE_{journal_id:08d}"
-                        
-                        # Random transaction types
-                        transaction_types = [
-                            ('SALES', 'Sales transaction'),
-                            ('PURCHASE', 'Purchase transaction'),
-                            ('PAYROLL', 'Payroll entry'),
-                            ('DEPRECIATION', 'Depreciation entry'),
-                            ('BANK', 'Bank transaction'),
-                            ('ADJUSTMENT', 'Manual adjustment')
-                        ]
-                        
-                        trans_type, description = random.choice(transaction_types)
-                        
-                        header = {
-                            'journal_header_id': f"JH_{journal_id:08d}",  # Fixed: add missing journal_header_id
-                            'journal_id': current_journal_id,
-                            'entity_id': entity_id,
-                            'period_id': period_id,  # Fixed: add missing period_id
-                            'journal_number': f"{entity['entity_code']}-{year}-{journal_id:06d}",
-                            'journal_date': journal_date.strftime('%Y-%m-%d'),
-                            'posting_date': journal_date.strftime('%Y-%m-%d'),
-                            'period_year': year,
-                            'period_month': month,
-                            'journal_type': 'STANDARD',
-                            'journal_source': trans_type,
-                            'description': description,
-                            'reference_number': f"REF-{journal_id:06d}",  # Fixed: correct field name
-                            'currency_code': entity_currency,  # Fixed: add missing currency_code
-                            'total_debit': Decimal('0.00'),
-                            'total_credit': Decimal('0.00'),
-                            'functional_currency': entity_currency,
-                            'journal_status': 'POSTED',
-                            'created_by': 'SYSTEM',
-                            'created_date': '2024-01-01 00:00:00',
-                            'posted_by': 'SYSTEM',
-                            'posted_date': '2024-01-01 00:00:00',
-                            'approved_by': 'SYSTEM'  # Fixed: add missing approved_by
-                        }
-                        
-                        # Generate journal lines (2-6 lines per journal)
-                        num_lines = random.randint(2, 6)
-                        journal_lines = []
-                        total_debit = Decimal('0.00')
-                        total_credit = Decimal('0.00')
-                        
-                        for line_num in range(1, num_lines + 1):
-                            # Select accounts based on transaction type
-                            if trans_type == 'SALES':
-                                if line_num == 1:  # Debit cash/receivables
-                                    account = random.choice([a for a in asset_accounts if 'cash' in a['account_name'].lower() or 'receivable' in a['account_name'].lower()])
-                                    is_debit = True
-                                else:  # Credit revenue
-                                    account = random.choice(revenue_accounts)
-                                    is_debit = False
-                            elif trans_type == 'PURCHASE':
-                                if line_num == 1:  # Debit expense/inventory
-                                    account = random.choice(expense_accounts)
-                                    is_debit = True
-                                else:  # Credit cash/payables
-                                    account = random.choice(liability_accounts)
-                                    is_debit = False
-                            else:
-                                # Random account selection
-                                account = random.choice(list(self.accounts.values()))
-                                if account['is_leaf_account']:
-                                    is_debit = random.choice([True, False])
-                                else:
-                                    continue
-                            
-                            # Generate realistic amounts
-                            if trans_type == 'SALES':
-                                amount = Decimal(str(random.uniform(50, 2000))).quantize(Decimal('0.01'))
-                            elif trans_type == 'PURCHASE':
-                                amount = Decimal(str(random.uniform(100, 5000))).quantize(Decimal('0.01'))
-                            elif trans_type == 'PAYROLL':
-                                amount = Decimal(str(random.uniform(2000, 8000))).quantize(Decimal('0.01'))
-                            else:
-                                amount = Decimal(str(random.uniform(100, 3000))).quantize(Decimal('0.01'))
-                            
-                            debit_amount = amount if is_debit else Decimal('0.00')
-                            credit_amount = amount if not is_debit else Decimal('0.00')
-                            
-                            # Get random cost center for this entity
-                            entity_cost_centers = [cc for cc in self.cost_centers.values() if cc['entity_id'] == entity_id]
-                            cost_center = random.choice(entity_cost_centers)['cost_center_code'] if entity_cost_centers else 'DEFAULT'
-                            
-                            journal_lines.append({
-                                'journal_line_id': f"JL_{line_id:08d}",  # Fixed: add missing journal_line_id
-                                'journal_header_id': f"JH_{journal_id:08d}",  # Fixed: add missing journal_header_id
-                                'line_id': f"JL_{line_id:08d}",
-                                'journal_id': current_journal_id,
-                                'line_number': line_num,
-                                'entity_id': entity_id,
-                                'account_id': account['account_id'],
-                                'cost_center_id': f"CC_{random.randint(1, 75):06d}",  # Fixed: add missing cost_center_id
-                                'debit_amount': debit_amount,
-                                'credit_amount': credit_amount,
-                                'currency_code': entity_currency,  # Fixed: add missing currency_code
-                                'functional_currency': entity_currency,
-                                'transaction_currency': entity_currency,
-                                'transaction_amount': amount,
-                                'exchange_rate': Decimal('1.000000'),
-                                'line_description': f"Line {line_num} - {description}",  # Fixed: correct field name
-                                'reference_1': f"REF-{journal_id:06d}-{line_num}",  # Fixed: correct field name
-                                'reference_2': '',  # Fixed: add missing reference_2
-                                'cost_center': cost_center,
-                                'project_id': '',
-                                'customer_id': '',
-                                'vendor_id': '',
-                                'created_date': '2024-01-01 00:00:00'
-                            })
-                            
-                            total_debit += debit_amount
-                            total_credit += credit_amount
-                            line_id += 1
-                        
-                        # Balance the journal entry if needed
-                        if total_debit != total_credit:
-                            balance_amount = abs(total_debit - total_credit)
-                            if total_debit > total_credit:
-                                # Add credit line
-                                account = random.choice(liability_accounts)
-                                journal_lines.append({
-                                    'journal_line_id': f"JL_{line_id:08d}",  # Fixed: add missing journal_line_id
-                                    'journal_header_id': f"JH_{journal_id:08d}",  # Fixed: add missing journal_header_id
-                                    'line_id': f"JL_{line_id:08d}",
-                                    'journal_id': current_journal_id,
-                                    'line_number': len(journal_lines) + 1,
-                                    'entity_id': entity_id,
-                                    'account_id': account['account_id'],
-                                    'cost_center_id': f"CC_{random.randint(1, 75):06d}",  # Fixed: add missing cost_center_id
-                                    'debit_amount': Decimal('0.00'),
-                                    'credit_amount': balance_amount,
-                                    'currency_code': entity_currency,  # Fixed: add missing currency_code
-                                    'functional_currency': entity_currency,
-                                    'transaction_currency': entity_currency,
-                                    'transaction_amount': balance_amount,
-                                    'exchange_rate': Decimal('1.000000'),
-                                    'line_description': f"Balancing entry",  # Fixed: correct field name
-                                    'reference_1': f"REF-{journal_id:06d}-BAL",  # Fixed: correct field name
-                                    'reference_2': '',  # Fixed: add missing reference_2
-                                    'cost_center': cost_center,
-                                    'project_id': '',
-                                    'customer_id': '',
-                                    'vendor_id': '',
-                                    'created_date': '2024-01-01 00:00:00'
-                                })
-                                total_credit += balance_amount
-                                line_id += 1
-                            else:
-                                # Add debit line
-                                account = random.choice(asset_accounts)
-                                journal_lines.append({
-                                    'journal_line_id': f"JL_{line_id:08d}",  # Fixed: add missing journal_line_id
-                                    'journal_header_id': f"JH_{journal_id:08d}",  # Fixed: add missing journal_header_id
-                                    'line_id': f"JL_{line_id:08d}",
-                                    'journal_id': current_journal_id,
-                                    'line_number': len(journal_lines) + 1,
-                                    'entity_id': entity_id,
-                                    'account_id': account['account_id'],
-                                    'cost_center_id': f"CC_{random.randint(1, 75):06d}",  # Fixed: add missing cost_center_id
-                                    'debit_amount': balance_amount,
-                                    'credit_amount': Decimal('0.00'),
-                                    'currency_code': entity_currency,  # Fixed: add missing currency_code
-                                    'functional_currency': entity_currency,
-                                    'transaction_currency': entity_currency,
-                                    'transaction_amount': balance_amount,
-                                    'exchange_rate': Decimal('1.000000'),
-                                    'line_description': f"Balancing entry",  # Fixed: correct field name
-                                    'reference_1': f"REF-{journal_id:06d}-BAL",  # Fixed: correct field name
-                                    'reference_2': '',  # Fixed: add missing reference_2
-                                    'cost_center': cost_center,
-                                    'project_id': '',
-                                    'customer_id': '',
-                                    'vendor_id': '',
-                                    'created_date': '2024-01-01 00:00:00'
-                                })
-                                total_debit += balance_amount
-                                line_id += 1
-                        
-                        # Update header totals
-                        header['total_debit'] = total_debit
-                        header['total_credit'] = total_credit
-                        
-                        headers.append(header)
-                        lines.extend(journal_lines)
-                        
-                        journal_id += 1
-        
-        print(f"Generated {len(headers):,} journal headers and {len(lines):,} journal lines")
-        return headers, lines
+            # Shards arrive in entity order; line IDs are numbered across them
+            for entity_headers, entity_lines in shards:
+                headers.extend(entity_headers)
+                for row in entity_lines:
+                    journal_line_id = f"JL_{line_id:08d}"
+                    yield (journal_line_id, row[0], journal_line_id) + row[1:]
+                    line_id += 1
+        
+        print(f"Generated {len(headers):,} journal headers and {line_id - 1:,} journal lines")
     
-    def generate_budget_data(self) -> Tuple[List[Dict], List[Dict]]:
-        """Generate budget versions and data."""
-        print("📊 Generating budget data...")
+    def generate_budget_data(self, budget_versions: List[Dict]) -> Iterator[Tuple]:
+        """Generate budget data, yielding budget line tuples.
         
-        budget_versions = []
-        budget_data = []
+        Budget versions are appended to ``budget_versions`` as the lines are consumed.
+        """
+        print("📊 Generating budget data...")
         
         version_id = 1
         budget_id = 1
         
+        # Budgeted accounts are the same for every entity and year
+        budget_accounts = self._accounts_by_type['REVENUE'] + self._accounts_by_type['EXPENSES']
+        
         # Generate budgets for each entity
-        for entity_id, entity in self.entities.items():
-            if entity['entity_type'] != 'BV':  # Skip holding company
-                continue
+        for entity in self._bv_entities:
+            entity_id = entity['entity_id']
             
             # Generate budgets for current year and next year
             for year in [2024, 2025]:
@@ -797,63 +1000,55 @@ class EuroStyleFinanceGenerator:
                     'created_by': 'BUDGET_MANAGER',
                     'approved_by': 'CFO',
                     'approval_date': '2024-01-01',
-                    'created_date': '2024-01-01 00:00:00'
+                    'created_date': _CREATED_DATE
                 }
                 budget_versions.append(version)
                 
                 # Generate budget amounts for each account and month
-                revenue_accounts = [a for a in self.accounts.values() if a['account_type'] == 'REVENUE' and a['is_leaf_account']]
-                expense_accounts = [a for a in self.accounts.values() if a['account_type'] == 'EXPENSES' and a['is_leaf_account']]
+                entity_cost_centers = self.cost_centers_by_entity.get(entity_id, [])[:3]  # Limit to 3 cost centers per account
                 
-                entity_cost_centers = [cc for cc in self.cost_centers.values() if cc['entity_id'] == entity_id]
+                # Batch the per-line draws for this entity and year
+                num_budget_lines = len(budget_accounts) * 12 * len(entity_cost_centers)
+                amount_draws = self.rng.random(num_budget_lines).tolist()
+                dept_draws = self.rng.integers(0, len(DEPARTMENT_ID_POOL), size=num_budget_lines).tolist()
+                draw_idx = 0
                 
-                for account in revenue_accounts + expense_accounts:
+                for account in budget_accounts:
                     for month in range(1, 13):
-                        for cost_center in entity_cost_centers[:3]:  # Limit to 3 cost centers per account
+                        for cost_center in entity_cost_centers:
                             # Generate realistic budget amounts
-                            if account['account_type'] == 'REVENUE':
-                                base_amount = random.uniform(50000, 200000)
+                            if account.account_type == 'REVENUE':
+                                base_amount = 50000 + amount_draws[draw_idx] * 150000
                                 # Add seasonality (higher in Q4 for fashion retail)
                                 if month in [10, 11, 12]:
                                     base_amount *= 1.5
                                 elif month in [6, 7, 8]:
                                     base_amount *= 1.2
                             else:  # EXPENSES
-                                base_amount = random.uniform(20000, 100000)
+                                base_amount = 20000 + amount_draws[draw_idx] * 80000
                             
-                            budget_data.append({
-                                'budget_line_id': f"BD_{budget_id:08d}",
-                                'budget_version_id': version['budget_version_id'],
-                                'entity_id': entity_id,
-                                'account_id': account['account_id'],
-                                'cost_center_id': cost_center['cost_center_id'],  # Fixed: add missing cost_center_id
-                                'period_year': year,
-                                'period_month': month,
-                                'budget_amount': Decimal(str(base_amount)).quantize(Decimal('0.01')),
-                                'currency_code': entity['functional_currency'],  # Fixed: add missing currency_code
-                                'functional_currency': entity['functional_currency'],
-                                'budget_type': 'OPERATING',  # Fixed: add missing budget_type
-                                'scenario': 'BASE_CASE',  # Fixed: add missing scenario
-                                'cost_center': cost_center['cost_center_code'],
-                                'project_id': '',
-                                'department_id': f"DEPT_{random.randint(1, 20):03d}",  # Fixed: add missing department_id
-                                'comments': f"Budget for {account['account_name']}",
-                                'created_by': 'BUDGET_MANAGER',  # Fixed: add missing created_by
-                                'created_date': '2024-01-01 00:00:00'
-                            })
+                            # Row in BUDGET_DATA_FIELDS order
+                            yield (
+                                f"BD_{budget_id:08d}", version['budget_version_id'], entity_id,
+                                account.account_id, cost_center['cost_center_id'], year, month,
+                                money(base_amount), entity['functional_currency'], entity['functional_currency'],
+                                'OPERATING', 'BASE_CASE', cost_center['cost_center_code'], '',
+                                DEPARTMENT_ID_POOL[dept_draws[draw_idx]], f"Budget for {account.account_name}",
+                                'BUDGET_MANAGER', _CREATED_DATE
+                            )
                             budget_id += 1
+                            draw_idx += 1
                 
                 version_id += 1
         
-        print(f"Generated {len(budget_versions)} budget versions and {len(budget_data):,} budget entries")
-        return budget_versions, budget_data
+        print(f"Generated {len(budget_versions)} budget versions and {budget_id - 1:,} budget entries")
     
-    def generate_fixed_assets(self) -> Tuple[List[Dict], List[Dict]]:
-        """Generate fixed assets and depreciation schedules."""
-        print("🏭 Generating fixed assets...")
+    def generate_fixed_assets(self, assets: List[FixedAsset]) -> Iterator[Tuple]:
+        """Generate fixed assets, yielding depreciation schedule tuples.
         
-        assets = []
-        depreciation_schedule = []
+        Assets are appended to ``assets`` as the schedule is consumed.
+        """
+        print("🏭 Generating fixed assets...")
         
         asset_categories = {
             'IT Equipment': {'useful_life': 3, 'min_cost': 500, 'max_cost': 5000},
@@ -863,142 +1058,178 @@ class EuroStyleFinanceGenerator:
             'Machinery': {'useful_life': 10, 'min_cost': 10000, 'max_cost': 100000}
         }
         
+        category_names = list(asset_categories.keys())
+        category_useful_lives = np.array([info['useful_life'] for info in asset_categories.values()])
+        category_min_costs = np.array([info['min_cost'] for info in asset_categories.values()], dtype=float)
+        category_max_costs = np.array([info['max_cost'] for info in asset_categories.values()], dtype=float)
+        category_codes = [name.upper().replace(' ', '_') for name in category_names]  # Fixed: standardize format
+        
         asset_id = 1
         schedule_id = 1
         
+        # Assets are valued at January 2024, when earlier schedule entries are
+        # posted; schedules run until January 2026 (months since year 0)
+        valuation_month = 2024 * 12
+        schedule_end_month = 2026 * 12
+        
+        # Period labels per schedule month, formatted once instead of per row
+        period_labels = {}
+        for month_index in range(2019 * 12, schedule_end_month):
+            year, month = divmod(month_index, 12)
+            month += 1
+            period_labels[month_index] = (year, f"{month:02d}", f"P_{year}_{month:02d}", f"{year}-{month:02d}-01")
+        
         # Generate assets for each entity
-        for entity_id, entity in self.entities.items():
-            if entity['entity_type'] != 'BV':  # Skip holding company
-                continue
+        for entity in self._bv_entities:
+            entity_id = entity['entity_id']
+            entity_code = entity['entity_code']
+            
+            entity_currency = entity['functional_currency']
+            asset_location = f"{entity['country_code']} Office"
             
             # Generate 20-50 assets per entity
-            num_assets = random.randint(20, 50)
+            num_assets = int(self.rng.integers(20, 51))
+            
+            # Batch the per-asset draws for this entity
+            category_draws = self.rng.integers(0, len(category_names), size=num_assets)
+            year_draws = self.rng.integers(2019, 2024, size=num_assets)
+            month_draws = self.rng.integers(1, 13, size=num_assets)
+            day_draws = self.rng.integers(1, 29, size=num_assets)
+            cost_draws = self.rng.random(num_assets)
+            cc_id_draws = self.rng.integers(0, len(COST_CENTER_ID_POOL), size=num_assets).tolist()
+            supplier_draws = self.rng.integers(0, len(SUPPLIER_NAME_POOL), size=num_assets).tolist()
+            
+            # Random acquisition dates in the past 5 years, as months since year 0 and as dates
+            acquisition_months = year_draws * 12 + month_draws - 1
+            acquisition_dates = (
+                (acquisition_months - 1970 * 12).astype('datetime64[M]').astype('datetime64[D]') + (day_draws - 1)
+            )
+            purchase_dates = np.datetime_as_string(acquisition_dates).tolist()
+            warranty_expiries = np.datetime_as_string(acquisition_dates + 365 * 2).tolist()
+            
+            # Cost and accumulated depreciation for all assets at once, using
+            # whole calendar months owned up to the valuation date
+            min_costs = category_min_costs[category_draws]
+            acquisition_costs = np.round(min_costs + cost_draws * (category_max_costs[category_draws] - min_costs), 2)
+            useful_lives = category_useful_lives[category_draws]
+            annual_depreciations = acquisition_costs / useful_lives
+            years_owned = (valuation_month - acquisition_months) / 12
+            accumulated_depreciations = np.round(np.minimum(
+                annual_depreciations * years_owned,
+                acquisition_costs * _MAX_DEPRECIATION_RATIO  # Max 95% depreciated
+            ), 2)
+            net_book_values = np.round(acquisition_costs - accumulated_depreciations, 2)
+            
+            category_draws = category_draws.tolist()
+            acquisition_months = acquisition_months.tolist()
+            acquisition_costs = acquisition_costs.tolist()
+            useful_lives = useful_lives.tolist()
+            annual_depreciations = annual_depreciations.tolist()
+            accumulated_depreciations = accumulated_depreciations.tolist()
+            net_book_values = net_book_values.tolist()
             
-            for _ in range(num_assets):
-                category = random.choice(list(asset_categories.keys()))
-                category_info = asset_categories[category]
+            for i in range(num_assets):
+                category_index = category_draws[i]
+                category = category_names[category_index]
+                acquisition_cost = acquisition_costs[i]
+                annual_depreciation = annual_depreciations[i]
+                net_book_value = net_book_values[i]
                 
-                # Random acquisition date in the past 5 years
-                acquisition_date = date(
-                    random.randint(2019, 2023),
-                    random.randint(1, 12),
-                    random.randint(1, 28)
+                asset = FixedAsset(
+                    asset_id=f"FA_{entity_code}_{asset_id:06d}",  # Fixed: match schema pattern
+                    asset_code=f"{entity_code}-FA-{asset_id:06d}",  # Fixed: correct field name
+                    asset_name=f"{category} #{asset_id}",
+                    entity_id=entity_id,
+                    asset_category=category_codes[category_index],
+                    cost_center_id=COST_CENTER_ID_POOL[cc_id_draws[i]],  # Fixed: add missing cost_center_id
+                    purchase_date=purchase_dates[i],  # Fixed: correct field name
+                    purchase_cost=money(acquisition_cost),  # Fixed: correct field name
+                    currency_code=entity_currency,  # Fixed: add missing currency_code
+                    useful_life_years=useful_lives[i],
+                    depreciation_method='STRAIGHT_LINE',
+                    salvage_value=money(acquisition_cost * _SALVAGE_RATIO),  # 5% salvage
+                    accumulated_depreciation=money(accumulated_depreciations[i]),
+                    book_value=money(net_book_value),  # Fixed: correct field name
+                    asset_location=asset_location,
+                    serial_number=f"SN-{asset_id:08d}-{entity_code}",  # Fixed: add missing serial_number
+                    supplier_name=SUPPLIER_NAME_POOL[supplier_draws[i]],  # Fixed: add missing supplier_name
+                    warranty_expiry=warranty_expiries[i],  # Fixed: add missing warranty_expiry
+                    asset_status='ACTIVE' if net_book_value > 0 else 'RETIRED',  # Fixed: use correct status values
+                    disposal_date=None,  # Fixed: add missing disposal_date
+                    created_date=_CREATED_DATE
                 )
-                
-                acquisition_cost = Decimal(str(random.uniform(
-                    category_info['min_cost'],
-                    category_info['max_cost']
-                ))).quantize(Decimal('0.01'))
-                
-                useful_life = category_info['useful_life']
-                annual_depreciation = acquisition_cost / useful_life
-                
-                # Calculate accumulated depreciation
-                months_owned = (date(2024, 1, 1) - acquisition_date).days // 30
-                years_owned = months_owned / 12
-                accumulated_depreciation = min(
-                    annual_depreciation * Decimal(str(years_owned)),
-                    acquisition_cost * Decimal('0.95')  # Max 95% depreciated
-                ).quantize(Decimal('0.01'))
-                
-                net_book_value = acquisition_cost - accumulated_depreciation
-                
-                asset = {
-                    'asset_id': f"FA_{entity['entity_code']}_{asset_id:06d}",  # Fixed: match schema pattern
-                    'asset_code': f"{entity['entity_code']}-FA-{asset_id:06d}",  # Fixed: correct field name
-                    'asset_name': f"{category} #{asset_id}",
-                    'entity_id': entity_id,
-                    'asset_category': category.upper().replace(' ', '_'),  # Fixed: standardize format
-                    'cost_center_id': f"CC_{random.randint(1, 75):06d}",  # Fixed: add missing cost_center_id
-                    'purchase_date': acquisition_date.strftime('%Y-%m-%d'),  # Fixed: correct field name
-                    'purchase_cost': acquisition_cost,  # Fixed: correct field name
-                    'currency_code': entity['functional_currency'],  # Fixed: add missing currency_code
-                    'useful_life_years': useful_life,
-                    'depreciation_method': 'STRAIGHT_LINE',
-                    'salvage_value': acquisition_cost * Decimal('0.05'),  # 5% salvage
-                    'accumulated_depreciation': accumulated_depreciation,
-                    'book_value': net_book_value,  # Fixed: correct field name
-                    'asset_location': f"{entity['country_code']} Office",
-                    'serial_number': f"SN-{asset_id:08d}-{entity['entity_code']}",  # Fixed: add missing serial_number
-                    'supplier_name': f"Supplier {random.randint(1, 20):02d}",  # Fixed: add missing supplier_name
-                    'warranty_expiry': (acquisition_date + timedelta(days=365 * 2)).strftime('%Y-%m-%d'),  # Fixed: add missing warranty_expiry
-                    'asset_status': 'ACTIVE' if net_book_value > 0 else 'RETIRED',  # Fixed: use correct status values
-                    'disposal_date': None,  # Fixed: add missing disposal_date
-                    'created_date': '2024-01-01 00:00:00'
-                }
                 assets.append(asset)
                 
-                # Generate depreciation schedule
-                current_date = acquisition_date.replace(day=1)  # Start from first of month
-                monthly_depreciation = annual_depreciation / 12
-                running_accumulated = Decimal('0.00')
+                # Generate depreciation schedule: one entry per month from the
+                # acquisition month, until fully depreciated or the horizon is reached
+                start_month = acquisition_months[i]
+                num_months = schedule_end_month - start_month
+                monthly_depreciation = round(annual_depreciation / 12, 2)
+                
+                # Cost left at the start of each month; the last month takes what remains
+                remaining_cost = np.round(acquisition_cost - np.arange(num_months) * monthly_depreciation, 2)
+                num_months = int(np.count_nonzero(remaining_cost > 0))
+                current_depreciation = np.minimum(monthly_depreciation, remaining_cost[:num_months])
+                running_accumulated = np.round(np.cumsum(current_depreciation), 2)
+                current_nbv = np.round(acquisition_cost - running_accumulated, 2)
                 
-                while current_date < date(2026, 1, 1) and running_accumulated < acquisition_cost:
-                    remaining_cost = acquisition_cost - running_accumulated
-                    current_depreciation = min(monthly_depreciation, remaining_cost).quantize(Decimal('0.01'))
-                    running_accumulated += current_depreciation
-                    current_nbv = acquisition_cost - running_accumulated
+                for month_index, depreciation, accumulated, nbv in zip(
+                        range(start_month, start_month + num_months),
+                        current_depreciation.tolist(),
+                        running_accumulated.tolist(),
+                        current_nbv.tolist()):
+                    year, month_code, period_id, period_date = period_labels[month_index]
                     
-                    depreciation_schedule.append({
-                        'depreciation_id': f"DEP_{current_date.year}_{schedule_id:06d}_{current_date.month:02d}",  # Fixed: correct field name and format
-                        'asset_id': asset['asset_id'],
-                        'period_id': f"P_{current_date.year}_{current_date.month:02d}",  # Fixed: add missing period_id
-                        'depreciation_date': current_date.strftime('%Y-%m-%d'),  # Fixed: add missing depreciation_date
-                        'depreciation_amount': current_depreciation,
-                        'accumulated_depreciation': running_accumulated,
-                        'book_value': current_nbv,  # Fixed: correct field name
-                        'is_posted': current_date < date(2024, 1, 1),  # Fixed: correct field name
-                        'journal_header_id': None,  # Fixed: add missing journal_header_id
-                        'created_date': '2024-01-01 00:00:00'
-                    })
+                    # Row in DEPRECIATION_FIELDS order
+                    yield (
+                        f"DEP_{year}_{schedule_id:06d}_{month_code}", asset.asset_id,
+                        period_id, period_date,
+                        money(depreciation), money(accumulated), money(nbv),
+                        month_index < valuation_month, None, _CREATED_DATE
+                    )
                     schedule_id += 1
-                    
-                    # Move to next month
-                    if current_date.month == 12:
-                        current_date = current_date.replace(year=current_date.year + 1, month=1)
-                    else:
-                        current_date = current_date.replace(month=current_date.month + 1)
                 
                 asset_id += 1
         
-        print(f"Generated {len(assets)} fixed assets and {len(depreciation_schedule):,} depreciation entries")
-        return assets, depreciation_schedule
+        print(f"Generated {len(assets)} fixed assets and {schedule_id - 1:,} depreciation entries")
     
-    def write_csv_file(self, filename: str, data: List[Dict], fieldnames: List[str] = None):
-        """Write data to CSV file with compression."""
-        if not data:
-            print(f"⚠️ No data to write for {filename}")
+    def write_csv_file(self, filename: str, data: Iterable, fieldnames: List[str] = None):
+        """Write data (a list or a row stream) to a compressed file in the configured output format."""
+        self._record_csv_file(
+            filename,
+            write_output_file(self.output_dir, filename, data, fieldnames, self.compress_level, self.output_format)
+        )
+    
+    def write_csv_files(self, outputs: List[Tuple[str, List, Optional[List[str]]]]):
+        """Write (filename, data, fieldnames) outputs in parallel worker processes."""
+        if not outputs:
             return
         
-        if fieldnames is None:
-            fieldnames = list(data[0].keys())
-        
-        # Write uncompressed first
-        filepath = os.path.join(self.output_dir, filename)
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
-        
-        # Calculate original file size
-        original_size = os.path.getsize(filepath)
-        
-        # Compress the file
-        compressed_filepath = filepath + '.gz'
-        import gzip
-        
-        with open(filepath, 'rb') as f_in:
-            with gzip.open(compressed_filepath, 'wb', compresslevel=6) as f_out:
-                f_out.write(f_in.read())
+        filenames = [filename for filename, _, _ in outputs]
+        max_workers = min(len(outputs), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                write_output_file,
+                itertools.repeat(self.output_dir),
+                *zip(*outputs),
+                itertools.repeat(self.compress_level),
+                itertools.repeat(self.output_format)
+            )
+            # Report in submission order so the log stays stable
+            for filename, info in zip(filenames, results):
+                self._record_csv_file(filename, info)
+    
+    def _record_csv_file(self, filename: str, info: Optional[Dict]):
+        """Print and register the result of a compressed output file write."""
+        if info is None:
+            print(f"⚠️ No data to write for {filename}")
+            return
         
-        # Calculate compressed file size
-        compressed_size = os.path.getsize(compressed_filepath)
+        compressed_size = info['size']
+        original_size = info['original_size']
         compression_ratio = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
         
-        # Remove uncompressed file to save space
-        os.remove(filepath)
-        
         # Format size display
         if compressed_size > 1024 * 1024:
             size_str = f"{compressed_size / (1024 * 1024):.1f} MB"
@@ -1007,12 +1238,13 @@ class EuroStyleFinanceGenerator:
         else:
             size_str = f"{compressed_size} bytes"
         
-        print(f"  📄 {filename}.gz ({len(data):,} records, {size_str}, {compression_ratio:.1f}% compression)")
+        output_name = Path(info['path']).name
+        print(f"  📄 {output_name} ({info['records']:,} records, {size_str}, {compression_ratio:.1f}% compression)")
         
-        self.csv_files[filename + '.gz'] = {
-            'records': len(data),
+        self.csv_files[output_name] = {
+            'records': info['records'],
             'size': compressed_size,
-            'path': compressed_filepath
+            'path': info['path']
         }
     
     def generate_all_finance_data(self):
@@ -1022,18 +1254,24 @@ class EuroStyleFinanceGenerator:
         # Load external data for referential integrity
         self.load_external_data()
         
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Large row streams are written as they are generated; the remaining
+        # tables are collected and written in parallel afterwards
+        outputs = []
+        
         # 1. Corporate structure
         print("\n1. Corporate Structure")
         legal_entities = self.generate_legal_entities()
-        self.write_csv_file('eurostyle_finance.legal_entities.csv', legal_entities)
+        outputs.append(('eurostyle_finance.legal_entities.csv', legal_entities, None))
         
         entity_relationships = self.generate_entity_relationships()
-        self.write_csv_file('eurostyle_finance.entity_relationships.csv', entity_relationships)
+        outputs.append(('eurostyle_finance.entity_relationships.csv', entity_relationships, None))
         
         # 2. Chart of accounts
         print("\n2. Chart of Accounts")
         accounts = self.generate_chart_of_accounts()
-        self.write_csv_file('eurostyle_finance.chart_of_accounts.csv', accounts)
+        outputs.append(('eurostyle_finance.chart_of_accounts.csv', accounts, None))
         
         # Generate entity accounts mapping
         entity_accounts = []
@@ -1044,48 +1282,55 @@ class EuroStyleFinanceGenerator:
                     'entity_account_id': f"EA_{ea_id:08d}",
                     'entity_id': entity_id,
                     'account_id': account_id,
-                    'local_account_code': self.accounts[account_id]['account_code'],
-                    'local_account_name': self.accounts[account_id]['account_name'],
+                    'local_account_code': self.accounts[account_id].account_code,
+                    'local_account_name': self.accounts[account_id].account_name,
                     'is_active': True,
-                    'created_date': '2024-01-01 00:00:00'
+                    'created_date': _CREATED_DATE
                 })
                 ea_id += 1
         
-        self.write_csv_file('eurostyle_finance.entity_accounts.csv', entity_accounts)
+        outputs.append(('eurostyle_finance.entity_accounts.csv', entity_accounts, None))
         
         # 3. Currencies and exchange rates
         print("\n3. Currencies and Exchange Rates")
         currencies, exchange_rates = self.generate_currencies_and_rates()
-        self.write_csv_file('eurostyle_finance.currencies.csv', currencies)
-        self.write_csv_file('eurostyle_finance.exchange_rates.csv', exchange_rates)
+        outputs.append(('eurostyle_finance.currencies.csv', currencies, None))
+        outputs.append(('eurostyle_finance.exchange_rates.csv', exchange_rates, EXCHANGE_RATE_FIELDS))
         
         # 4. Reporting periods
         print("\n4. Reporting Periods")
         periods = self.generate_reporting_periods()
-        self.write_csv_file('eurostyle_finance.reporting_periods.csv', periods)
+        outputs.append(('eurostyle_finance.reporting_periods.csv', periods, None))
         
         # 5. Cost centers
         print("\n5. Cost Centers")
         cost_centers = self.generate_cost_centers()
-        self.write_csv_file('eurostyle_finance.cost_centers.csv', cost_centers)
+        outputs.append(('eurostyle_finance.cost_centers.csv', cost_centers, None))
         
         # 6. General ledger transactions
         print("\n6. General Ledger Transactions")
-        gl_headers, gl_lines = self.generate_gl_transactions()
-        self.write_csv_file('eurostyle_finance.gl_journal_headers.csv', gl_headers)
-        self.write_csv_file('eurostyle_finance.gl_journal_lines.csv', gl_lines)
+        gl_headers = []
+        self.write_csv_file('eurostyle_finance.gl_journal_lines.csv', self.generate_gl_transactions(gl_headers),
+                            GL_JOURNAL_LINE_FIELDS)
+        outputs.append(('eurostyle_finance.gl_journal_headers.csv', gl_headers, None))
         
         # 7. Budget data
         print("\n7. Budget Data")
-        budget_versions, budget_data = self.generate_budget_data()
-        self.write_csv_file('eurostyle_finance.budget_versions.csv', budget_versions)
-        self.write_csv_file('eurostyle_finance.budget_data.csv', budget_data)
+        budget_versions = []
+        self.write_csv_file('eurostyle_finance.budget_data.csv', self.generate_budget_data(budget_versions),
+                            BUDGET_DATA_FIELDS)
+        outputs.append(('eurostyle_finance.budget_versions.csv', budget_versions, None))
         
         # 8. Fixed assets
         print("\n8. Fixed Assets")
-        fixed_assets, depreciation_schedule = self.generate_fixed_assets()
-        self.write_csv_file('eurostyle_finance.fixed_assets.csv', fixed_assets)
-        self.write_csv_file('eurostyle_finance.depreciation_schedule.csv', depreciation_schedule)
+        fixed_assets = []
+        self.write_csv_file('eurostyle_finance.depreciation_schedule.csv', self.generate_fixed_assets(fixed_assets),
+                            DEPRECIATION_FIELDS)
+        outputs.append(('eurostyle_finance.fixed_assets.csv', fixed_assets, None))
+        
+        # 9. Write all output files
+        print("\n9. Writing Output Files")
+        self.write_csv_files(outputs)
         
         # Summary
         print(f"\n✅ Complete finance data generation finished!")
@@ -1104,11 +1349,30 @@ class EuroStyleFinanceGenerator:
 
 def main():
     """Main function to generate EuroStyle Finance data."""
+    parser = argparse.ArgumentParser(description='Generate EuroStyle Finance data')
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Random seed for reproducible output (default: unseeded)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=OUTPUT_FORMATS,
+        default='csv',
+        help='Output file format: gzip-compressed CSV (default) or Parquet (requires pyarrow)'
+    )
+    args = parser.parse_args()
+    
     print("🏦 EuroStyle Fashion - Finance Data Generator")
     print("============================================")
     
+    if args.format == 'parquet' and pa is None:
+        print("Error: pyarrow is required for Parquet output. Install with: pip install pyarrow")
+        sys.exit(1)
+    
     try:
-        generator = EuroStyleFinanceGenerator()
+        generator = EuroStyleFinanceGenerator(output_format=args.format, seed=args.seed)
         generator.generate_all_finance_data()
         
         print("\n🎉 Finance data generation completed successfully!")
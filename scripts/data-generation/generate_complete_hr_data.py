@@ -20,26 +20,1023 @@ Author: EuroStyle Fashion Data Team
 Date: 2024-10-10
 """
 
+import argparse
 import csv
+import io
+import itertools
 import random
+import unicodedata
 import uuid
-from datetime import datetime, date, timedelta
-from decimal import Decimal, ROUND_HALF_UP
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from datetime import date, timedelta
 import os
+import pickle
 import sys
 import gzip
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
 import json
-from faker import Faker
+import numpy as np
+import pandas as pd
+from faker import Faker, VERSION as FAKER_VERSION
+
+# Parallel gzip is optional: mgzip compresses blocks on all cores and still
+# writes standard .csv.gz files; without it the stdlib gzip module is used
+try:
+    import mgzip
+except ImportError:
+    mgzip = None
+
+# orjson is optional too: it serializes the JSON columns (review goals,
+# program targets, survey questions) faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow is optional (--csv-writer pyarrow): its C++ CSV writer formats the
+# rows instead of the csv module
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+# Numba is optional as well: when installed, the compensation salary chain
+# and the survey demographic buckets are compiled to machine code; without
+# it the same functions run as Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Output settings: gzip level (1 is fastest, 9 smallest; 1 costs only a little
+# size on this repetitive CSV text) and raw file buffer size
+DEFAULT_COMPRESS_LEVEL = 1
+WRITE_BUFFER_SIZE = 1 << 20
+MGZIP_BLOCK_SIZE = 2_000_000
+
+# Training records and survey responses are generated and handed to the CSV
+# writer this many at a time, so only one batch of rows is held in memory
+STREAM_BATCH_SIZE = 50_000
+
+# Generator stages that only read employees, contracts and positions; they
+# run in parallel worker processes once those are built
+PARALLEL_STAGES = ('leave', 'performance', 'training', 'surveys')
+
+# CSV writers (--csv-writer); pyarrow converts rows to columns in batches
+CSV_WRITERS = ('csv', 'pyarrow')
+ARROW_BATCH_SIZE = 100_000
+
+# Low-cardinality text columns the pyarrow writer builds as dictionary arrays:
+# each distinct value is converted once and the rows become integer codes
+ARROW_DICTIONARY_COLUMNS = frozenset({
+    'status', 'instructor_name', 'training_location', 'employee_feedback',
+    'likes_most', 'improvement_suggestions', 'additional_comments',
+    'department_group', 'tenure_group', 'age_group', 'role_level'
+})
+
+# Faker values are pre-generated per entity into pools of up to this many
+# entries and drawn with replacement, so Faker is not called per employee
+FAKER_POOL_SIZE = 1000
+FAKER_POOL_KINDS = (
+    'first_name_male', 'first_name_female', 'first_name', 'last_name', 'name',
+    'phone_number', 'street_address', 'city', 'postcode'
+)
+
+# Number of pre-formatted "Dr. <last name>" strings leave requests pick from
+DOCTOR_NAME_POOL_SIZE = 1000
+
+# Seeded runs pickle each entity's Faker output here and reuse it on re-runs.
+# Cache files are keyed by the Faker version and FAKER_CACHE_VERSION; bump it
+# whenever _faker_values, FAKER_POOL_KINDS or FAKER_POOL_SIZE change
+FAKER_CACHE_DIR = '.cache'
+FAKER_CACHE_VERSION = 2
+
+# Employee attribute pools for the batched draws in generate_employees
+GENDERS = ['MALE', 'FEMALE', 'NON_BINARY', 'PREFER_NOT_TO_SAY']
+MARITAL_STATUSES = ['SINGLE', 'MARRIED', 'DIVORCED', 'WIDOWED', 'DOMESTIC_PARTNERSHIP']
+DEPENDENT_COUNTS = [0, 1, 2, 3, 4]
+DEPENDENT_WEIGHTS = [0.30, 0.25, 0.25, 0.15, 0.05]
+EMERGENCY_RELATIONSHIPS = ['SPOUSE', 'PARENT', 'SIBLING', 'CHILD', 'FRIEND']
+TERMINATION_REASONS = ['RESIGNATION', 'TERMINATION', 'REDUNDANCY', 'RETIREMENT']
+NON_EU_VISA_STATUSES = ['WORK_PERMIT', 'OTHER']
+
+# Weighted categoricals that are drawn in bulk with Generator.choice, one
+# array per generator run (probabilities sum to 1)
+COMPENSATION_CHANGES = ['ANNUAL_REVIEW', 'PROMOTION', 'MARKET_ADJUSTMENT', 'MERIT_INCREASE']
+COMPENSATION_CHANGE_WEIGHTS = [0.50, 0.15, 0.20, 0.15]
+CONTRACT_TYPES = ['PERMANENT', 'TEMPORARY', 'INTERNSHIP', 'CONTRACTOR']
+CONTRACT_TYPE_WEIGHTS = [0.75, 0.15, 0.07, 0.03]
+WORK_SCHEDULES = ['FULL_TIME', 'PART_TIME', 'FLEXIBLE', 'SHIFT_WORK']
+WORK_SCHEDULE_WEIGHTS = [0.70, 0.20, 0.08, 0.02]
+LEAVE_TYPES = ['ANNUAL', 'SICK', 'PERSONAL', 'MATERNITY', 'PATERNITY']
+LEAVE_TYPE_WEIGHTS = [0.70, 0.20, 0.05, 0.03, 0.02]
+SICK_LEAVE_DURATIONS = [1, 2, 3, 5, 10, 30]
+SICK_LEAVE_DURATION_WEIGHTS = [0.40, 0.25, 0.15, 0.10, 0.07, 0.03]
+LEAVE_STATUSES = ['APPROVED', 'PENDING', 'REJECTED']
+LEAVE_STATUS_WEIGHTS = [0.85, 0.10, 0.05]
+SICK_LEAVE_TYPES = ['SHORT_TERM', 'CHRONIC', 'INJURY']
+SPECIAL_LEAVE_TYPES = ['BEREAVEMENT', 'EMERGENCY', 'PERSONAL']
+LEAVE_REJECTION_REASONS = [
+    'Insufficient leave balance',
+    'Business needs - peak period',
+    'Short notice - less than 48 hours',
+    'Documentation incomplete'
+]
+
+# Survey satisfaction ratings (1-5 scale, weighted towards positive), one
+# probability vector per response column
+RATING_SCALE = [1, 2, 3, 4, 5]
+SATISFACTION_WEIGHTS = {
+    'overall_satisfaction': [0.02, 0.05, 0.15, 0.40, 0.38],  # Weighted towards 4-5
+    'work_life_balance_rating': [0.03, 0.08, 0.20, 0.42, 0.27],
+    'compensation_satisfaction': [0.05, 0.12, 0.25, 0.35, 0.23],
+    'career_development_rating': [0.04, 0.10, 0.22, 0.38, 0.26],
+    'management_effectiveness': [0.03, 0.07, 0.18, 0.42, 0.30],
+    'company_culture_rating': [0.02, 0.06, 0.17, 0.43, 0.32]
+}
+
+# Free-text survey answers; the empty strings are respondents who skip
+SURVEY_LIKES_MOST = [
+    "Great team collaboration and supportive colleagues",
+    "Flexible working arrangements and work-life balance",
+    "Opportunities for professional development and growth",
+    "Company culture and values alignment",
+    "Challenging and meaningful work projects",
+    "Competitive compensation and benefits package",
+    "Strong leadership and clear direction",
+    "Innovation and forward-thinking approach"
+]
+SURVEY_IMPROVEMENT_SUGGESTIONS = [
+    "More opportunities for career advancement",
+    "Better communication between departments",
+    "Enhanced training and development programs",
+    "Improved work-life balance initiatives",
+    "More competitive compensation packages",
+    "Better recognition and rewards programs",
+    "Upgraded office facilities and technology",
+    "More flexible working arrangements",
+    "",  # Some don't provide suggestions
+    ""   # Some don't provide suggestions
+]
+SURVEY_ADDITIONAL_COMMENTS = [
+    "Overall very satisfied with my role and the company",
+    "Looking forward to continued growth and development",
+    "Appreciate the supportive management team",
+    "Happy with the company direction and vision",
+    "",  # Many skip additional comments
+    "",
+    "",
+    ""
+]
+
+# Position templates by department type and job family
+POSITION_TEMPLATES = {
+    'Executive': [
+        {'title': 'Chief Executive Officer', 'level': 'EXECUTIVE', 'family': 'Executive', 'min_exp': 15, 'max_exp': 25},
+        {'title': 'Chief Financial Officer', 'level': 'EXECUTIVE', 'family': 'Finance', 'min_exp': 12, 'max_exp': 20},
+        {'title': 'Chief Technology Officer', 'level': 'EXECUTIVE', 'family': 'IT', 'min_exp': 12, 'max_exp': 18}
+    ],
+    'Finance': [
+        {'title': 'Finance Director', 'level': 'DIRECTOR', 'family': 'Finance', 'min_exp': 8, 'max_exp': 15},
+        {'title': 'Finance Manager', 'level': 'MANAGER', 'family': 'Finance', 'min_exp': 5, 'max_exp': 10},
+        {'title': 'Senior Financial Analyst', 'level': 'SENIOR', 'family': 'Finance', 'min_exp': 3, 'max_exp': 7},
+        {'title': 'Financial Analyst', 'level': 'JUNIOR', 'family': 'Finance', 'min_exp': 1, 'max_exp': 4}
+    ],
+    'HR': [
+        {'title': 'HR Director', 'level': 'DIRECTOR', 'family': 'HR', 'min_exp': 8, 'max_exp': 15},
+        {'title': 'HR Business Partner', 'level': 'SENIOR', 'family': 'HR', 'min_exp': 4, 'max_exp': 8},
+        {'title': 'HR Coordinator', 'level': 'JUNIOR', 'family': 'HR', 'min_exp': 1, 'max_exp': 4}
+    ],
+    'IT': [
+        {'title': 'IT Director', 'level': 'DIRECTOR', 'family': 'IT', 'min_exp': 8, 'max_exp': 15},
+        {'title': 'Senior Software Engineer', 'level': 'SENIOR', 'family': 'IT', 'min_exp': 4, 'max_exp': 8},
+        {'title': 'Software Engineer', 'level': 'JUNIOR', 'family': 'IT', 'min_exp': 1, 'max_exp': 4},
+        {'title': 'IT Support Specialist', 'level': 'JUNIOR', 'family': 'IT', 'min_exp': 1, 'max_exp': 3}
+    ],
+    'Marketing': [
+        {'title': 'Marketing Director', 'level': 'DIRECTOR', 'family': 'Marketing', 'min_exp': 6, 'max_exp': 12},
+        {'title': 'Marketing Manager', 'level': 'MANAGER', 'family': 'Marketing', 'min_exp': 3, 'max_exp': 8},
+        {'title': 'Digital Marketing Specialist', 'level': 'JUNIOR', 'family': 'Marketing', 'min_exp': 1, 'max_exp': 4}
+    ],
+    'Store Operations': [
+        {'title': 'Store Manager', 'level': 'MANAGER', 'family': 'Retail', 'min_exp': 3, 'max_exp': 8},
+        {'title': 'Assistant Store Manager', 'level': 'LEAD', 'family': 'Retail', 'min_exp': 2, 'max_exp': 5},
+        {'title': 'Sales Associate', 'level': 'ENTRY', 'family': 'Retail', 'min_exp': 0, 'max_exp': 3}
+    ],
+    'Logistics': [
+        {'title': 'Logistics Manager', 'level': 'MANAGER', 'family': 'Operations', 'min_exp': 4, 'max_exp': 8},
+        {'title': 'Warehouse Supervisor', 'level': 'LEAD', 'family': 'Operations', 'min_exp': 2, 'max_exp': 6},
+        {'title': 'Warehouse Worker', 'level': 'ENTRY', 'family': 'Operations', 'min_exp': 0, 'max_exp': 2}
+    ]
+}
+
+# Salary level adjustments
+LEVEL_MULTIPLIERS = {
+    'ENTRY': 0.7, 'JUNIOR': 0.85, 'SENIOR': 1.0,
+    'LEAD': 1.2, 'MANAGER': 1.5, 'DIRECTOR': 2.0, 'EXECUTIVE': 3.0
+}
+
+# Job family inferred from keywords in a position title, checked in order
+# (positions carry no job family field in the schema)
+TITLE_FAMILY_KEYWORDS = (
+    ('Finance', ('finance', 'financial', 'accounting')),
+    ('Sales', ('sales', 'account', 'business')),
+    ('Marketing', ('marketing', 'digital')),
+    ('HR', ('hr', 'human')),
+    ('IT', ('it', 'software', 'engineer', 'technical')),
+    ('Management', ('manager', 'director', 'executive', 'ceo', 'cfo')),
+    ('Retail', ('store', 'retail', 'sales associate'))
+)
+
+# Compact JSON templates for the fixed-schema review columns, filled with
+# %-formatting from pre-drawn values instead of building and encoding objects
+REVIEW_GOALS_JSON = (
+    '[{"goal":"Achieve sales target","target":"100%%","achievement":"%d%%"},'
+    '{"goal":"Customer satisfaction","target":"4.5/5","achievement":"%.1f/5"},'
+    '{"goal":"Team collaboration","target":"Effective","achievement":"Achieved"}]'
+)
+REVIEW_COMPETENCIES_JSON = '{"leadership":%.2f,"communication":%.2f,"problem_solving":%.2f,"adaptability":%.2f}'
+
+# Share of compensation records with a health insurance contribution and
+# with other benefits, drawn as one 2-D array of gates
+COMPENSATION_BENEFIT_RATES = [0.8, 0.6]
+
+# Uniform ranges for the per-record amounts, one column each: bonus fraction
+# of salary, equity grant, monthly health contribution, monthly other
+# benefits, commission rate and pension percentage
+COMPENSATION_AMOUNT_LOWS = [0.05, 5000, 150, 50, 0.02, 3.0]
+COMPENSATION_AMOUNT_HIGHS = [0.25, 50000, 400, 200, 0.08, 8.0]
+
+# Salary increase per compensation change, in COMPENSATION_CHANGES order:
+# base + span * U(0, 1), i.e. 2-8% for annual reviews and merit increases,
+# 15-30% for promotions and 8-15% for market adjustments
+COMPENSATION_INCREASE_BASES = np.array([0.02, 0.15, 0.08, 0.02])
+COMPENSATION_INCREASE_SPANS = np.array([0.06, 0.15, 0.07, 0.06])
+
+# Change reason by code; the hire record has code -1, so it maps to the end
+COMPENSATION_REASONS = np.array(COMPENSATION_CHANGES + ['HIRE'])
+
+# Training record outcomes drawn in bulk by generate_training_data
+TRAINING_INCOMPLETE_STATUSES = ['IN_PROGRESS', 'FAILED', 'CANCELLED']
+TRAINING_FEEDBACK_TEMPLATES = [
+    "Very informative and well-structured course.",
+    "Excellent instructor, learned a lot of practical skills.",
+    "Good content but could use more interactive elements.",
+    "Highly recommend this training to colleagues.",
+    "Clear explanations and relevant examples.",
+    "Training met my expectations and professional needs.",
+    "Could benefit from more hands-on exercises."
+]
+TRAINING_INSTRUCTORS = [
+    "Dr. Sarah Johnson", "Prof. Michael Chen", "Maria Rodriguez", "James Wilson",
+    "Dr. Emma Thompson", "Carlos Mendez", "Lisa Anderson", "Ahmed Hassan",
+    "Sophie Martin", "David Brown", "Anna Kowalski", "Roberto Silva"
+]
+
+# Column order of the tuple rows built by generate_training_data
+EMPLOYEE_TRAINING_FIELDS = [
+    'training_record_id', 'employee_id', 'program_id', 'enrollment_date', 'start_date',
+    'completion_date', 'status', 'score', 'certification_earned', 'certification_number',
+    'certification_expiry_date', 'instructor_name', 'training_location', 'cost_eur',
+    'approved_by', 'employee_feedback', 'employee_rating', 'created_date'
+]
+
+# Performance ratings from lowest to highest, and the overall-score
+# thresholds between them (np.digitize picks the band)
+PERFORMANCE_RATINGS = np.array([
+    'UNSATISFACTORY', 'BELOW_EXPECTATIONS', 'PARTIALLY_MEETS', 'MEETS_EXPECTATIONS', 'EXCEEDS_EXPECTATIONS'
+])
+PERFORMANCE_RATING_THRESHOLDS = [1.5, 2.5, 3.5, 4.5]
+
+# Column order of the tuple rows built by generate_surveys_and_responses;
+# the six ratings follow SATISFACTION_WEIGHTS order
+SURVEY_RESPONSE_FIELDS = [
+    'response_id', 'survey_id', 'employee_id', 'response_date',
+    *SATISFACTION_WEIGHTS,
+    'likes_most', 'improvement_suggestions', 'additional_comments',
+    'department_group', 'tenure_group', 'age_group', 'role_level',
+    'consent_given', 'anonymization_level', 'created_date'
+]
+
+# Survey demographic groups, indexed by the codes _bucketize_demographics fills in
+TENURE_GROUPS = ('0-1 years', '1-3 years', '3-5 years', '5+ years')
+AGE_GROUPS = ('Under 25', '25-34', '35-44', '45-54', '55+')
+
+# Lower bounds of all but the first group: tenure in months, age in years
+TENURE_GROUP_BOUNDS = [12, 36, 60]
+AGE_GROUP_BOUNDS = [25, 35, 45, 55]
+
+# Survey department groups by department type and role levels by position
+# level ('Other' for anything else)
+DEPARTMENT_GROUPS = {
+    'CORPORATE': 'Corporate Functions',
+    'SUPPORT': 'Support Services',
+    'RETAIL': 'Retail Operations',
+    'OPERATIONS': 'Operations'
+}
+ROLE_LEVELS = {
+    'ENTRY': 'Individual Contributor',
+    'JUNIOR': 'Individual Contributor',
+    'SENIOR': 'Senior Individual Contributor',
+    'LEAD': 'Team Lead',
+    'MANAGER': 'Management',
+    'DIRECTOR': 'Senior Management',
+    'EXECUTIVE': 'Executive'
+}
+
+# Column order of the tuple rows built by generate_compensation_history
+COMPENSATION_HISTORY_FIELDS = [
+    'compensation_id', 'employee_id', 'effective_date', 'change_reason',
+    'previous_base_salary_eur', 'new_base_salary_eur', 'salary_change_percentage', 'currency',
+    'bonus_amount_eur', 'commission_rate', 'equity_grant_value_eur',
+    'health_insurance_contribution_eur', 'pension_contribution_percentage', 'other_benefits_eur',
+    'approved_by', 'hr_approved_by', 'created_date'
+]
+
+# Position levels from most to least senior, used for reporting lines
+POSITION_HIERARCHY = ('EXECUTIVE', 'DIRECTOR', 'MANAGER', 'LEAD', 'SENIOR', 'JUNIOR', 'ENTRY')
+POSITION_HIERARCHY_INDEX = {level: idx for idx, level in enumerate(POSITION_HIERARCHY)}
+
+
+class Department(NamedTuple):
+    """Department record (field order matches the CSV schema)."""
+    department_id: str
+    department_code: str
+    department_name: str
+    entity_id: str
+    parent_department_id: str
+    manager_employee_id: str
+    cost_center_id: str
+    department_type: str
+    location: str
+    is_active: bool
+    created_date: str
+
+
+class Position(NamedTuple):
+    """Job position record (field order matches the CSV schema)."""
+    position_id: str
+    position_code: str
+    position_title: str
+    department_id: str
+    reporting_position_id: Optional[str]
+    position_level: str
+    employment_type: str
+    salary_grade: str
+    min_salary_eur: str
+    max_salary_eur: str
+    country_code: str
+    required_skills: List[str]
+    education_requirements: str
+    experience_years: int
+    is_remote_eligible: bool
+    travel_percentage: int
+    is_active: bool
+    created_date: str
+
+
+class Employee(NamedTuple):
+    """Employee master record (field order matches the CSV schema)."""
+    employee_id: str
+    employee_number: str
+    entity_id: str
+    personal_email: str
+    work_email: str
+    title: str
+    first_name: str
+    middle_name: str
+    last_name: str
+    preferred_name: str
+    date_of_birth: date
+    gender: str
+    nationality: str
+    country_of_birth: str
+    marital_status: str
+    number_of_dependents: int
+    
+    # Contact information
+    phone_mobile: str
+    phone_home: str
+    emergency_contact_name: str
+    emergency_contact_phone: str
+    emergency_contact_relationship: str
+    
+    # Address information
+    address_street: str
+    address_city: str
+    address_state: str
+    address_postal_code: str
+    address_country: str
+    
+    # Legal and compliance
+    social_security_number: str
+    tax_id: str
+    passport_number: str
+    passport_expiry_date: str
+    visa_status: str
+    visa_expiry_date: str
+    work_permit_required: bool
+    work_permit_expiry_date: str
+    
+    # Employment status
+    employee_status: str
+    hire_date: date
+    termination_date: Optional[date]
+    termination_reason: str
+    rehire_eligible: bool
+    created_date: str
+    updated_date: str
+
+
+def write_compressed_csv(output_dir: str, filename: str, data: Iterable, fieldnames: Optional[List[str]] = None,
+                         compress_level: int = DEFAULT_COMPRESS_LEVEL, csv_writer: str = 'csv') -> Optional[Dict]:
+    """Stream dict or tuple records into a gzip-compressed CSV file and return its size info.
+    
+    ``data`` may be a list or any iterator of records; rows are written as
+    they are produced. Dict records are turned into field-ordered tuples
+    with itemgetter and handed to csv.writer.writerows, so the per-row work
+    stays in C. Tuple records are written as they are; named tuples supply
+    their own field names, plain tuples need ``fieldnames``. With
+    ``csv_writer`` set to 'pyarrow' the tuples go to _write_arrow_csv
+    instead. Returns None when there is no data to write.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        return None
+    
+    records_are_tuples = isinstance(first, tuple)
+    if fieldnames is None:
+        fieldnames = list(first._fields) if records_are_tuples else list(first.keys())
+    
+    # Count rows as they pass through; zip stops before advancing the counter
+    counter = itertools.count()
+    rows = (row for row, _ in zip(itertools.chain([first], rows), counter))
+    if not records_are_tuples:
+        rows = map(itemgetter(*fieldnames), rows)
+    
+    filepath = os.path.join(output_dir, filename)
+    
+    # Write the CSV straight into gzip, with a large buffer on the raw file
+    with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as raw_file, \
+            _gzip_writer(raw_file, compress_level) as gz_file:
+        if csv_writer == 'pyarrow':
+            _write_arrow_csv(gz_file, fieldnames, rows)
+        else:
+            with io.TextIOWrapper(gz_file, encoding='utf-8', newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
+    
+    return {
+        'records': next(counter),
+        'size': os.path.getsize(filepath),
+        'path': filepath
+    }
+
+
+def _write_arrow_csv(sink, fieldnames: List[str], rows: Iterator[Tuple]):
+    """Write field-ordered tuples as CSV into a binary sink with pyarrow's writer.
+    
+    Rows are converted to columns ARROW_BATCH_SIZE at a time;
+    ARROW_DICTIONARY_COLUMNS are built as dictionary arrays. The schema is
+    fixed once every column has a type: a column that is all None in the
+    leading batches has pyarrow's null type, so those batches are held back
+    until a later batch gives the column a real type (or the rows run out).
+    List values (the survey targets) are written as their str(), as
+    csv.writer does. The output differs from csv.writer's in that every
+    string value (and header) is quoted, booleans come out as true/false,
+    whole floats lose their fraction (25 rather than 25.0), and None is an
+    empty field while '' is written as "". Requires pyarrow.
+    """
+    dictionary_type = pa.dictionary(pa.int32(), pa.string())
+    write_options = pacsv.WriteOptions(quoting_style='needed')
+    pending = []
+    schema = None
+    writer = None
+    try:
+        while batch := list(itertools.islice(rows, ARROW_BATCH_SIZE)):
+            columns = {
+                name: [str(value) if isinstance(value, list) else value for value in column]
+                for name, column in zip(fieldnames, zip(*batch))
+            }
+            if writer is not None:
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                continue
+            
+            # Null-typed fields unify with any type, so the merged schema
+            # is complete once no field is left without a type
+            pending.append(pa.Table.from_pydict({
+                name: pa.array(column, type=dictionary_type) if name in ARROW_DICTIONARY_COLUMNS else column
+                for name, column in columns.items()
+            }))
+            merged = pa.unify_schemas([t.schema for t in pending])
+            if any(pa.types.is_null(field.type) for field in merged):
+                continue
+            schema = merged
+            writer = pacsv.CSVWriter(sink, schema, write_options=write_options)
+            for table in pending:
+                writer.write_table(table.cast(schema))
+            pending = []
+        
+        # Columns that stay all None are written with the null type (empty fields)
+        if pending:
+            schema = pa.unify_schemas([t.schema for t in pending])
+            writer = pacsv.CSVWriter(sink, schema, write_options=write_options)
+            for table in pending:
+                writer.write_table(table.cast(schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _draw_employee_batch(rng: np.random.Generator, n: int, country_code: str,
+                         country_codes: List[str]) -> Dict[str, List]:
+    """Draw all non-Faker employee attributes for n employees in bulk."""
+    today_ord = date.today().toordinal()
+    
+    # Dates as ordinals: birth dates for ages 18-65, hire dates 2018-01-01 to 2024-06-30
+    birth_ords = today_ord - rng.integers(int(18 * 365.25), int(66 * 365.25), size=n)
+    hire_ords = rng.integers(date(2018, 1, 1).toordinal(), date(2024, 6, 30).toordinal() + 1, size=n)
+    
+    # Employees hired before 2024: 5% terminated, 2% of the rest on leave
+    tenured = hire_ords <= date(2024, 1, 1).toordinal()
+    terminated = tenured & (rng.random(n) < 0.05)
+    on_leave = tenured & ~terminated & (rng.random(n) < 0.02)
+    termination_ords = rng.integers(hire_ords + 90, today_ord + 1)
+    
+    genders = rng.choice(GENDERS, size=n)
+    title_flips = rng.random(n) < 0.5
+    titles = np.where(genders == 'MALE', 'MR',
+                      np.where(genders == 'FEMALE',
+                               np.where(title_flips, 'MRS', 'MS'),
+                               np.where(title_flips, 'MS', 'MR')))
+    
+    countries_of_birth = np.where(rng.random(n) < 0.8, country_code, rng.choice(country_codes, size=n))
+    
+    return {
+        'gender': genders.tolist(),
+        'title': titles.tolist(),
+        'birth_ord': birth_ords.tolist(),
+        'hire_ord': hire_ords.tolist(),
+        'status': np.where(terminated, 'TERMINATED', np.where(on_leave, 'ON_LEAVE', 'ACTIVE')).tolist(),
+        'termination_ord': termination_ords.tolist(),
+        'termination_reason': rng.choice(TERMINATION_REASONS, size=n).tolist(),
+        'has_middle_name': (rng.random(n) < 0.3).tolist(),
+        'uses_first_name': (rng.random(n) < 0.9).tolist(),
+        'country_of_birth': countries_of_birth.tolist(),
+        'marital_status': rng.choice(MARITAL_STATUSES, size=n).tolist(),
+        'dependents': rng.choice(DEPENDENT_COUNTS, size=n, p=DEPENDENT_WEIGHTS).tolist(),
+        'has_home_phone': (rng.random(n) < 0.7).tolist(),
+        'emergency_relationship': rng.choice(EMERGENCY_RELATIONSHIPS, size=n).tolist(),
+        'ssn_suffix': rng.integers(1000, 10000, size=n).tolist(),
+        'tax_number': rng.integers(100000, 1000000, size=n).tolist(),
+        'passport_number': rng.integers(1000000, 10000000, size=n).tolist(),
+        'passport_expiry_ord': (today_ord + rng.integers(365, 3651, size=n)).tolist(),
+        'visa_status': np.where(rng.random(n) < 0.9, 'EU_CITIZEN', rng.choice(NON_EU_VISA_STATUSES, size=n)).tolist(),
+        'has_visa_expiry': (rng.random(n) < 0.1).tolist(),
+        'visa_expiry_ord': (today_ord + rng.integers(365, 1826, size=n)).tolist(),
+        'work_permit_required': (rng.random(n) < 0.1).tolist(),
+        'has_work_permit_expiry': (rng.random(n) < 0.1).tolist(),
+        'work_permit_expiry_ord': (today_ord + rng.integers(365, 1826, size=n)).tolist(),
+        'rehire_eligible': (rng.random(n) < 0.8).tolist()
+    }
+
+
+def _faker_pool(faker: Faker, kind: str, size: int) -> List[str]:
+    """Pre-generate min(size, FAKER_POOL_SIZE) values from one Faker method."""
+    make = getattr(faker, kind)
+    return [make() for _ in range(min(size, FAKER_POOL_SIZE))]
+
+
+def _email_forms(names: Iterable[str]) -> Dict[str, str]:
+    """Map each name to its ASCII lower-case form for email addresses (diacritics stripped)."""
+    return {
+        name: unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().lower()
+        for name in names
+    }
+
+
+def _faker_values(faker: Faker, country_code: str, num_employees: int) -> Dict[str, List[str]]:
+    """Generate all Faker output for one entity: the value pools plus one personal email per employee."""
+    values = {kind: _faker_pool(faker, kind, num_employees) for kind in FAKER_POOL_KINDS}
+    if country_code in ['DE', 'US']:
+        values['state'] = _faker_pool(faker, 'state', num_employees)
+    values['personal_email'] = [faker.email() for _ in range(num_employees)]
+    return values
+
+
+def _load_faker_values(locale: str, country_code: str, num_employees: int, seed: int,
+                       cache_dir: Optional[str]) -> Dict[str, List[str]]:
+    """Return the entity's Faker values, from the pickle cache in cache_dir when present.
+    
+    The values depend only on the Faker version, the layout built by
+    _faker_values (FAKER_CACHE_VERSION), the locale, country, seed and size;
+    all of these are part of the file name, so a cached file is identical to
+    what a fresh Faker instance would produce. Pass cache_dir=None to always
+    call Faker.
+    """
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = os.path.join(
+            cache_dir,
+            f"hr_faker_v{FAKER_CACHE_VERSION}_faker{FAKER_VERSION}_{locale}_{country_code}_{seed}_{num_employees}.pkl"
+        )
+        if os.path.exists(cache_file):
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+    
+    faker = Faker(locale)
+    faker.seed_instance(seed)
+    values = _faker_values(faker, country_code, num_employees)
+    
+    if cache_file is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary name first so a crashed run never leaves a partial cache file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(values, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    
+    return values
+
+
+def generate_entity_employees(entity: Dict, country_code: str, country_codes: List[str], locale: str,
+                              num_employees: int, first_emp_id: int, seed: int,
+                              faker_cache_dir: Optional[str] = None) -> List[Employee]:
+    """Generate the employee records for one legal entity.
+    
+    Kept at module level so each entity can run in its own worker process.
+    Employees are numbered from ``first_emp_id``; random decisions and the
+    Faker values are all seeded from ``seed``.
+    """
+    rnd = random.Random(seed)
+    rng = np.random.default_rng(seed)
+    choice = rnd.choice
+    
+    # Random decisions for the whole entity are drawn up front, and
+    # Faker strings are picked from the country's pools
+    draws = _draw_employee_batch(rng, num_employees, country_code, country_codes)
+    pools = _load_faker_values(locale, country_code, num_employees, seed, faker_cache_dir)
+    
+    # Email forms of the pooled first and last names, converted once per pool entry
+    email_names = _email_forms(itertools.chain(
+        pools['first_name_male'], pools['first_name_female'], pools['first_name'], pools['last_name']
+    ))
+    email_domain = f"eurostyle{country_code.lower()}.com"
+    
+    entity_id = entity['entity_id']
+    entity_code = entity['entity_code']
+    employees = []
+    
+    # Zero-padded employee numbers, formatted once and shared by the
+    # employee ID and the entity-prefixed employee number
+    emp_numbers = [f"{n:06d}" for n in range(first_emp_id, first_emp_id + num_employees)]
+    
+    for i, emp_number in enumerate(emp_numbers):
+        
+        # Generate realistic personal data
+        gender = draws['gender'][i]
+        if gender == 'MALE':
+            first_name = choice(pools['first_name_male'])
+        elif gender == 'FEMALE':
+            first_name = choice(pools['first_name_female'])
+        else:
+            first_name = choice(pools['first_name'])
+        
+        last_name = choice(pools['last_name'])
+        
+        # Employment status based on hire date and random factors
+        status = draws['status'][i]
+        if status == 'TERMINATED':
+            termination_date = date.fromordinal(draws['termination_ord'][i])
+            termination_reason = draws['termination_reason'][i]
+        else:
+            termination_date = None
+            termination_reason = ''
+        
+        # Generate work and personal contact information
+        work_email = f"{email_names[first_name]}.{email_names[last_name]}@{email_domain}"
+        personal_email = pools['personal_email'][i]
+        
+        employee = Employee(
+            employee_id='EMP_' + emp_number,
+            employee_number=entity_code + emp_number,
+            entity_id=entity_id,
+            personal_email=personal_email,
+            work_email=work_email,
+            title=draws['title'][i],
+            first_name=first_name,
+            middle_name=choice(pools['first_name']) if draws['has_middle_name'][i] else '',
+            last_name=last_name,
+            preferred_name=first_name if draws['uses_first_name'][i] else choice(pools['first_name']),
+            date_of_birth=date.fromordinal(draws['birth_ord'][i]),
+            gender=gender,
+            nationality=country_code,
+            country_of_birth=draws['country_of_birth'][i],
+            marital_status=draws['marital_status'][i],
+            number_of_dependents=draws['dependents'][i],
+            
+            # Contact information
+            phone_mobile=choice(pools['phone_number']),
+            phone_home=choice(pools['phone_number']) if draws['has_home_phone'][i] else '',
+            emergency_contact_name=choice(pools['name']),
+            emergency_contact_phone=choice(pools['phone_number']),
+            emergency_contact_relationship=draws['emergency_relationship'][i],
+            
+            # Address information
+            address_street=choice(pools['street_address']),
+            address_city=choice(pools['city']),
+            address_state=choice(pools['state']) if 'state' in pools else '',
+            address_postal_code=choice(pools['postcode']),
+            address_country=country_code,
+            
+            # Legal and compliance (simplified for demo)
+            social_security_number=f"***-**-{draws['ssn_suffix'][i]}",  # Masked
+            tax_id=f"{country_code}{draws['tax_number'][i]}",
+            passport_number=f"{country_code}{draws['passport_number'][i]}",
+            passport_expiry_date=date.fromordinal(draws['passport_expiry_ord'][i]).isoformat(),
+            visa_status=draws['visa_status'][i],
+            visa_expiry_date=date.fromordinal(draws['visa_expiry_ord'][i]).isoformat() if draws['has_visa_expiry'][i] else '',
+            work_permit_required=draws['work_permit_required'][i],
+            work_permit_expiry_date=date.fromordinal(draws['work_permit_expiry_ord'][i]).isoformat() if draws['has_work_permit_expiry'][i] else '',
+            
+            # Employment status
+            employee_status=status,
+            hire_date=date.fromordinal(draws['hire_ord'][i]),
+            termination_date=termination_date,
+            termination_reason=termination_reason,
+            rehire_eligible=draws['rehire_eligible'][i],
+            created_date='2023-01-01 00:00:00',
+            updated_date='2024-01-01 00:00:00'
+        )
+        employees.append(employee)
+    
+    return employees
+
+
+def money(x: float) -> str:
+    """Format an amount as a 2-decimal string for output."""
+    return f"{x:.2f}"
+
+
+def _money_where(values: List[float], keep: List[bool]) -> List[Optional[str]]:
+    """Format values with money() where keep is true, None elsewhere."""
+    return [money(x) if k else None for x, k in zip(values, keep)]
+
+
+def one_decimal(x: float) -> str:
+    """Format a score or day count as a 1-decimal string for output."""
+    return f"{x:.1f}"
+
+
+@lru_cache(maxsize=None)
+def infer_job_family(position_title: str) -> str:
+    """Infer a position's job family from its title (Operations when nothing matches).
+    
+    Titles repeat across departments and entities, so results are cached per title.
+    """
+    title_lower = position_title.lower()
+    for family, keywords in TITLE_FAMILY_KEYWORDS:
+        if any(word in title_lower for word in keywords):
+            return family
+    return 'Operations'
+
+
+def _read_reference_csv(file) -> List[Dict]:
+    """Parse a reference CSV with the pandas C engine into records of strings."""
+    return pd.read_csv(file, engine='c', dtype=str, keep_default_na=False).to_dict('records')
+
+
+def _dumps_json(obj) -> str:
+    """Serialize obj to compact JSON, identical with or without orjson installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def _gzip_writer(raw_file, compress_level: int):
+    """Open a gzip stream on raw_file, compressing on all cores when mgzip is installed."""
+    if mgzip is not None:
+        return mgzip.MultiGzipFile(fileobj=raw_file, mode='wb', compresslevel=compress_level,
+                                   thread=os.cpu_count(), blocksize=MGZIP_BLOCK_SIZE)
+    return gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=compress_level)
+
+
+def _evolve_salaries(record_contracts, change_codes, increase_fractions, initial_salaries, max_salaries,
+                     increase_bases, increase_spans, previous_salaries, new_salaries, change_percentages):
+    """Walk every contract's salary chain, filling the three output arrays in place.
+    
+    Records are grouped by contract in date order. Code -1 is the hire
+    record (no previous salary, NaN); other codes index COMPENSATION_CHANGES.
+    Salaries never exceed the position maximum. Compiled with Numba when it
+    is installed.
+    """
+    current_salary = 0.0
+    for n in range(len(change_codes)):
+        c = record_contracts[n]
+        code = change_codes[n]
+        if code < 0:
+            new_salary = initial_salaries[c]
+            previous_salaries[n] = np.nan
+            change_percentages[n] = 0.0
+        else:
+            increase = increase_bases[code] + increase_spans[code] * increase_fractions[n]
+            new_salary = current_salary * (1 + increase)
+            previous_salaries[n] = current_salary
+            change_percentages[n] = increase * 100
+        current_salary = min(new_salary, max_salaries[c])
+        new_salaries[n] = current_salary
+
+
+if njit is not None:
+    _evolve_salaries = njit(cache=True)(_evolve_salaries)
+
+
+def _bucketize_demographics(hire_months, birth_ords, survey_month, survey_ord, tenure_codes, age_codes):
+    """Fill tenure and age group codes for one survey in place.
+    
+    Hire dates come as months (year * 12 + month) and birth dates as
+    ordinals, so tenure and age are plain integer differences. Codes index
+    TENURE_GROUPS and AGE_GROUPS. Compiled with Numba when it is installed;
+    otherwise the np.digitize version below is used.
+    """
+    for n in range(len(hire_months)):
+        tenure_months = survey_month - hire_months[n]
+        if tenure_months < 12:
+            tenure_codes[n] = 0
+        elif tenure_months < 36:
+            tenure_codes[n] = 1
+        elif tenure_months < 60:
+            tenure_codes[n] = 2
+        else:
+            tenure_codes[n] = 3
+        
+        age_years = (survey_ord - birth_ords[n]) // 365
+        if age_years < 25:
+            age_codes[n] = 0
+        elif age_years < 35:
+            age_codes[n] = 1
+        elif age_years < 45:
+            age_codes[n] = 2
+        elif age_years < 55:
+            age_codes[n] = 3
+        else:
+            age_codes[n] = 4
+
+
+if njit is not None:
+    _bucketize_demographics = njit(cache=True)(_bucketize_demographics)
+else:
+    def _bucketize_demographics(hire_months, birth_ords, survey_month, survey_ord, tenure_codes, age_codes):
+        """Fill tenure and age group codes for one survey, over whole arrays."""
+        tenure_codes[:] = np.digitize(survey_month - hire_months, TENURE_GROUP_BOUNDS)
+        age_codes[:] = np.digitize((survey_ord - birth_ords) // 365, AGE_GROUP_BOUNDS)
+
+
+def generate_entity_compensation(contracts: List[Dict], position_terms: Dict[str, Tuple], seed: int) -> List[List]:
+    """Generate the compensation history columns for one legal entity's contracts.
+    
+    Kept at module level so each entity can run in its own worker process.
+    ``position_terms`` maps a position ID to its float salary range and its
+    bonus, equity and commission eligibility. Records are laid out as
+    arrays, the salary chain is walked by _evolve_salaries, and every column
+    is then assembled from whole arrays. Returns the columns of
+    COMPENSATION_HISTORY_FIELDS except compensation_id, which is numbered
+    once the entities are combined.
+    """
+    rng = np.random.Generator(np.random.SFC64(seed))
+    num_contracts = len(contracts)
+    
+    # Per-contract terms from the position
+    terms = [position_terms[contract['position_id']] for contract in contracts]
+    min_salaries, max_salaries, senior, equity_eligible, commissioned = (np.array(column) for column in zip(*terms))
+    part_time = np.array([contract['work_schedule'] == 'PART_TIME' for contract in contracts])
+    
+    # Annual reviews fall on each hire anniversary before 2024-08-31;
+    # count them per contract so every random draw can be made up front
+    review_cutoff = date(2024, 8, 31).toordinal()
+    hire_ords = np.array([contract['start_date'].toordinal() for contract in contracts], dtype=np.int64)
+    review_counts = np.maximum((review_cutoff - hire_ords - 1) // 365, 0)
+    num_reviews = int(review_counts.sum())
+    
+    # Per contract: starting point in the salary range (lower for growth)
+    # and part-time factor
+    initial_fractions = rng.random(num_contracts)
+    part_time_factors = rng.uniform(0.6, 0.8, num_contracts)
+    initial_salaries = min_salaries + (max_salaries * 0.8 - min_salaries) * initial_fractions
+    initial_salaries = np.where(part_time, initial_salaries * part_time_factors, initial_salaries)
+    
+    # Per review: 70% chance of a salary change, and its reason
+    review_changes = rng.random(num_reviews) < 0.7
+    review_codes = rng.choice(len(COMPENSATION_CHANGES), size=num_reviews, p=COMPENSATION_CHANGE_WEIGHTS)
+    
+    # Per compensation record (the hire plus every accepted review). The
+    # benefit gates and the amounts are each one 2-D draw, one column per field
+    num_records = num_contracts + int(review_changes.sum())
+    increase_fractions = rng.random(num_records)
+    has_health, has_other_benefits = (
+        rng.random((num_records, 2)) < COMPENSATION_BENEFIT_RATES
+    ).T.tolist()
+    amounts = rng.uniform(COMPENSATION_AMOUNT_LOWS, COMPENSATION_AMOUNT_HIGHS, (num_records, 6)).T
+    bonus_fractions = amounts[0]
+    equity_grants, health_contributions, other_benefit_amounts, commission_rates, pension_percentages = amounts[1:].tolist()
+    approvers = rng.integers(1, 51, num_records).tolist()
+    hr_approvers = rng.integers(1, 11, num_records).tolist()
+    
+    # Lay the records out grouped by contract, in date order: the hire
+    # record (year 0) followed by the accepted reviews
+    review_contracts = np.repeat(np.arange(num_contracts), review_counts)
+    first_reviews = np.cumsum(review_counts) - review_counts
+    review_years = np.arange(num_reviews) - np.repeat(first_reviews, review_counts) + 1
+    record_contracts = np.concatenate([np.arange(num_contracts), review_contracts[review_changes]])
+    record_years = np.concatenate([np.zeros(num_contracts, dtype=np.int64), review_years[review_changes]])
+    change_codes = np.concatenate([np.full(num_contracts, -1), review_codes[review_changes]])
+    order = np.lexsort((record_years, record_contracts))
+    record_contracts, record_years, change_codes = record_contracts[order], record_years[order], change_codes[order]
+    
+    # Walk the salary chains; without Numba, plain lists are faster to
+    # index from Python than NumPy arrays
+    chain_args = [record_contracts, change_codes, increase_fractions, initial_salaries, max_salaries,
+                  COMPENSATION_INCREASE_BASES, COMPENSATION_INCREASE_SPANS,
+                  np.empty(num_records), np.empty(num_records), np.empty(num_records)]
+    if njit is None:
+        chain_args = [arg.tolist() for arg in chain_args]
+    _evolve_salaries(*chain_args)
+    previous_salaries, new_salaries, change_percentages = (np.asarray(arg) for arg in chain_args[-3:])
+    
+    # Bonuses for senior levels (at promotions and annual reviews), equity
+    # grants for directors and executives (at promotions), and commission
+    # for sales positions
+    promotion = change_codes == COMPENSATION_CHANGES.index('PROMOTION')
+    annual_review = change_codes == COMPENSATION_CHANGES.index('ANNUAL_REVIEW')
+    gets_bonus = (senior[record_contracts] & (promotion | annual_review)).tolist()
+    gets_equity = (equity_eligible[record_contracts] & promotion).tolist()
+    gets_commission = commissioned[record_contracts].tolist()
+    
+    # Assemble the remaining columns from the per-record arrays
+    contract_employee_ids = [contract['employee_id'] for contract in contracts]
+    effective_dates = [
+        date.fromordinal(effective_ord).isoformat()
+        for effective_ord in (hire_ords[record_contracts] + 365 * record_years).tolist()
+    ]
+    bonus_amounts = (new_salaries * bonus_fractions).tolist()
+    return [
+        [contract_employee_ids[c] for c in record_contracts.tolist()],
+        effective_dates,
+        COMPENSATION_REASONS[change_codes].tolist(),
+        
+        # Salary change tracking (matching database schema)
+        _money_where(previous_salaries.tolist(), (change_codes >= 0).tolist()),
+        list(map(money, new_salaries.tolist())),
+        list(map(money, change_percentages.tolist())),
+        ['EUR'] * num_records,
+        
+        # Variable compensation
+        _money_where(bonus_amounts, gets_bonus),
+        _money_where(commission_rates, gets_commission),
+        _money_where(equity_grants, gets_equity),
+        
+        # Benefits (company health insurance portion, pension, meal vouchers, transport, etc.)
+        _money_where(health_contributions, has_health),
+        list(map(money, pension_percentages)),
+        _money_where(other_benefit_amounts, has_other_benefits),
+        
+        # Approval tracking
+        [f"MGR_{approver}" for approver in approvers],
+        [f"HR_{approver}" for approver in hr_approvers],
+        [effective_date + ' 00:00:00' for effective_date in effective_dates]
+    ]
+
+
+class EmployeeRef(NamedTuple):
+    """The employee fields the contract, leave, review and survey generators read."""
+    employee_id: str
+    entity_id: str
+    country_code: str
+    employee_status: str
+    hire_date: date
+    termination_date: Optional[date]
+    date_of_birth: date
+
+
 class EuroStyleHRGenerator:
     """Generates comprehensive HR data for EuroStyle Fashion multi-country structure."""
     
-    def __init__(self):
-        """Initialize the HR data generator."""
+    def __init__(self, seed: Optional[int] = None, csv_writer: str = 'csv',
+                 compress_level: int = DEFAULT_COMPRESS_LEVEL):
+        """Initialize the HR data generator (pass a seed for reproducible output).
+        
+        Seeded runs also cache the per-entity Faker output in FAKER_CACHE_DIR,
+        so re-running with the same seed skips Faker for employees.
+        """
         print("👥 Initializing EuroStyle Fashion HR Data Generator...")
         
         # Configuration
@@ -48,19 +1045,40 @@ class EuroStyleHRGenerator:
         
         # File paths  
         self.output_dir = "data/csv"  # Output to data/csv directory
+        self.compress_level = compress_level
+        self.csv_writer = csv_writer
         self.csv_files = {}
         
+        # Random state is seeded once here: scalar draws use self.random, the
+        # vectorized per-employee draws use self.rng (SFC64, the fastest of
+        # NumPy's bit generators)
+        self.random = random.Random(seed)
+        self.rng = np.random.Generator(np.random.SFC64(seed))
+        self.faker_cache_dir = FAKER_CACHE_DIR if seed is not None else None
+        
         # Data containers
         self.entities = {}
         self.departments = {}
         self.positions = {}
-        self.employees = {}
+        self.position_families = {}
+        self.employee_refs = {}
+        self.employee_ref_list = []
+        self.active_employee_refs = []
+        self.employee_hire_ords = np.empty(0, dtype=np.int64)
+        self.employee_termination_ords = np.empty(0, dtype=np.int64)
+        self.employee_hire_months = np.empty(0, dtype=np.int64)
+        self.employee_birth_ords = np.empty(0, dtype=np.int64)
+        self.employee_hire_order = np.empty(0, dtype=np.int64)
+        self.sorted_hire_ords = np.empty(0, dtype=np.int64)
         self.contracts = {}
+        self.contracts_by_employee = defaultdict(list)
         
         # External data references (loaded from other systems)
         self.finance_entities = []
         self.stores = []
         self.cost_centers = []
+        self._country_by_entity = {}
+        self._cost_center_ids_by_entity = {}
         
         # European country configurations - EuroStyle countries: NL, DE, FR, BE, LU
         self.countries = {
@@ -132,6 +1150,8 @@ class EuroStyleHRGenerator:
             # Use primary locale for each country
             locale = config['locales'][0]
             self.fakers[country] = Faker(locale)
+            if seed is not None:
+                self.fakers[country].seed_instance(seed)
         
         # Job families and their typical salaries (multipliers of base salary)
         self.job_families = {
@@ -157,40 +1177,39 @@ class EuroStyleHRGenerator:
             # Load finance legal entities from unified data directory
             finance_entities_path = "data/csv/eurostyle_finance.legal_entities.csv.gz"
             if os.path.exists(finance_entities_path):
-                import gzip
-                with gzip.open(finance_entities_path, 'rt', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.finance_entities = list(reader)
+                with gzip.open(finance_entities_path, 'rb') as f:
+                    self.finance_entities = _read_reference_csv(f)
                 print(f"Loaded {len(self.finance_entities)} legal entities")
             
             # Load cost centers
             cost_centers_path = "data/csv/eurostyle_finance.cost_centers.csv.gz"
             if os.path.exists(cost_centers_path):
-                import gzip
-                with gzip.open(cost_centers_path, 'rt', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.cost_centers = list(reader)
+                with gzip.open(cost_centers_path, 'rb') as f:
+                    self.cost_centers = _read_reference_csv(f)
                 print(f"Loaded {len(self.cost_centers)} cost centers")
             
             # Load stores (fallback to operational data if available)
             stores_path = "data/csv/stores.csv.gz"
             if os.path.exists(stores_path):
-                import gzip
-                with gzip.open(stores_path, 'rt', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.stores = list(reader)
+                with gzip.open(stores_path, 'rb') as f:
+                    self.stores = _read_reference_csv(f)
                 print(f"Loaded {len(self.stores)} stores")
                 
         except Exception as e:
             print(f"⚠️ Could not load all external data: {e}")
             print("Will generate HR data with mock references...")
+        
+        # Index the references by entity once for the per-row lookups
+        self._country_by_entity = {e['entity_id']: e['country_code'] for e in self.finance_entities}
+        self._cost_center_ids_by_entity = defaultdict(list)
+        for cc in self.cost_centers:
+            self._cost_center_ids_by_entity[cc.get('entity_id')].append(cc['cost_center_id'])
     
-    def generate_departments(self) -> List[Dict]:
+    def generate_departments(self) -> List[Department]:
         """Generate department hierarchy for each entity."""
         print("\n🏢 Generating department structure...")
         
         departments = []
-        dept_id = 1
         
         # Standard department structure for each entity
         dept_structure = {
@@ -229,408 +1248,377 @@ class EuroStyleHRGenerator:
             }
         }
         
+        # Code form of every department name (upper case, underscores), built once
+        name_codes = {}
+        for dept_name, dept_config in dept_structure.items():
+            for name in [dept_name, *dept_config['children']]:
+                name_codes[name] = name.upper().replace(' ', '_')
+        
+        # Department IDs for every operating entity, formatted in one pass
+        depts_per_entity = sum(1 + len(dept_config['children']) for dept_config in dept_structure.values())
+        operating_entities = sum(entity['entity_type'] != 'HOLDING' for entity in self.finance_entities)
+        num_departments = depts_per_entity * operating_entities
+        dept_ids = iter([f"DEPT_{n:06d}" for n in range(1, num_departments + 1)])
+        
         # Generate departments for each entity
         for entity in self.finance_entities:
             entity_id = entity['entity_id']
             if entity['entity_type'] == 'HOLDING':
                 continue  # Skip holding company for HR departments
             
+            entity_code = entity['entity_code']
             entity_depts = {}
+            entity_cost_center_ids = self._cost_center_ids_by_entity[entity_id]
             
             # Create top-level departments
             for dept_name, dept_config in dept_structure.items():
-                dept_id_str = f"DEPT_{dept_id:06d}"
-                department = {
-                    'department_id': dept_id_str,
-                    'department_code': f"{entity['entity_code']}_{dept_name.upper().replace(' ', '_')}",
-                    'department_name': dept_name,
-                    'entity_id': entity_id,  # Match schema order
-                    'parent_department_id': '',
-                    'manager_employee_id': '',  # Match schema field name
-                    'cost_center_id': self._get_random_cost_center(entity_id),
-                    'department_type': dept_config['type'],  # Match schema order
-                    'location': '',  # Add missing field
-                    'is_active': True,
-                    'created_date': '2023-01-01 00:00:00'
-                }
+                dept_id_str = next(dept_ids)
+                department = Department(
+                    department_id=dept_id_str,
+                    department_code=f"{entity_code}_{name_codes[dept_name]}",
+                    department_name=dept_name,
+                    entity_id=entity_id,  # Match schema order
+                    parent_department_id='',
+                    manager_employee_id='',  # Match schema field name
+                    cost_center_id=self.random.choice(entity_cost_center_ids) if entity_cost_center_ids else '',
+                    department_type=dept_config['type'],  # Match schema order
+                    location='',  # Add missing field
+                    is_active=True,
+                    created_date='2023-01-01 00:00:00'
+                )
                 departments.append(department)
                 entity_depts[dept_name] = dept_id_str
-                dept_id += 1
                 
                 # Create child departments
                 for child_name, child_config in dept_config['children'].items():
-                    child_dept_id = f"DEPT_{dept_id:06d}"
-                    child_department = {
-                        'department_id': child_dept_id,
-                        'department_code': f"{entity['entity_code']}_{child_name.upper().replace(' ', '_')}",
-                        'department_name': child_name,
-                        'entity_id': entity_id,  # Match schema order
-                        'parent_department_id': dept_id_str,
-                        'manager_employee_id': '',  # Match schema field name
-                        'cost_center_id': self._get_random_cost_center(entity_id),
-                        'department_type': child_config['type'],  # Match schema order
-                        'location': '',  # Add missing field
-                        'is_active': True,
-                        'created_date': '2023-01-01 00:00:00'
-                    }
+                    child_dept_id = next(dept_ids)
+                    child_department = Department(
+                        department_id=child_dept_id,
+                        department_code=f"{entity_code}_{name_codes[child_name]}",
+                        department_name=child_name,
+                        entity_id=entity_id,  # Match schema order
+                        parent_department_id=dept_id_str,
+                        manager_employee_id='',  # Match schema field name
+                        cost_center_id=self.random.choice(entity_cost_center_ids) if entity_cost_center_ids else '',
+                        department_type=child_config['type'],  # Match schema order
+                        location='',  # Add missing field
+                        is_active=True,
+                        created_date='2023-01-01 00:00:00'
+                    )
                     departments.append(child_department)
                     entity_depts[child_name] = child_dept_id
-                    dept_id += 1
         
-        self.departments = {d['department_id']: d for d in departments}
+        self.departments = {d.department_id: d for d in departments}
         
         print(f"Generated {len(departments)} departments across {len(self.finance_entities)} entities")
         return departments
     
-    def generate_job_positions(self) -> List[Dict]:
+    def generate_job_positions(self) -> List[Position]:
         """Generate job positions for each department."""
         print("📋 Generating job positions...")
         
         positions = []
-        pos_id = 1
-        
-        # Position templates by department type and job family
-        position_templates = {
-            'Executive': [
-                {'title': 'Chief Executive Officer', 'level': 'EXECUTIVE', 'family': 'Executive', 'min_exp': 15, 'max_exp': 25},
-                {'title': 'Chief Financial Officer', 'level': 'EXECUTIVE', 'family': 'Finance', 'min_exp': 12, 'max_exp': 20},
-                {'title': 'Chief Technology Officer', 'level': 'EXECUTIVE', 'family': 'IT', 'min_exp': 12, 'max_exp': 18}
-            ],
-            'Finance': [
-                {'title': 'Finance Director', 'level': 'DIRECTOR', 'family': 'Finance', 'min_exp': 8, 'max_exp': 15},
-                {'title': 'Finance Manager', 'level': 'MANAGER', 'family': 'Finance', 'min_exp': 5, 'max_exp': 10},
-                {'title': 'Senior Financial Analyst', 'level': 'SENIOR', 'family': 'Finance', 'min_exp': 3, 'max_exp': 7},
-                {'title': 'Financial Analyst', 'level': 'JUNIOR', 'family': 'Finance', 'min_exp': 1, 'max_exp': 4}
-            ],
-            'HR': [
-                {'title': 'HR Director', 'level': 'DIRECTOR', 'family': 'HR', 'min_exp': 8, 'max_exp': 15},
-                {'title': 'HR Business Partner', 'level': 'SENIOR', 'family': 'HR', 'min_exp': 4, 'max_exp': 8},
-                {'title': 'HR Coordinator', 'level': 'JUNIOR', 'family': 'HR', 'min_exp': 1, 'max_exp': 4}
-            ],
-            'IT': [
-                {'title': 'IT Director', 'level': 'DIRECTOR', 'family': 'IT', 'min_exp': 8, 'max_exp': 15},
-                {'title': 'Senior Software Engineer', 'level': 'SENIOR', 'family': 'IT', 'min_exp': 4, 'max_exp': 8},
-                {'title': 'Software Engineer', 'level': 'JUNIOR', 'family': 'IT', 'min_exp': 1, 'max_exp': 4},
-                {'title': 'IT Support Specialist', 'level': 'JUNIOR', 'family': 'IT', 'min_exp': 1, 'max_exp': 3}
-            ],
-            'Marketing': [
-                {'title': 'Marketing Director', 'level': 'DIRECTOR', 'family': 'Marketing', 'min_exp': 6, 'max_exp': 12},
-                {'title': 'Marketing Manager', 'level': 'MANAGER', 'family': 'Marketing', 'min_exp': 3, 'max_exp': 8},
-                {'title': 'Digital Marketing Specialist', 'level': 'JUNIOR', 'family': 'Marketing', 'min_exp': 1, 'max_exp': 4}
-            ],
-            'Store Operations': [
-                {'title': 'Store Manager', 'level': 'MANAGER', 'family': 'Retail', 'min_exp': 3, 'max_exp': 8},
-                {'title': 'Assistant Store Manager', 'level': 'LEAD', 'family': 'Retail', 'min_exp': 2, 'max_exp': 5},
-                {'title': 'Sales Associate', 'level': 'ENTRY', 'family': 'Retail', 'min_exp': 0, 'max_exp': 3}
-            ],
-            'Logistics': [
-                {'title': 'Logistics Manager', 'level': 'MANAGER', 'family': 'Operations', 'min_exp': 4, 'max_exp': 8},
-                {'title': 'Warehouse Supervisor', 'level': 'LEAD', 'family': 'Operations', 'min_exp': 2, 'max_exp': 6},
-                {'title': 'Warehouse Worker', 'level': 'ENTRY', 'family': 'Operations', 'min_exp': 0, 'max_exp': 2}
-            ]
-        }
         
-        # Generate positions for each department
+        # Resolve the templates for every department first, so salary ranges
+        # can be computed for all positions at once
+        position_specs = []
         for dept_id, dept in self.departments.items():
-            dept_name = dept['department_name']
-            entity_id = dept['entity_id']
-            country_code = self._get_country_from_entity(entity_id)
+            dept_name = dept.department_name
+            entity_id = dept.entity_id
+            country_code = self._country_by_entity[entity_id]
             country_config = self.countries.get(country_code, self.countries['NL'])
             
             # Get position templates for this department
-            templates = position_templates.get(dept_name, [
+            templates = POSITION_TEMPLATES.get(dept_name, [
                 {'title': f"{dept_name} Manager", 'level': 'MANAGER', 'family': 'Management', 'min_exp': 3, 'max_exp': 8},
                 {'title': f"Senior {dept_name} Specialist", 'level': 'SENIOR', 'family': 'Operations', 'min_exp': 2, 'max_exp': 5},
                 {'title': f"{dept_name} Specialist", 'level': 'JUNIOR', 'family': 'Operations', 'min_exp': 0, 'max_exp': 3}
             ])
             
             for template in templates:
-                pos_id_str = f"POS_{pos_id:06d}"
-                
-                # Calculate salary range based on job family and country
-                family_config = self.job_families.get(template['family'], self.job_families['Operations'])
-                base_salary = country_config['avg_salary']
-                min_salary = base_salary * family_config['multiplier'] * 0.8
-                max_salary = base_salary * family_config['multiplier'] * 1.4
-                
-                # Adjust by level
-                level_multipliers = {
-                    'ENTRY': 0.7, 'JUNIOR': 0.85, 'SENIOR': 1.0, 
-                    'LEAD': 1.2, 'MANAGER': 1.5, 'DIRECTOR': 2.0, 'EXECUTIVE': 3.0
-                }
-                multiplier = level_multipliers.get(template['level'], 1.0)
-                min_salary *= multiplier
-                max_salary *= multiplier
-                
-                # Determine reporting position (higher level position in same department or parent department)
-                reporting_position_id = None
-                if template['level'] != 'EXECUTIVE':
-                    # Find a higher-level position in the same department or parent
-                    hierarchy = ['EXECUTIVE', 'DIRECTOR', 'MANAGER', 'LEAD', 'SENIOR', 'JUNIOR', 'ENTRY']
-                    current_level_idx = hierarchy.index(template['level']) if template['level'] in hierarchy else len(hierarchy)
-                    
-                    # Look for positions with higher level (lower index in hierarchy)
-                    for existing_pos in positions:
-                        if (existing_pos['department_id'] == dept_id and 
-                            existing_pos['position_level'] in hierarchy and
-                            hierarchy.index(existing_pos['position_level']) < current_level_idx):
-                            reporting_position_id = existing_pos['position_id']
-                            break
-                
-                # Employment type and salary grade
-                employment_type = 'PERMANENT'  # Most positions are permanent
-                if template['level'] in ['ENTRY', 'JUNIOR'] and random.random() < 0.2:
-                    employment_type = 'TEMPORARY'  # 20% of junior positions are temporary
-                
-                salary_grade = f"GRADE_{template['level'][:2]}{random.randint(1, 3)}"
-                
-                # Skills for the position
-                skills = self._get_skills_for_family(template['family'])
-                
-                # Remote work eligibility
-                remote_eligible = template['family'] in ['IT', 'Finance', 'HR', 'Marketing'] and random.random() < 0.7
-                
-                # Travel requirements
-                travel_percentage = 0
-                if template['level'] in ['DIRECTOR', 'EXECUTIVE']:
-                    travel_percentage = random.randint(10, 30)
-                elif template['family'] == 'Sales':
-                    travel_percentage = random.randint(5, 20)
-                
-                position = {
-                    'position_id': pos_id_str,
-                    'position_code': f"{dept['department_code']}_{template['title'].upper().replace(' ', '_')}",
-                    'position_title': template['title'],
-                    'department_id': dept_id,
-                    'reporting_position_id': reporting_position_id,  # Fixed: correct field name
-                    'position_level': template['level'],
-                    'employment_type': employment_type,  # Fixed: add missing field
-                    'salary_grade': salary_grade,  # Fixed: add missing field
-                    'min_salary_eur': Decimal(str(min_salary)).quantize(Decimal('0.01')),  # Fixed: correct field name
-                    'max_salary_eur': Decimal(str(max_salary)).quantize(Decimal('0.01')),  # Fixed: correct field name
-                    'country_code': country_code,  # Fixed: add missing field
-                    'required_skills': skills,
-                    'education_requirements': self._get_education_requirements(template['level']),
-                    'experience_years': template['max_exp'],  # Fixed: single field, not min/max
-                    'is_remote_eligible': remote_eligible,  # Fixed: add missing field
-                    'travel_percentage': travel_percentage,  # Fixed: add missing field
-                    'is_active': True,
-                    'created_date': '2023-01-01 00:00:00'
-                }
-                positions.append(position)
-                pos_id += 1
+                position_specs.append((dept_id, dept, country_code, country_config, template))
+        
+        # Code form of every position title, built once per distinct title
+        title_codes = {spec[4]['title']: spec[4]['title'].upper().replace(' ', '_') for spec in position_specs}
+        
+        # Salary range based on country, job family and level
+        base_salaries = np.array([spec[3]['avg_salary'] for spec in position_specs], dtype=float)
+        family_multipliers = np.array([
+            self.job_families.get(spec[4]['family'], self.job_families['Operations'])['multiplier']
+            for spec in position_specs
+        ])
+        level_factors = np.array([LEVEL_MULTIPLIERS.get(spec[4]['level'], 1.0) for spec in position_specs])
+        min_salaries = np.round(base_salaries * family_multipliers * 0.8 * level_factors, 2).tolist()
+        max_salaries = np.round(base_salaries * family_multipliers * 1.4 * level_factors, 2).tolist()
+        
+        # Position IDs, formatted in one pass now that the count is known
+        position_ids = [f"POS_{n:06d}" for n in range(1, len(position_specs) + 1)]
         
-        self.positions = {p['position_id']: p for p in positions}
+        # First position created at each level, per department, for reporting lines
+        hierarchy = POSITION_HIERARCHY
+        hierarchy_idx = POSITION_HIERARCHY_INDEX
+        dept_level_positions = defaultdict(dict)
+        
+        # Generate positions for each department
+        for i, (dept_id, dept, country_code, country_config, template) in enumerate(position_specs):
+            pos_id_str = position_ids[i]
+            
+            # Determine reporting position (higher level position in same department or parent department)
+            reporting_position_id = None
+            if template['level'] != 'EXECUTIVE':
+                # Find a higher-level position in the same department
+                level_positions = dept_level_positions[dept_id]
+                current_level_idx = hierarchy_idx.get(template['level'], len(hierarchy))
+                
+                # Look for positions with higher level (lower index in hierarchy)
+                for level in hierarchy[:current_level_idx]:
+                    if level in level_positions:
+                        reporting_position_id = level_positions[level]
+                        break
+            
+            # Employment type and salary grade
+            employment_type = 'PERMANENT'  # Most positions are permanent
+            if template['level'] in ['ENTRY', 'JUNIOR'] and self.random.random() < 0.2:
+                employment_type = 'TEMPORARY'  # 20% of junior positions are temporary
+            
+            salary_grade = f"GRADE_{template['level'][:2]}{self.random.randint(1, 3)}"
+            
+            # Skills for the position
+            skills = self._get_skills_for_family(template['family'])
+            
+            # Remote work eligibility
+            remote_eligible = template['family'] in ['IT', 'Finance', 'HR', 'Marketing'] and self.random.random() < 0.7
+            
+            # Travel requirements
+            travel_percentage = 0
+            if template['level'] in ['DIRECTOR', 'EXECUTIVE']:
+                travel_percentage = self.random.randint(10, 30)
+            elif template['family'] == 'Sales':
+                travel_percentage = self.random.randint(5, 20)
+            
+            position = Position(
+                position_id=pos_id_str,
+                position_code=f"{dept.department_code}_{title_codes[template['title']]}",
+                position_title=template['title'],
+                department_id=dept_id,
+                reporting_position_id=reporting_position_id,  # Fixed: correct field name
+                position_level=template['level'],
+                employment_type=employment_type,  # Fixed: add missing field
+                salary_grade=salary_grade,  # Fixed: add missing field
+                min_salary_eur=f"{min_salaries[i]:.2f}",  # Fixed: correct field name
+                max_salary_eur=f"{max_salaries[i]:.2f}",  # Fixed: correct field name
+                country_code=country_code,  # Fixed: add missing field
+                required_skills=skills,
+                education_requirements=self._get_education_requirements(template['level']),
+                experience_years=template['max_exp'],  # Fixed: single field, not min/max
+                is_remote_eligible=remote_eligible,  # Fixed: add missing field
+                travel_percentage=travel_percentage,  # Fixed: add missing field
+                is_active=True,
+                created_date='2023-01-01 00:00:00'
+            )
+            positions.append(position)
+            dept_level_positions[dept_id].setdefault(template['level'], pos_id_str)
+        
+        self.positions = {p.position_id: p for p in positions}
+        
+        # Infer job family from position title since job_family field doesn't
+        # exist in schema; done once per position for the training matching
+        self.position_families = {p.position_id: infer_job_family(p.position_title) for p in positions}
         
         print(f"Generated {len(positions)} job positions")
         return positions
     
-    def generate_employees(self) -> List[Dict]:
-        """Generate employee master data."""
+    def generate_employees(self) -> Iterator[Employee]:
+        """Generate employee master data, yielding each record as it is built.
+        
+        Each entity is generated in its own worker process. Only an
+        EmployeeRef per employee is kept (in self.employee_refs); the full
+        records go straight to the CSV writer. Once all shards are in, the
+        refs are also laid out for the downstream generators: as a list, as a
+        list of the active employees, as hire/termination/birth ordinal and
+        hire month arrays, and as their indexes in hire date order.
+        """
         print("👥 Generating employees...")
         
-        employees = []
-        emp_id = 1
+        self.employee_refs = {}
+        entities = self.finance_entities
+        if not entities:
+            print("Generated 0 employees across 0 entities")
+            return
         
-        # Generate employees for each entity
-        for entity in self.finance_entities:
-            if entity['entity_type'] == 'HOLDING':
-                num_employees = random.randint(15, 25)  # Small holding company
-            else:
-                num_employees = random.randint(80, 150)  # Operating companies
-            
-            entity_id = entity['entity_id']
-            country_code = self._get_country_from_entity(entity_id)
-            faker = self.fakers[country_code]
-            country_config = self.countries[country_code]
+        # Draw the headcount per entity up front so every entity knows where
+        # its employee IDs start
+        randint = self.random.randint
+        employee_counts = [
+            randint(15, 25) if entity['entity_type'] == 'HOLDING' else randint(80, 150)  # Small holding vs operating companies
+            for entity in entities
+        ]
+        first_emp_ids = list(itertools.accumulate(employee_counts[:-1], initial=1))
+        country_codes = [self._country_by_entity[entity['entity_id']] for entity in entities]
+        
+        # A separate seed per entity keeps the workers' random streams independent
+        seeds = self.rng.integers(0, 2**32, size=len(entities)).tolist()
+        max_workers = min(len(entities), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            shards = executor.map(
+                generate_entity_employees,
+                entities,
+                country_codes,
+                itertools.repeat(list(self.countries)),
+                [self.countries[country_code]['locales'][0] for country_code in country_codes],
+                employee_counts,
+                first_emp_ids,
+                seeds,
+                itertools.repeat(self.faker_cache_dir)
+            )
             
-            for _ in range(num_employees):
-                emp_id_str = f"EMP_{emp_id:06d}"
-                
-                # Generate realistic personal data
-                gender = random.choice(['MALE', 'FEMALE', 'NON_BINARY', 'PREFER_NOT_TO_SAY'])
-                if gender == 'MALE':
-                    first_name = faker.first_name_male()
-                    title = 'MR'
-                elif gender == 'FEMALE':
-                    first_name = faker.first_name_female()
-                    title = random.choice(['MS', 'MRS'])
-                else:
-                    first_name = faker.first_name()
-                    title = random.choice(['MR', 'MS'])
-                
-                last_name = faker.last_name()
-                birth_date = faker.date_of_birth(minimum_age=18, maximum_age=65)
-                hire_date = faker.date_between(start_date=date(2018, 1, 1), end_date=date(2024, 6, 30))
-                
-                # Employment status based on hire date and random factors
-                if hire_date > date(2024, 1, 1):
-                    status = 'ACTIVE'
-                    termination_date = None
-                    termination_reason = None
-                else:
-                    # 5% chance of termination for older employees
-                    if random.random() < 0.05:
-                        status = 'TERMINATED'
-                        termination_date = faker.date_between(start_date=hire_date + timedelta(days=90), end_date=date.today())
-                        termination_reason = random.choice(['RESIGNATION', 'TERMINATION', 'REDUNDANCY', 'RETIREMENT'])
-                    elif random.random() < 0.02:
-                        status = 'ON_LEAVE'
-                        termination_date = None
-                        termination_reason = None
-                    else:
-                        status = 'ACTIVE'
-                        termination_date = None
-                        termination_reason = None
-                
-                # Generate work and personal contact information
-                work_email = f"{first_name.lower()}.{last_name.lower()}@eurostyle{country_code.lower()}.com"
-                personal_email = faker.email()
-                
-                employee = {
-                    'employee_id': emp_id_str,
-                    'employee_number': f"{entity['entity_code']}{emp_id:06d}",
-                    'entity_id': entity_id,
-                    'personal_email': personal_email,
-                    'work_email': work_email,
-                    'title': title,
-                    'first_name': first_name,
-                    'middle_name': faker.first_name() if random.random() < 0.3 else '',
-                    'last_name': last_name,
-                    'preferred_name': first_name if random.random() < 0.9 else faker.first_name(),
-                    'date_of_birth': birth_date.strftime('%Y-%m-%d'),
-                    'gender': gender,
-                    'nationality': country_code,
-                    'country_of_birth': country_code if random.random() < 0.8 else random.choice(list(self.countries.keys())),
-                    'marital_status': random.choice(['SINGLE', 'MARRIED', 'DIVORCED', 'WIDOWED', 'DOMESTIC_PARTNERSHIP']),
-                    'number_of_dependents': random.choices([0, 1, 2, 3, 4], weights=[30, 25, 25, 15, 5])[0],
-                    
-                    # Contact information
-                    'phone_mobile': faker.phone_number(),
-                    'phone_home': faker.phone_number() if random.random() < 0.7 else '',
-                    'emergency_contact_name': faker.name(),
-                    'emergency_contact_phone': faker.phone_number(),
-                    'emergency_contact_relationship': random.choice(['SPOUSE', 'PARENT', 'SIBLING', 'CHILD', 'FRIEND']),
-                    
-                    # Address information
-                    'address_street': faker.street_address(),
-                    'address_city': faker.city(),
-                    'address_state': faker.state() if country_code in ['DE', 'US'] else '',
-                    'address_postal_code': faker.postcode(),
-                    'address_country': country_code,
-                    
-                    # Legal and compliance (simplified for demo)
-                    'social_security_number': f"***-**-{random.randint(1000, 9999)}",  # Masked
-                    'tax_id': f"{country_code}{random.randint(100000, 999999)}",
-                    'passport_number': f"{country_code}{random.randint(1000000, 9999999)}",
-                    'passport_expiry_date': (date.today() + timedelta(days=random.randint(365, 3650))).strftime('%Y-%m-%d'),
-                    'visa_status': 'EU_CITIZEN' if random.random() < 0.9 else random.choice(['WORK_PERMIT', 'OTHER']),
-                    'visa_expiry_date': (date.today() + timedelta(days=random.randint(365, 1825))).strftime('%Y-%m-%d') if random.random() < 0.1 else '',
-                    'work_permit_required': random.random() < 0.1,
-                    'work_permit_expiry_date': (date.today() + timedelta(days=random.randint(365, 1825))).strftime('%Y-%m-%d') if random.random() < 0.1 else '',
-                    
-                    # Employment status
-                    'employee_status': status,
-                    'hire_date': hire_date.strftime('%Y-%m-%d'),
-                    'termination_date': termination_date.strftime('%Y-%m-%d') if termination_date else '',
-                    'termination_reason': termination_reason or '',
-                    'rehire_eligible': random.random() < 0.8,
-                    'created_date': '2023-01-01 00:00:00',
-                    'updated_date': '2024-01-01 00:00:00'
-                }
-                employees.append(employee)
-                emp_id += 1
-        
-        self.employees = {e['employee_id']: e for e in employees}
-        
-        print(f"Generated {len(employees)} employees across {len(self.finance_entities)} entities")
-        return employees
+            # Shards arrive in entity order, so employee IDs stay contiguous
+            for entity_employees, country_code in zip(shards, country_codes):
+                for employee in entity_employees:
+                    self.employee_refs[employee.employee_id] = EmployeeRef(
+                        employee.employee_id,
+                        employee.entity_id,
+                        country_code,
+                        employee.employee_status,
+                        employee.hire_date,
+                        employee.termination_date,
+                        employee.date_of_birth
+                    )
+                    yield employee
+        
+        # Employees without a termination date never drop out
+        self.employee_ref_list = list(self.employee_refs.values())
+        self.active_employee_refs = [
+            employee for employee in self.employee_ref_list if employee.employee_status == 'ACTIVE'
+        ]
+        self.employee_hire_ords = np.array(
+            [employee.hire_date.toordinal() for employee in self.employee_ref_list], dtype=np.int64
+        )
+        self.employee_termination_ords = np.array([
+            employee.termination_date.toordinal() if employee.termination_date else date.max.toordinal()
+            for employee in self.employee_ref_list
+        ], dtype=np.int64)
+        self.employee_hire_months = np.array(
+            [employee.hire_date.year * 12 + employee.hire_date.month for employee in self.employee_ref_list], dtype=np.int64
+        )
+        self.employee_birth_ords = np.array(
+            [employee.date_of_birth.toordinal() for employee in self.employee_ref_list], dtype=np.int64
+        )
+        self.employee_hire_order = np.argsort(self.employee_hire_ords, kind='stable')
+        self.sorted_hire_ords = self.employee_hire_ords[self.employee_hire_order]
+        
+        print(f"Generated {len(self.employee_refs)} employees across {len(entities)} entities")
     
-    def generate_employment_contracts(self) -> List[Dict]:
-        """Generate employment contracts for employees."""
+    def active_employees_at(self, ordinal: int) -> np.ndarray:
+        """Return the employee_ref_list indexes of the employees active on a date ordinal.
+        
+        Employees hired by then are a prefix of employee_hire_order, found by
+        binary search, so only that prefix is checked for termination.
+        Indexes come back in employee_ref_list order.
+        """
+        hired = self.employee_hire_order[:np.searchsorted(self.sorted_hire_ords, ordinal, side='right')]
+        return np.sort(hired[self.employee_termination_ords[hired] >= ordinal])
+    
+    def generate_employment_contracts(self) -> Iterator[Dict]:
+        """Generate employment contracts for employees, yielding each as it is built.
+        
+        Contracts are also kept in self.contracts, and indexed by employee in
+        self.contracts_by_employee, for the downstream generators.
+        """
         print("📄 Generating employment contracts...")
         
-        contracts = []
-        contract_id = 1
+        self.contracts = {}
+        self.contracts_by_employee = defaultdict(list)
+        
+        # Index positions by entity (through their department) and stores by country once
+        positions_by_entity = defaultdict(list)
+        for position in self.positions.values():
+            positions_by_entity[self.departments[position.department_id].entity_id].append(position)
+        
+        stores_by_country = defaultdict(list)
+        for store in self.stores:
+            stores_by_country[store.get('country', 'NL')].append(store)
         
-        for emp_id, employee in self.employees.items():
-            entity_id = employee['entity_id']
-            country_code = self._get_country_from_entity(entity_id)
+        # Contract type and work schedule for every employee, drawn up front
+        rng = self.rng
+        contract_types = rng.choice(CONTRACT_TYPES, size=len(self.employee_refs), p=CONTRACT_TYPE_WEIGHTS).tolist()
+        work_schedules = rng.choice(WORK_SCHEDULES, size=len(self.employee_refs), p=WORK_SCHEDULE_WEIGHTS).tolist()
+        
+        # At most one contract per employee; IDs are taken in order
+        contract_ids = iter([f"CONT_{n:08d}" for n in range(1, len(self.employee_refs) + 1)])
+        
+        for i, (emp_id, employee) in enumerate(self.employee_refs.items()):
+            entity_id = employee.entity_id
+            country_code = employee.country_code
             country_config = self.countries[country_code]
             
             # Get suitable positions for this entity
-            entity_positions = [p for p in self.positions.values() 
-                              if p['department_id'] in [d['department_id'] for d in self.departments.values() if d['entity_id'] == entity_id]]
+            entity_positions = positions_by_entity[entity_id]
             
             if not entity_positions:
                 continue
             
-            position = random.choice(entity_positions)
-            department = self.departments[position['department_id']]
+            position = self.random.choice(entity_positions)
+            department = self.departments[position.department_id]
             
             # Contract details
-            hire_date = datetime.strptime(employee['hire_date'], '%Y-%m-%d').date()
-            contract_type = random.choices(
-                ['PERMANENT', 'TEMPORARY', 'INTERNSHIP', 'CONTRACTOR'],
-                weights=[75, 15, 7, 3]
-            )[0]
+            hire_date = employee.hire_date
+            contract_type = contract_types[i]
             
             # Contract terms based on country regulations
             if contract_type == 'PERMANENT':
                 # Some permanent contracts have theoretical end dates for compliance/review
-                if random.random() < 0.05:  # 5% have formal review dates
-                    end_date = hire_date + timedelta(days=random.randint(1095, 1825))  # 3-5 years
+                if self.random.random() < 0.05:  # 5% have formal review dates
+                    end_date = hire_date + timedelta(days=self.random.randint(1095, 1825))  # 3-5 years
                 else:
                     end_date = None
-                probation_months = random.choice([3, 6])  # Standard probation
-                notice_weeks = random.choice([4, 8, 12])  # Based on tenure
+                probation_months = self.random.choice([3, 6])  # Standard probation
+                notice_weeks = self.random.choice([4, 8, 12])  # Based on tenure
             elif contract_type == 'TEMPORARY':
-                end_date = hire_date + timedelta(days=random.randint(180, 730))
+                end_date = hire_date + timedelta(days=self.random.randint(180, 730))
                 probation_months = 1
                 notice_weeks = 2
             else:  # INTERNSHIP, CONTRACTOR
-                end_date = hire_date + timedelta(days=random.randint(90, 365))
+                end_date = hire_date + timedelta(days=self.random.randint(90, 365))
                 probation_months = 0 if contract_type == 'CONTRACTOR' else 1
                 notice_weeks = 1
             
             # Working arrangements
-            working_hours = country_config['working_hours'] + random.uniform(-5, 5)
-            work_schedule = random.choices(
-                ['FULL_TIME', 'PART_TIME', 'FLEXIBLE', 'SHIFT_WORK'],
-                weights=[70, 20, 8, 2]
-            )[0]
+            working_hours = country_config['working_hours'] + self.random.uniform(-5, 5)
+            work_schedule = work_schedules[i]
             
             if work_schedule == 'PART_TIME':
-                working_hours *= random.uniform(0.5, 0.8)
+                working_hours *= self.random.uniform(0.5, 0.8)
             
-            remote_allowed = random.random() < 0.4  # 40% can work remotely
-            remote_days = random.randint(1, 3) if remote_allowed else 0
+            remote_allowed = self.random.random() < 0.4  # 40% can work remotely
+            remote_days = self.random.randint(1, 3) if remote_allowed else 0
             
             # Get store assignment if retail
             store_id = ''
-            if department['department_type'] == 'RETAIL' and self.stores:
+            if department.department_type == 'RETAIL' and self.stores:
                 # Try to match store to entity country
-                entity_stores = [s for s in self.stores if s.get('country', 'NL') == country_code]
+                entity_stores = stores_by_country[country_code]
                 if entity_stores:
-                    store_id = random.choice(entity_stores)['store_id']
+                    store_id = self.random.choice(entity_stores)['store_id']
                 else:
-                    store_id = random.choice(self.stores)['store_id']
+                    store_id = self.random.choice(self.stores)['store_id']
             
             contract = {
-                'contract_id': f"CONT_{contract_id:08d}",
+                'contract_id': next(contract_ids),
                 'employee_id': emp_id,
                 'contract_type': contract_type,
-                'contract_status': 'ACTIVE' if employee['employee_status'] == 'ACTIVE' else 'TERMINATED',
-                'position_id': position['position_id'],
-                'department_id': department['department_id'],
+                'contract_status': 'ACTIVE' if employee.employee_status == 'ACTIVE' else 'TERMINATED',
+                'position_id': position.position_id,
+                'department_id': department.department_id,
                 'manager_id': '',  # Will be populated later
                 
                 # Contract terms
-                'start_date': hire_date.strftime('%Y-%m-%d'),
-                'end_date': end_date.strftime('%Y-%m-%d') if end_date else '',
+                'start_date': hire_date,
+                'end_date': end_date,
                 'probation_period_months': probation_months,
                 'notice_period_weeks': notice_weeks,
-                'working_hours_per_week': Decimal(str(working_hours)).quantize(Decimal('0.1')),
+                'working_hours_per_week': one_decimal(working_hours),
                 'work_schedule': work_schedule,
                 'remote_work_allowed': remote_allowed,
                 'remote_work_days_per_week': remote_days,
@@ -641,148 +1629,69 @@ class EuroStyleHRGenerator:
                 'reports_to_employee_id': '',  # Will be set later
                 
                 # Legal compliance
-                'collective_bargaining_agreement': f"{country_code}_RETAIL_CBA" if department['department_type'] == 'RETAIL' else '',
-                'union_membership': random.random() < 0.3,  # 30% union membership
+                'collective_bargaining_agreement': f"{country_code}_RETAIL_CBA" if department.department_type == 'RETAIL' else '',
+                'union_membership': self.random.random() < 0.3,  # 30% union membership
                 
                 'created_date': '2023-01-01 00:00:00',
-                'signed_date': hire_date.strftime('%Y-%m-%d'),
-                'terminated_date': employee['termination_date'] if employee['termination_date'] else ''
+                'signed_date': hire_date,
+                'terminated_date': employee.termination_date
             }
-            contracts.append(contract)
-            contract_id += 1
-        
-        self.contracts = {c['contract_id']: c for c in contracts}
+            self.contracts[contract['contract_id']] = contract
+            self.contracts_by_employee[emp_id].append(contract)
+            yield contract
         
-        print(f"Generated {len(contracts)} employment contracts")
-        return contracts
+        print(f"Generated {len(self.contracts)} employment contracts")
     
-    def generate_compensation_history(self) -> List[Dict]:
-        """Generate compensation history with salary changes matching database schema."""
-        print("💰 Generating compensation history...")
+    def generate_compensation_history(self) -> List[Tuple]:
+        """Generate compensation history with salary changes matching database schema.
         
-        compensation_records = []
-        comp_id = 1
+        Contracts are grouped by entity and each entity's history is built
+        by generate_entity_compensation in its own worker process. Rows are
+        tuples in COMPENSATION_HISTORY_FIELDS order.
+        """
+        print("💰 Generating compensation history...")
         
-        # Generate realistic compensation changes for each employee
+        # Contracts arrive in employee order, so grouping by entity keeps
+        # every entity's records together and in order
+        contracts_by_entity = defaultdict(list)
         for contract in self.contracts.values():
-            employee = self.employees[contract['employee_id']]
-            position = self.positions[contract['position_id']]
-            country_code = self._get_country_from_entity(employee['entity_id'])
-            hire_date = datetime.strptime(contract['start_date'], '%Y-%m-%d').date()
-            
-            # Calculate base salary from position range
-            min_salary = float(position['min_salary_eur'])  # Fixed: correct field name
-            max_salary = float(position['max_salary_eur'])  # Fixed: correct field name
-            initial_salary = random.uniform(min_salary, max_salary * 0.8)  # Start lower for growth
-            
-            # Adjust for part-time
-            if contract['work_schedule'] == 'PART_TIME':
-                initial_salary *= random.uniform(0.6, 0.8)
-            
-            current_salary = initial_salary
-            
-            # Generate multiple compensation changes over employment period
-            change_dates = []
-            
-            # Initial hire record
-            change_dates.append((hire_date, 'HIRE'))
-            
-            # Add periodic reviews/promotions
-            review_date = hire_date + timedelta(days=365)  # Annual reviews
-            while review_date < date(2024, 8, 31):
-                if random.random() < 0.7:  # 70% chance of salary change each year
-                    change_type = random.choices(
-                        ['ANNUAL_REVIEW', 'PROMOTION', 'MARKET_ADJUSTMENT', 'MERIT_INCREASE'],
-                        weights=[50, 15, 20, 15]
-                    )[0]
-                    change_dates.append((review_date, change_type))
-                
-                review_date += timedelta(days=365)
-            
-            # Generate compensation records for each change
-            for i, (change_date, change_reason) in enumerate(change_dates):
-                previous_salary = current_salary if i > 0 else None
-                
-                # Calculate new salary based on change type
-                if change_reason == 'HIRE':
-                    new_salary = initial_salary
-                    change_percentage = 0.0
-                elif change_reason == 'PROMOTION':
-                    increase = random.uniform(0.15, 0.30)  # 15-30% for promotion
-                    new_salary = current_salary * (1 + increase)
-                    change_percentage = increase * 100
-                elif change_reason == 'MARKET_ADJUSTMENT':
-                    increase = random.uniform(0.08, 0.15)  # 8-15% for market
-                    new_salary = current_salary * (1 + increase)
-                    change_percentage = increase * 100
-                else:  # ANNUAL_REVIEW or MERIT_INCREASE
-                    increase = random.uniform(0.02, 0.08)  # 2-8% for regular increases
-                    new_salary = current_salary * (1 + increase)
-                    change_percentage = increase * 100
-                
-                # Ensure salary doesn't exceed position max
-                new_salary = min(new_salary, max_salary)
-                current_salary = new_salary
-                
-                # Calculate benefits and bonuses
-                bonus_amount = None
-                equity_grant = None
-                health_contribution = None
-                other_benefits = None
-                
-                # Generate bonuses for certain change types and levels
-                if change_reason in ['PROMOTION', 'ANNUAL_REVIEW'] and position['position_level'] in ['SENIOR', 'LEAD', 'MANAGER', 'DIRECTOR', 'EXECUTIVE']:
-                    bonus_amount = Decimal(str(new_salary * random.uniform(0.05, 0.25))).quantize(Decimal('0.01'))
-                
-                # Equity grants for senior levels
-                if change_reason == 'PROMOTION' and position['position_level'] in ['DIRECTOR', 'EXECUTIVE']:
-                    equity_grant = Decimal(str(random.uniform(5000, 50000))).quantize(Decimal('0.01'))
-                
-                # Health insurance contribution (company portion)
-                if random.random() < 0.8:  # 80% of employees get health contribution
-                    health_contribution = Decimal(str(random.uniform(150, 400))).quantize(Decimal('0.01'))  # Monthly
-                
-                # Other benefits (meal vouchers, transport, etc.)
-                if random.random() < 0.6:  # 60% get additional benefits
-                    other_benefits = Decimal(str(random.uniform(50, 200))).quantize(Decimal('0.01'))  # Monthly
-                
-                # Commission rate for sales positions (detect from position title)
-                commission_rate = None
-                if any(word in position['position_title'].lower() for word in ['sales', 'account', 'business development']):
-                    commission_rate = Decimal(str(random.uniform(0.02, 0.08))).quantize(Decimal('0.01'))
-                
-                # Pension contribution
-                pension_percentage = Decimal(str(random.uniform(3.0, 8.0))).quantize(Decimal('0.01'))
-                
-                compensation = {
-                    'compensation_id': f"COMP_{comp_id:08d}",
-                    'employee_id': contract['employee_id'],
-                    'effective_date': change_date.strftime('%Y-%m-%d'),
-                    'change_reason': change_reason,
-                    
-                    # Salary change tracking (matching database schema)
-                    'previous_base_salary_eur': Decimal(str(previous_salary)).quantize(Decimal('0.01')) if previous_salary else None,
-                    'new_base_salary_eur': Decimal(str(new_salary)).quantize(Decimal('0.01')),
-                    'salary_change_percentage': Decimal(str(change_percentage)).quantize(Decimal('0.01')),
-                    'currency': 'EUR',
-                    
-                    # Variable compensation
-                    'bonus_amount_eur': bonus_amount,
-                    'commission_rate': commission_rate,
-                    'equity_grant_value_eur': equity_grant,
-                    
-                    # Benefits
-                    'health_insurance_contribution_eur': health_contribution,
-                    'pension_contribution_percentage': pension_percentage,
-                    'other_benefits_eur': other_benefits,
-                    
-                    # Approval tracking
-                    'approved_by': f"MGR_{random.randint(1, 50)}",
-                    'hr_approved_by': f"HR_{random.randint(1, 10)}",
-                    'created_date': change_date.strftime('%Y-%m-%d') + ' 00:00:00'
-                }
-                compensation_records.append(compensation)
-                comp_id += 1
+            contracts_by_entity[self.employee_refs[contract['employee_id']].entity_id].append(contract)
+        if not contracts_by_entity:
+            print("Generated 0 compensation change records")
+            return []
+        
+        # Salary ranges as floats plus the variable-pay eligibility, worked
+        # out once per position: bonuses for senior levels (at promotions and
+        # annual reviews), equity grants for directors and executives (at
+        # promotions), and commission for sales positions (detected from the
+        # position title)
+        position_terms = {
+            position_id: (
+                float(position.min_salary_eur),  # Fixed: correct field name
+                float(position.max_salary_eur),  # Fixed: correct field name
+                position.position_level in ['SENIOR', 'LEAD', 'MANAGER', 'DIRECTOR', 'EXECUTIVE'],
+                position.position_level in ['DIRECTOR', 'EXECUTIVE'],
+                any(word in position.position_title.lower() for word in ['sales', 'account', 'business development'])
+            )
+            for position_id, position in self.positions.items()
+        }
+        
+        # A separate seed per entity keeps the workers' random streams independent
+        seeds = self.rng.integers(0, 2**32, size=len(contracts_by_entity)).tolist()
+        max_workers = min(len(contracts_by_entity), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            shards = list(executor.map(
+                generate_entity_compensation,
+                contracts_by_entity.values(),
+                itertools.repeat(position_terms),
+                seeds
+            ))
+        
+        # Join the entities' columns and number the records sequentially
+        columns = [list(itertools.chain.from_iterable(column)) for column in zip(*shards)]
+        comp_ids = [f"COMP_{comp_id:08d}" for comp_id in range(1, len(columns[0]) + 1)]
+        compensation_records = list(zip(comp_ids, *columns))
         
         print(f"Generated {len(compensation_records)} compensation change records")
         return compensation_records
@@ -793,83 +1702,115 @@ class EuroStyleHRGenerator:
         
         leave_requests = []
         leave_balances = []
-        request_id = 1
-        balance_id = 1
         
-        for emp_id, employee in self.employees.items():
-            if employee['employee_status'] != 'ACTIVE':
-                continue
-            
-            country_code = self._get_country_from_entity(employee['entity_id'])
-            country_config = self.countries[country_code]
-            
-            # Generate leave balances for 2023 and 2024
-            for year in [2023, 2024]:
-                for leave_type in ['ANNUAL', 'SICK', 'PERSONAL']:
-                    if leave_type == 'ANNUAL':
-                        entitlement = country_config['annual_leave']
-                    elif leave_type == 'SICK':
-                        entitlement = 365  # Simplified
-                    else:
-                        entitlement = 5  # Personal leave
-                    
-                    used = random.uniform(0, entitlement * 0.8)
-                    carried_forward = random.uniform(0, min(5, entitlement - used)) if leave_type == 'ANNUAL' else 0
-                    current_balance = entitlement + carried_forward - used
-                    
-                    balance = {
-                        'balance_id': f"BAL_{balance_id:08d}",
-                        'employee_id': emp_id,
-                        'leave_type': leave_type,
-                        'balance_year': year,
-                        'opening_balance': Decimal(str(carried_forward)).quantize(Decimal('0.1')),
-                        'accrued_days': Decimal(str(entitlement)).quantize(Decimal('0.1')),
-                        'used_days': Decimal(str(used)).quantize(Decimal('0.1')),
-                        'expired_days': Decimal('0.0'),
-                        'current_balance': Decimal(str(current_balance)).quantize(Decimal('0.1')),
-                        'statutory_minimum': Decimal(str(country_config['annual_leave'])).quantize(Decimal('0.1')) if leave_type == 'ANNUAL' else Decimal('0.0'),
-                        'company_entitlement': Decimal(str(entitlement)).quantize(Decimal('0.1')),
-                        'max_carryover': Decimal('5.0') if leave_type == 'ANNUAL' else Decimal('0.0'),
-                        'expiry_date': f"{year + 1}-03-31" if leave_type == 'ANNUAL' else '',
-                        'sick_leave_unlimited': leave_type == 'SICK',
-                        'long_term_illness_days': Decimal('0.0') if leave_type == 'SICK' else None,
-                        'last_updated': '2024-01-01',
-                        'created_date': '2024-01-01 00:00:00'
-                    }
-                    leave_balances.append(balance)
-                    balance_id += 1
+        active_employees = self.active_employee_refs
+        statutory_days = [
+            self.countries[employee.country_code]['annual_leave']
+            for employee in active_employees
+        ]
+        
+        # Leave balances for 2023 and 2024: one row per employee, year and leave
+        # type, with all amounts computed at once on (employee, year, type) arrays
+        balance_years = [2023, 2024]
+        balance_types = ['ANNUAL', 'SICK', 'PERSONAL']
+        rng = self.rng
+        entitlements = np.empty((len(active_employees), len(balance_years), len(balance_types)))
+        entitlements[:, :, 0] = np.array(statutory_days, dtype=float)[:, None]
+        entitlements[:, :, 1] = 365  # Simplified
+        entitlements[:, :, 2] = 5  # Personal leave
+        used = rng.uniform(0, entitlements * 0.8)
+        carried_forward = np.zeros_like(entitlements)
+        carried_forward[:, :, 0] = rng.uniform(0, np.minimum(5, entitlements[:, :, 0] - used[:, :, 0]))  # Annual leave only
+        current_balance = entitlements + carried_forward - used
+        
+        opening_days = np.round(carried_forward, 1).reshape(-1).tolist()
+        accrued_days = np.round(entitlements, 1).reshape(-1).tolist()
+        used_days = np.round(used, 1).reshape(-1).tolist()
+        balance_days = np.round(current_balance, 1).reshape(-1).tolist()
+        
+        balance_keys = itertools.product(
+            zip((employee.employee_id for employee in active_employees), statutory_days), balance_years, balance_types
+        )
+        for n, ((emp_id, statutory), year, leave_type) in enumerate(balance_keys):
+            leave_balances.append({
+                'balance_id': f"BAL_{n + 1:08d}",
+                'employee_id': emp_id,
+                'leave_type': leave_type,
+                'balance_year': year,
+                'opening_balance': opening_days[n],
+                'accrued_days': accrued_days[n],
+                'used_days': used_days[n],
+                'expired_days': 0.0,
+                'current_balance': balance_days[n],
+                'statutory_minimum': float(statutory) if leave_type == 'ANNUAL' else 0.0,
+                'company_entitlement': accrued_days[n],
+                'max_carryover': 5.0 if leave_type == 'ANNUAL' else 0.0,
+                'expiry_date': f"{year + 1}-03-31" if leave_type == 'ANNUAL' else '',
+                'sick_leave_unlimited': leave_type == 'SICK',
+                'long_term_illness_days': 0.0 if leave_type == 'SICK' else None,
+                'last_updated': '2024-01-01',
+                'created_date': '2024-01-01 00:00:00'
+            })
+        
+        # Generate 2-8 leave requests per active employee, with every start
+        # date drawn up front as an ordinal between the later of hire date and
+        # 2023-01-01, and 2024-08-31
+        request_counts = rng.integers(2, 9, len(active_employees))
+        earliest_starts = np.maximum(
+            [employee.hire_date.toordinal() for employee in active_employees],
+            date(2023, 1, 1).toordinal()
+        )
+        leave_start_ords = rng.integers(
+            np.repeat(earliest_starts, request_counts), date(2024, 8, 31).toordinal() + 1
+        ).tolist()
+        
+        # Leave type (weighted by common usage), sick leave duration and
+        # status for every request
+        num_requests_total = len(leave_start_ords)
+        leave_types = rng.choice(LEAVE_TYPES, size=num_requests_total, p=LEAVE_TYPE_WEIGHTS).tolist()
+        sick_durations = rng.choice(SICK_LEAVE_DURATIONS, size=num_requests_total, p=SICK_LEAVE_DURATION_WEIGHTS).tolist()
+        leave_statuses = rng.choice(LEAVE_STATUSES, size=num_requests_total, p=LEAVE_STATUS_WEIGHTS).tolist()
+        request_ids = [f"LR_{n:08d}" for n in range(1, num_requests_total + 1)]
+        
+        # The remaining per-request draws, one array each
+        parental_durations = rng.integers(10, 81, num_requests_total).tolist()
+        other_durations = rng.integers(1, 16, num_requests_total).tolist()
+        request_leads = rng.integers(1, 31, num_requests_total).tolist()
+        approval_delays = rng.integers(0, 4, num_requests_total).tolist()
+        sick_leave_types = rng.choice(SICK_LEAVE_TYPES, num_requests_total).tolist()
+        special_leave_types = rng.choice(SPECIAL_LEAVE_TYPES, num_requests_total).tolist()
+        rejection_reasons = rng.choice(LEAVE_REJECTION_REASONS, num_requests_total).tolist()
+        certificates_provided = (rng.random(num_requests_total) < 0.8).tolist()
+        approvers = rng.integers(1, 101, num_requests_total).tolist()
+        first_slots = itertools.accumulate(request_counts.tolist(), initial=0)
+        
+        # Doctor names for medical certificates come from a small pool of
+        # pre-formatted names instead of a Faker call per certificate
+        doctor_names = [f"Dr. {last_name}" for last_name in _faker_pool(self.fakers['NL'], 'last_name', DOCTOR_NAME_POOL_SIZE)]
+        doctor_picks = rng.integers(len(doctor_names), size=num_requests_total).tolist()
+        
+        for employee, num_requests, first_slot in zip(active_employees, request_counts.tolist(), first_slots):
+            emp_id = employee.employee_id
             
             # Generate some leave requests
-            hire_date = datetime.strptime(employee['hire_date'], '%Y-%m-%d').date()
-            
-            # Generate 2-8 leave requests per active employee
-            num_requests = random.randint(2, 8)
-            
-            for _ in range(num_requests):
-                # Random leave type weighted by common usage
-                leave_type = random.choices(
-                    ['ANNUAL', 'SICK', 'PERSONAL', 'MATERNITY', 'PATERNITY'],
-                    weights=[70, 20, 5, 3, 2]
-                )[0]
+            for k in range(first_slot, first_slot + num_requests):
+                leave_type = leave_types[k]
                 
                 # Generate reasonable leave dates
-                leave_start = self.fakers['NL'].date_between(
-                    start_date=max(hire_date, date(2023, 1, 1)),
-                    end_date=date(2024, 8, 31)
-                )
+                leave_start = date.fromordinal(leave_start_ords[k])
                 
                 if leave_type == 'SICK':
-                    duration = random.choices([1, 2, 3, 5, 10, 30], weights=[40, 25, 15, 10, 7, 3])[0]
+                    duration = sick_durations[k]
                 elif leave_type in ['MATERNITY', 'PATERNITY']:
-                    duration = random.randint(10, 80)
+                    duration = parental_durations[k]
                 else:
-                    duration = random.randint(1, 15)
+                    duration = other_durations[k]
                 
                 leave_end = leave_start + timedelta(days=duration - 1)
                 
                 # Determine request status and workflow
-                status = random.choices(['APPROVED', 'PENDING', 'REJECTED'], weights=[85, 10, 5])[0]
-                request_date = leave_start - timedelta(days=random.randint(1, 30))
+                status = leave_statuses[k]
+                request_date = leave_start - timedelta(days=request_leads[k])
                 
                 # Generate appropriate sub-types for demo purposes (simplified)
                 sick_leave_type = None
@@ -877,37 +1818,33 @@ class EuroStyleHRGenerator:
                 special_leave_type = None
                 
                 if leave_type == 'SICK':
-                    sick_leave_type = random.choice(['SHORT_TERM', 'CHRONIC', 'INJURY']) if duration > 5 else 'SHORT_TERM'
+                    sick_leave_type = sick_leave_types[k] if duration > 5 else 'SHORT_TERM'
                 elif leave_type in ['MATERNITY', 'PATERNITY']:
                     parental_leave_type = leave_type.lower()
                 elif leave_type == 'PERSONAL':
-                    special_leave_type = random.choice(['BEREAVEMENT', 'EMERGENCY', 'PERSONAL'])
+                    special_leave_type = special_leave_types[k]
                 
                 # Approval workflow
                 approval_date = None
                 rejection_reason = None
                 if status == 'APPROVED':
-                    approval_date = (request_date + timedelta(days=random.randint(0, 3))).strftime('%Y-%m-%d')
+                    approval_date = (request_date + timedelta(days=approval_delays[k])).isoformat()
                 elif status == 'REJECTED':
-                    rejection_reason = random.choice([
-                        'Insufficient leave balance',
-                        'Business needs - peak period',
-                        'Short notice - less than 48 hours',
-                        'Documentation incomplete'
-                    ])
+                    rejection_reason = rejection_reasons[k]
                 
                 # Sick leave compliance tracking
                 requires_medical = duration > 3 if leave_type == 'SICK' else False
-                medical_provided = random.random() < 0.8 if requires_medical else False
+                medical_provided = certificates_provided[k] if requires_medical else False
                 
+                request_date_str = request_date.isoformat()
                 request = {
-                    'leave_request_id': f"LR_{request_id:08d}",
+                    'leave_request_id': request_ids[k],
                     'employee_id': emp_id,
                     'leave_type': leave_type,
-                    'start_date': leave_start.strftime('%Y-%m-%d'),
-                    'end_date': leave_end.strftime('%Y-%m-%d'),
-                    'total_days': Decimal(str(duration)).quantize(Decimal('0.1')),
-                    'request_date': request_date.strftime('%Y-%m-%d'),
+                    'start_date': leave_start.isoformat(),
+                    'end_date': leave_end.isoformat(),
+                    'total_days': one_decimal(duration),
+                    'request_date': request_date_str,
                     
                     # Sub-types (optional fields for demo)
                     'sick_leave_type': sick_leave_type,
@@ -917,25 +1854,24 @@ class EuroStyleHRGenerator:
                     # Workflow fields
                     'status': status,  # Fixed: correct field name
                     'requested_by': emp_id,  # Fixed: populate requested_by
-                    'approved_by': f"MGR_{random.randint(1, 100)}",
+                    'approved_by': f"MGR_{approvers[k]}",
                     'approval_date': approval_date,  # Fixed: populate approval_date
                     'rejection_reason': rejection_reason,  # Fixed: populate rejection_reason
                     
                     # Medical compliance
                     'medical_certificate_required': requires_medical,
                     'medical_certificate_provided': medical_provided,
-                    'doctor_name': f"Dr. {self.fakers['NL'].last_name()}" if medical_provided else None,
+                    'doctor_name': doctor_names[doctor_picks[k]] if medical_provided else None,
                     
                     # Leave details
                     'statutory_entitlement': leave_type in ['ANNUAL', 'MATERNITY', 'PATERNITY'],
                     'paid_leave': leave_type != 'PERSONAL',
-                    'pay_percentage': Decimal('100.00') if leave_type != 'SICK' else Decimal('70.00'),
+                    'pay_percentage': '100.00' if leave_type != 'SICK' else '70.00',
                     'comments': self._get_leave_reason(leave_type),
                     
-                    'created_date': request_date.strftime('%Y-%m-%d') + ' 00:00:00'
+                    'created_date': request_date_str + ' 00:00:00'
                 }
                 leave_requests.append(request)
-                request_id += 1
         
         print(f"Generated {len(leave_requests)} leave requests and {len(leave_balances)} leave balances")
         return leave_requests, leave_balances
@@ -969,70 +1905,58 @@ class EuroStyleHRGenerator:
         # Generate performance reviews
         review_id = 1
         
+        employees = self.employee_ref_list
+        
         for cycle in cycles:
             cycle_year = cycle['cycle_year']
             
             # Only generate reviews for employees who were active during the cycle
-            eligible_employees = [
-                emp for emp in self.employees.values()
-                if (datetime.strptime(emp['hire_date'], '%Y-%m-%d').date() <= date(cycle_year, 6, 30) and
-                    (not emp['termination_date'] or 
-                     datetime.strptime(emp['termination_date'], '%Y-%m-%d').date() >= date(cycle_year, 6, 30)))
-            ]
+            mid_year = date(cycle_year, 6, 30).toordinal()
+            eligible_employees = [employees[i] for i in self.active_employees_at(mid_year).tolist()]
             
-            for employee in eligible_employees:
+            # Goal achievements and competency scores for every eligible employee
+            sales_achievements = self.rng.integers(80, 121, len(eligible_employees)).tolist()
+            satisfaction_scores = self.rng.uniform(4.0, 5.0, len(eligible_employees)).tolist()
+            competency_scores = self.rng.uniform(3.0, 5.0, (len(eligible_employees), 4)).tolist()
+            
+            # Overall goal and competency scores, their mean, and the rating
+            # band the mean falls in
+            goals_scores = self.rng.uniform(2.0, 5.0, len(eligible_employees))
+            overall_competency_scores = self.rng.uniform(2.5, 4.8, len(eligible_employees))
+            overall_scores = (goals_scores + overall_competency_scores) / 2
+            ratings = PERFORMANCE_RATINGS[np.digitize(overall_scores, PERFORMANCE_RATING_THRESHOLDS)].tolist()
+            goals_scores = goals_scores.tolist()
+            overall_competency_scores = overall_competency_scores.tolist()
+            overall_scores = overall_scores.tolist()
+            
+            for n, employee in enumerate(eligible_employees):
                 # Skip executives and very new employees
-                if random.random() < 0.1:  # 10% skip rate
+                if self.random.random() < 0.1:  # 10% skip rate
                     continue
                 
-                # Generate realistic performance data
-                goals_score = random.uniform(2.0, 5.0)
-                competency_score = random.uniform(2.5, 4.8)
-                overall_score = (goals_score + competency_score) / 2
-                
-                # Map score to rating
-                if overall_score >= 4.5:
-                    rating = 'EXCEEDS_EXPECTATIONS'
-                elif overall_score >= 3.5:
-                    rating = 'MEETS_EXPECTATIONS'
-                elif overall_score >= 2.5:
-                    rating = 'PARTIALLY_MEETS'
-                elif overall_score >= 1.5:
-                    rating = 'BELOW_EXPECTATIONS'
-                else:
-                    rating = 'UNSATISFACTORY'
+                rating = ratings[n]
                 
                 # Generate realistic goals and competencies (as JSON)
-                goals_json = json.dumps([
-                    {"goal": "Achieve sales target", "target": "100%", "achievement": f"{random.randint(80, 120)}%"},
-                    {"goal": "Customer satisfaction", "target": "4.5/5", "achievement": f"{random.uniform(4.0, 5.0):.1f}/5"},
-                    {"goal": "Team collaboration", "target": "Effective", "achievement": "Achieved"}
-                ])
-                
-                competencies_json = json.dumps({
-                    "leadership": random.uniform(3.0, 5.0),
-                    "communication": random.uniform(3.0, 5.0),
-                    "problem_solving": random.uniform(3.0, 5.0),
-                    "adaptability": random.uniform(3.0, 5.0)
-                })
+                goals_json = REVIEW_GOALS_JSON % (sales_achievements[n], satisfaction_scores[n])
+                competencies_json = REVIEW_COMPETENCIES_JSON % tuple(competency_scores[n])
                 
                 review = {
                     'review_id': f"REV_{review_id:08d}",
                     'cycle_id': cycle['cycle_id'],
-                    'employee_id': employee['employee_id'],
-                    'reviewer_id': f"MGR_{random.randint(1, 50)}",  # Mock manager ID
+                    'employee_id': employee.employee_id,
+                    'reviewer_id': f"MGR_{self.random.randint(1, 50)}",  # Mock manager ID
                     'review_period_start': f"{cycle_year}-01-01",
                     'review_period_end': f"{cycle_year}-12-31",
                     
                     # Goals and competencies
                     'goals_json': goals_json,
-                    'overall_goals_score': Decimal(str(goals_score)).quantize(Decimal('0.1')),
+                    'overall_goals_score': one_decimal(goals_scores[n]),
                     'competencies_json': competencies_json,
-                    'overall_competency_score': Decimal(str(competency_score)).quantize(Decimal('0.1')),
+                    'overall_competency_score': one_decimal(overall_competency_scores[n]),
                     
                     # Overall assessment
                     'overall_rating': rating,
-                    'overall_score': Decimal(str(overall_score)).quantize(Decimal('0.1')),
+                    'overall_score': one_decimal(overall_scores[n]),
                     
                     # Comments
                     'manager_comments': self._get_performance_comment(rating, True),
@@ -1041,11 +1965,11 @@ class EuroStyleHRGenerator:
                     'development_plan': self._get_development_plan(),
                     
                     # Calibration
-                    'calibrated_rating': rating if random.random() < 0.9 else None,
-                    'calibrated_by': 'HR_DIRECTOR' if random.random() < 0.9 else None,
-                    'calibrated_date': f"{cycle_year + 1}-01-15" if random.random() < 0.9 else None,
+                    'calibrated_rating': rating if self.random.random() < 0.9 else None,
+                    'calibrated_by': 'HR_DIRECTOR' if self.random.random() < 0.9 else None,
+                    'calibrated_date': f"{cycle_year + 1}-01-15" if self.random.random() < 0.9 else None,
                     
-                    'review_status': 'FINAL' if cycle_year == 2023 else random.choice(['DRAFT', 'FINAL']),
+                    'review_status': 'FINAL' if cycle_year == 2023 else self.random.choice(['DRAFT', 'FINAL']),
                     'created_date': f"{cycle_year}-11-01 00:00:00",
                     'completed_date': f"{cycle_year}-12-15 00:00:00" if cycle_year == 2023 else None
                 }
@@ -1055,12 +1979,15 @@ class EuroStyleHRGenerator:
         print(f"Generated {len(cycles)} performance cycles and {len(reviews)} performance reviews")
         return cycles, reviews
     
-    def generate_training_data(self) -> Tuple[List[Dict], List[Dict]]:
-        """Generate training programs and employee training records."""
+    def generate_training_data(self) -> Tuple[List[Dict], Iterator[Tuple]]:
+        """Generate training programs and employee training records.
+        
+        The records are returned as a generate_employee_training iterator,
+        to be streamed to the CSV writer.
+        """
         print("🎓 Generating training and development data...")
         
         programs = []
-        training_records = []
         
         # Standard training programs
         program_templates = [
@@ -1107,10 +2034,10 @@ class EuroStyleHRGenerator:
                 'duration_hours': int(template['duration']),  # Convert to integer for UInt16 compatibility
                 'delivery_method': template['method'],
                 'provider': template['provider'],
-                'cost_per_participant': Decimal(str(template['cost'])),
+                'cost_per_participant': str(template['cost']),
                 'currency': 'EUR',
-                'target_job_families': json.dumps(template['families']),  # Convert to JSON string
-                'target_levels': json.dumps(template['levels']),  # Convert to JSON string
+                'target_job_families': _dumps_json(template['families']),  # Convert to JSON string
+                'target_levels': _dumps_json(template['levels']),  # Convert to JSON string
                 'prerequisites': 'None' if template['type'] == 'MANDATORY' else 'Manager approval',
                 'compliance_category': template['type'] if template['type'] == 'COMPLIANCE' else '',
                 'certification_valid_months': template['certification'],
@@ -1120,15 +2047,22 @@ class EuroStyleHRGenerator:
             }
             programs.append(program)
         
-        # Generate employee training records
-        training_id = 1
+        # Target families and levels as sets, taken from the templates once;
+        # the program rows only carry them as JSON strings
+        program_targets = [
+            (program, frozenset(template['families']), frozenset(template['levels']))
+            for program, template in zip(programs, program_templates)
+        ]
         
-        for emp_id, employee in self.employees.items():
-            if employee['employee_status'] != 'ACTIVE':
-                continue
+        # Match every active employee against the programs first, so the
+        # random decisions for the matched pairs can be drawn in bulk
+        pairs = []
+        enrollment_rates = []
+        for employee in self.active_employee_refs:
+            emp_id = employee.employee_id
             
             # Get employee's contract and position
-            emp_contracts = [c for c in self.contracts.values() if c['employee_id'] == emp_id]
+            emp_contracts = self.contracts_by_employee.get(emp_id)
             if not emp_contracts:
                 continue
             
@@ -1137,35 +2071,15 @@ class EuroStyleHRGenerator:
             if not position:
                 continue
             
-            hire_date = datetime.strptime(employee['hire_date'], '%Y-%m-%d').date()
+            country_name = self.countries[employee.country_code]['name']
+            inferred_family = self.position_families[position.position_id]
             
             # Assign relevant training programs
-            for program in programs:
+            for program, families, levels in program_targets:
                 # Check if program is relevant for this employee (use position title to infer job family)
-                families = program['target_job_families']
-                levels = program['target_levels']
-                
-                # Infer job family from position title since job_family field doesn't exist in schema
-                position_title_lower = position['position_title'].lower()
-                inferred_family = 'Operations'  # default
-                if any(word in position_title_lower for word in ['finance', 'financial', 'accounting']):
-                    inferred_family = 'Finance'
-                elif any(word in position_title_lower for word in ['sales', 'account', 'business']):
-                    inferred_family = 'Sales'
-                elif any(word in position_title_lower for word in ['marketing', 'digital']):
-                    inferred_family = 'Marketing'
-                elif any(word in position_title_lower for word in ['hr', 'human']):
-                    inferred_family = 'HR'
-                elif any(word in position_title_lower for word in ['it', 'software', 'engineer', 'technical']):
-                    inferred_family = 'IT'
-                elif any(word in position_title_lower for word in ['manager', 'director', 'executive', 'ceo', 'cfo']):
-                    inferred_family = 'Management'
-                elif any(word in position_title_lower for word in ['store', 'retail', 'sales associate']):
-                    inferred_family = 'Retail'
-                
-                if (families != ['ALL'] and inferred_family not in families):
+                if 'ALL' not in families and inferred_family not in families:
                     continue
-                if (levels != ['ALL'] and position['position_level'] not in levels):
+                if 'ALL' not in levels and position.position_level not in levels:
                     continue
                 
                 # Mandatory programs - high enrollment rate
@@ -1173,40 +2087,95 @@ class EuroStyleHRGenerator:
                     enrollment_rate = 0.95
                 # Leadership programs - only for managers
                 elif program['program_type'] == 'LEADERSHIP':
-                    enrollment_rate = 0.7 if position['position_level'] in ['MANAGER', 'DIRECTOR'] else 0.1
+                    enrollment_rate = 0.7 if position.position_level in ['MANAGER', 'DIRECTOR'] else 0.1
                 # Optional programs - variable rate
                 else:
                     enrollment_rate = 0.4
                 
-                if random.random() > enrollment_rate:
-                    continue
+                pairs.append((emp_id, employee.hire_date, country_name, program))
+                enrollment_rates.append(enrollment_rate)
+        
+        print(f"Generated {len(programs)} training programs")
+        return programs, self.generate_employee_training(pairs, enrollment_rates)
+    
+    def generate_employee_training(self, matched_pairs: List[Tuple],
+                                   enrollment_rates: List[float]) -> Iterator[Tuple]:
+        """Generate training records for matched (employee, program) pairs, yielding each row.
+        
+        Pairs are processed STREAM_BATCH_SIZE at a time: the random decisions
+        for a batch are drawn together and its rows go straight to the CSV
+        writer. Rows are tuples in EMPLOYEE_TRAINING_FIELDS order.
+        """
+        rng = self.rng
+        first_training_id = 1
+        
+        for batch_start in range(0, len(matched_pairs), STREAM_BATCH_SIZE):
+            # Every random decision for every matched pair in the batch, one
+            # array each; completion is 98% for mandatory programs and 85% otherwise
+            pairs = matched_pairs[batch_start:batch_start + STREAM_BATCH_SIZE]
+            num_pairs = len(pairs)
+            completion_rates = [0.98 if program['program_type'] == 'MANDATORY' else 0.85 for *_, program in pairs]
+            enrolled = rng.random(num_pairs) <= enrollment_rates[batch_start:batch_start + STREAM_BATCH_SIZE]
+            start_offsets = rng.integers(1, 31, num_pairs)
+            completed = (rng.random(num_pairs) < completion_rates).tolist()
+            completion_offsets = rng.integers(1, 91, num_pairs)
+            pass_scores = rng.uniform(70, 100, num_pairs).tolist()
+            incomplete_statuses = rng.choice(TRAINING_INCOMPLETE_STATUSES, num_pairs).tolist()
+            fail_scores = rng.uniform(40, 69, num_pairs).tolist()
+            certified = (rng.random(num_pairs) < 0.9).tolist()  # 90% earn certification if they complete
+            gives_feedback = (rng.random(num_pairs) < 0.7).tolist()  # 70% provide feedback
+            feedback_picks = rng.integers(len(TRAINING_FEEDBACK_TEMPLATES), size=num_pairs).tolist()
+            employee_ratings = rng.integers(3, 6, num_pairs).tolist()  # 3-5 star rating
+            approvers = rng.integers(1, 51, num_pairs).tolist()
+            
+            # Enrollment dates as ordinals between the later of hire date and
+            # 2023-01-01, and 2024-06-30
+            earliest_enrollments = np.maximum(
+                [hire_date.toordinal() for _, hire_date, *_ in pairs], date(2023, 1, 1).toordinal()
+            )
+            enrollment_ords = rng.integers(earliest_enrollments, date(2024, 6, 30).toordinal() + 1)
+            
+            # Start, completion and certification expiry dates as ordinals;
+            # certifications stay valid for 30 days per valid month
+            start_ords = enrollment_ords + start_offsets
+            completion_ords = start_ords + completion_offsets
+            valid_months = np.array([program['certification_valid_months'] for *_, program in pairs])
+            expiry_ords = (completion_ords + valid_months * 30).tolist()
+            enrollment_ords = enrollment_ords.tolist()
+            start_ords = start_ords.tolist()
+            completion_ords = completion_ords.tolist()
+            
+            # Only the enrolled pairs become training records; each field is
+            # collected as its own column and the rows are zipped at the end
+            enrolled = np.flatnonzero(enrolled).tolist()
+            enrollment_dates = []
+            start_dates = []
+            completion_dates = []
+            statuses = []
+            scores = []
+            certifications_earned = []
+            certification_numbers = []
+            certification_expiry_dates = []
+            training_locations = []
+            feedback_texts = []
+            feedback_ratings = []
+            
+            for training_id, n in enumerate(enrolled, first_training_id):
+                emp_id, _, country_name, program = pairs[n]
                 
                 # Generate training dates
-                enrollment_date = self.fakers['NL'].date_between(
-                    start_date=max(hire_date, date(2023, 1, 1)),
-                    end_date=date(2024, 6, 30)
-                )
-                start_date = enrollment_date + timedelta(days=random.randint(1, 30))
+                enrollment_date = date.fromordinal(enrollment_ords[n])
+                start_date = date.fromordinal(start_ords[n])
                 
                 # Completion based on program type and employee factors
-                if program['program_type'] == 'MANDATORY':
-                    completion_rate = 0.98
-                else:
-                    completion_rate = 0.85
-                
-                if random.random() < completion_rate:
-                    completion_date = start_date + timedelta(days=random.randint(1, 90))
+                if completed[n]:
+                    completion_date = date.fromordinal(completion_ords[n])
                     status = 'COMPLETED'
-                    score = random.uniform(70, 100) if program['program_type'] in ['CERTIFICATION', 'COMPLIANCE'] else None
+                    score = pass_scores[n] if program['program_type'] in ['CERTIFICATION', 'COMPLIANCE'] else None
                 else:
                     completion_date = None
-                    status = random.choice(['IN_PROGRESS', 'FAILED', 'CANCELLED'])
-                    score = random.uniform(40, 69) if status == 'FAILED' else None
-                
-                # Calculate expiry date if certification
-                expiry_date = None
-                if program['certification_valid_months'] > 0 and completion_date:
-                    expiry_date = completion_date + timedelta(days=program['certification_valid_months'] * 30)
+                    status = incomplete_statuses[n]
+                    score = fail_scores[n] if status == 'FAILED' else None
                 
                 # Generate certification details
                 certification_earned = False
@@ -1214,80 +2183,71 @@ class EuroStyleHRGenerator:
                 certification_expiry_date = None
                 
                 if status == 'COMPLETED' and program['certification_valid_months'] > 0:
-                    if random.random() < 0.9:  # 90% earn certification if they complete
+                    if certified[n]:
                         certification_earned = True
                         certification_number = f"CERT-{program['program_code']}-{training_id:06d}-{completion_date.year}"
-                        certification_expiry_date = expiry_date
-                
-                # Generate instructor details
-                instructor_names = [
-                    "Dr. Sarah Johnson", "Prof. Michael Chen", "Maria Rodriguez", "James Wilson",
-                    "Dr. Emma Thompson", "Carlos Mendez", "Lisa Anderson", "Ahmed Hassan",
-                    "Sophie Martin", "David Brown", "Anna Kowalski", "Roberto Silva"
-                ]
-                instructor_name = random.choice(instructor_names)
+                        certification_expiry_date = date.fromordinal(expiry_ords[n])
                 
                 # Training location based on delivery method and country
-                country_code = self._get_country_from_entity(employee['entity_id'])
                 if program['delivery_method'] == 'ONLINE':
                     training_location = 'Online/Virtual'
                 elif program['delivery_method'] == 'CLASSROOM':
-                    training_location = f"EuroStyle {self.countries[country_code]['name']} Training Center"
+                    training_location = f"EuroStyle {country_name} Training Center"
                 else:  # BLENDED, WORKSHOP
-                    training_location = f"EuroStyle {self.countries[country_code]['name']} Office"
+                    training_location = f"EuroStyle {country_name} Office"
                 
                 # Employee feedback and rating (for completed trainings)
-                employee_feedback = None
-                employee_rating = None
-                if status == 'COMPLETED':
-                    if random.random() < 0.7:  # 70% provide feedback
-                        feedback_templates = [
-                            "Very informative and well-structured course.",
-                            "Excellent instructor, learned a lot of practical skills.",
-                            "Good content but could use more interactive elements.",
-                            "Highly recommend this training to colleagues.",
-                            "Clear explanations and relevant examples.",
-                            "Training met my expectations and professional needs.",
-                            "Could benefit from more hands-on exercises."
-                        ]
-                        employee_feedback = random.choice(feedback_templates)
-                        employee_rating = random.randint(3, 5)  # 3-5 star rating
-                
-                training_record = {
-                    'training_record_id': f"TR_{training_id:08d}",
-                    'employee_id': emp_id,
-                    'program_id': program['program_id'],
-                    'enrollment_date': enrollment_date.strftime('%Y-%m-%d'),
-                    'start_date': start_date.strftime('%Y-%m-%d'),
-                    'completion_date': completion_date.strftime('%Y-%m-%d') if completion_date else None,
-                    'status': status,
-                    
-                    # Fixed: Add missing fields matching database schema
-                    'score': Decimal(str(score)).quantize(Decimal('0.1')) if score else None,
-                    'certification_earned': certification_earned,
-                    'certification_number': certification_number,
-                    'certification_expiry_date': certification_expiry_date.strftime('%Y-%m-%d') if certification_expiry_date else None,
-                    'instructor_name': instructor_name,
-                    'training_location': training_location,
-                    'cost_eur': program['cost_per_participant'],
-                    'approved_by': f"MGR_{random.randint(1, 50)}",
-                    'employee_feedback': employee_feedback,
-                    'employee_rating': employee_rating,
-                    
-                    'created_date': enrollment_date.strftime('%Y-%m-%d') + ' 00:00:00'
-                }
-                training_records.append(training_record)
-                training_id += 1
-        
-        print(f"Generated {len(programs)} training programs and {len(training_records)} training records")
-        return programs, training_records
+                gives = status == 'COMPLETED' and gives_feedback[n]
+                
+                enrollment_dates.append(enrollment_date.isoformat())
+                start_dates.append(start_date.isoformat())
+                completion_dates.append(completion_date.isoformat() if completion_date else None)
+                statuses.append(status)
+                scores.append(one_decimal(score) if score else None)
+                certifications_earned.append(certification_earned)
+                certification_numbers.append(certification_number)
+                certification_expiry_dates.append(certification_expiry_date.isoformat() if certification_expiry_date else None)
+                training_locations.append(training_location)
+                feedback_texts.append(TRAINING_FEEDBACK_TEMPLATES[feedback_picks[n]] if gives else None)
+                feedback_ratings.append(employee_ratings[n] if gives else None)
+            
+            enrolled_pairs = [pairs[n] for n in enrolled]
+            yield from zip(
+                [f"TR_{training_id:08d}" for training_id in range(first_training_id, first_training_id + len(enrolled))],
+                [emp_id for emp_id, *_ in enrolled_pairs],
+                [program['program_id'] for *_, program in enrolled_pairs],
+                enrollment_dates,
+                start_dates,
+                completion_dates,
+                statuses,
+                
+                # Fixed: Add missing fields matching database schema
+                scores,
+                certifications_earned,
+                certification_numbers,
+                certification_expiry_dates,
+                rng.choice(TRAINING_INSTRUCTORS, len(enrolled)).tolist(),  # Instructor per record
+                training_locations,
+                [program['cost_per_participant'] for *_, program in enrolled_pairs],
+                [f"MGR_{approvers[n]}" for n in enrolled],
+                feedback_texts,
+                feedback_ratings,
+                
+                [enrollment_date + ' 00:00:00' for enrollment_date in enrollment_dates]
+            )
+            first_training_id += len(enrolled)
+        
+        print(f"Generated {first_training_id - 1} training records")
     
-    def generate_surveys_and_responses(self) -> Tuple[List[Dict], List[Dict]]:
-        """Generate employee surveys and responses."""
+    def generate_surveys_and_responses(self) -> Tuple[List[Dict], Iterator[Tuple]]:
+        """Generate employee surveys and responses.
+        
+        The responses are returned as a generate_survey_responses iterator,
+        to be streamed to the CSV writer.
+        """
         print("📋 Generating employee surveys and responses...")
         
         surveys = []
-        responses = []
         
         # Survey templates
         survey_templates = [
@@ -1325,7 +2285,7 @@ class EuroStyleHRGenerator:
                 'survey_name': template['name'],
                 'survey_type': template['type'],
                 'description': f"EuroStyle {template['type'].lower()} survey to measure employee satisfaction and engagement.",
-                'questions_json': json.dumps(template['questions']),
+                'questions_json': _dumps_json(template['questions']),
                 'launch_date': template['launch'],
                 'close_date': template['close'],
                 'target_entities': [e['entity_id'] for e in self.finance_entities],
@@ -1338,199 +2298,102 @@ class EuroStyleHRGenerator:
             }
             surveys.append(survey)
         
+        print(f"Generated {len(surveys)} surveys")
+        return surveys, self.generate_survey_responses(surveys)
+    
+    def generate_survey_responses(self, surveys: List[Dict]) -> Iterator[Tuple]:
+        """Generate the responses to each survey, yielding each row.
+        
+        Respondents are selected per survey with one mask and processed
+        STREAM_BATCH_SIZE at a time, so only one batch of rows is held in
+        memory. Rows are tuples in SURVEY_RESPONSE_FIELDS order.
+        """
+        # Department group and role level do not change between surveys, so
+        # resolve them once per employee from the first contract
+        groups_by_employee = {}
+        for employee in self.employee_ref_list:
+            emp_contracts = self.contracts_by_employee.get(employee.employee_id)
+            department_id = emp_contracts[0]['department_id'] if emp_contracts else None
+            position = self.positions.get(emp_contracts[0]['position_id']) if emp_contracts else None
+            job_level = position.position_level if position else 'UNKNOWN'
+            
+            dept = self.departments.get(department_id) if department_id else None
+            department_group = DEPARTMENT_GROUPS.get(dept.department_type, 'Other') if dept else None
+            groups_by_employee[employee.employee_id] = (department_group, ROLE_LEVELS.get(job_level, 'Other'))
+        
         # Generate survey responses
         response_id = 1
+        rng = self.rng
         
         for survey in surveys:
-            survey_date = datetime.strptime(survey['launch_date'], '%Y-%m-%d').date()
-            questions = json.loads(survey['questions_json'])
-            
-            # Get eligible employees (active at time of survey)
-            eligible_employees = [
-                emp for emp in self.employees.values()
-                if (datetime.strptime(emp['hire_date'], '%Y-%m-%d').date() <= survey_date and
-                    (not emp['termination_date'] or 
-                     datetime.strptime(emp['termination_date'], '%Y-%m-%d').date() >= survey_date))
-            ]
+            survey_date = date.fromisoformat(survey['launch_date'])
+            survey_ord = survey_date.toordinal()
             
-            # Response rate varies by survey type
+            # Respondents are the employees active at the time of the survey
+            # who take part; response rate varies by survey type
             response_rate = 0.75 if survey['survey_type'] == 'ENGAGEMENT' else 0.85
+            active = self.active_employees_at(survey_ord)
+            survey_respondents = active[rng.random(len(self.employee_ref_list))[active] <= response_rate]
             
-            for employee in eligible_employees:
-                if random.random() > response_rate:
-                    continue
-                
-                # Generate responses
-                responses_data = {}
-                for question in questions:
-                    if question['type'] == 'scale_5':
-                        # Weighted towards positive responses
-                        responses_data[str(question['id'])] = random.choices(
-                            [1, 2, 3, 4, 5], weights=[5, 10, 20, 35, 30]
-                        )[0]
-                    elif question['type'] == 'text':
-                        responses_data[str(question['id'])] = random.choice([
-                            "Overall very satisfied with the company culture.",
-                            "Would like more flexible working arrangements.",
-                            "Great team collaboration and support.",
-                            "Career development opportunities could be improved.",
-                            "Excellent management and clear communication.",
-                            ""  # Some skip text questions
-                        ])
-                
-                completion_percentage = 100.0 if len(responses_data) == len(questions) else random.uniform(60, 95)
-                
-                # Get department and job level for demographics
-                emp_contracts = [c for c in self.contracts.values() if c['employee_id'] == employee['employee_id']]
-                department_id = emp_contracts[0]['department_id'] if emp_contracts else None
-                position = self.positions.get(emp_contracts[0]['position_id']) if emp_contracts else None
-                job_level = position['position_level'] if position else 'UNKNOWN'
-                
-                # Calculate tenure at survey time
-                hire_date = datetime.strptime(employee['hire_date'], '%Y-%m-%d').date()
-                tenure_months = (survey_date.year - hire_date.year) * 12 + (survey_date.month - hire_date.month)
-                
-                # Generate demographic groupings
-                department_group = None
-                if department_id:
-                    dept = self.departments.get(department_id)
-                    if dept:
-                        dept_type = dept.get('department_type', 'OTHER')
-                        department_group = {
-                            'CORPORATE': 'Corporate Functions',
-                            'SUPPORT': 'Support Services', 
-                            'RETAIL': 'Retail Operations',
-                            'OPERATIONS': 'Operations'
-                        }.get(dept_type, 'Other')
-                
-                # Tenure groupings
-                if tenure_months < 12:
-                    tenure_group = '0-1 years'
-                elif tenure_months < 36:
-                    tenure_group = '1-3 years'
-                elif tenure_months < 60:
-                    tenure_group = '3-5 years'
-                else:
-                    tenure_group = '5+ years'
-                
-                # Age groupings (based on birth date in employee record)
-                birth_date = datetime.strptime(employee.get('birth_date', '1980-01-01'), '%Y-%m-%d').date()
-                age_years = (survey_date - birth_date).days // 365
-                if age_years < 25:
-                    age_group = 'Under 25'
-                elif age_years < 35:
-                    age_group = '25-34'
-                elif age_years < 45:
-                    age_group = '35-44'
-                elif age_years < 55:
-                    age_group = '45-54'
-                else:
-                    age_group = '55+'
-                
-                # Role level grouping
-                role_level = {
-                    'ENTRY': 'Individual Contributor',
-                    'JUNIOR': 'Individual Contributor', 
-                    'SENIOR': 'Senior Individual Contributor',
-                    'LEAD': 'Team Lead',
-                    'MANAGER': 'Management',
-                    'DIRECTOR': 'Senior Management',
-                    'EXECUTIVE': 'Executive'
-                }.get(job_level, 'Other')
-                
-                # Generate realistic satisfaction ratings (1-5 scale, weighted towards positive)
-                rating_weights = [2, 5, 15, 40, 38]  # Weighted towards 4-5
-                overall_satisfaction = random.choices([1, 2, 3, 4, 5], weights=rating_weights)[0]
-                work_life_balance = random.choices([1, 2, 3, 4, 5], weights=[3, 8, 20, 42, 27])[0]
-                compensation_satisfaction = random.choices([1, 2, 3, 4, 5], weights=[5, 12, 25, 35, 23])[0]
-                career_development = random.choices([1, 2, 3, 4, 5], weights=[4, 10, 22, 38, 26])[0]
-                management_effectiveness = random.choices([1, 2, 3, 4, 5], weights=[3, 7, 18, 42, 30])[0]
-                company_culture = random.choices([1, 2, 3, 4, 5], weights=[2, 6, 17, 43, 32])[0]
-                
-                # Generate text responses
-                likes_most_options = [
-                    "Great team collaboration and supportive colleagues",
-                    "Flexible working arrangements and work-life balance",
-                    "Opportunities for professional development and growth",
-                    "Company culture and values alignment",
-                    "Challenging and meaningful work projects",
-                    "Competitive compensation and benefits package",
-                    "Strong leadership and clear direction",
-                    "Innovation and forward-thinking approach"
-                ]
-                
-                improvement_suggestions_options = [
-                    "More opportunities for career advancement",
-                    "Better communication between departments",
-                    "Enhanced training and development programs",
-                    "Improved work-life balance initiatives",
-                    "More competitive compensation packages",
-                    "Better recognition and rewards programs",
-                    "Upgraded office facilities and technology",
-                    "More flexible working arrangements",
-                    "",  # Some don't provide suggestions
-                    ""   # Some don't provide suggestions
-                ]
+            # Responses come in over the first 16 days, so each possible
+            # response date and the created date are formatted once per survey
+            response_dates = np.array([
+                date.fromordinal(survey_ord + offset).isoformat() + ' 00:00:00' for offset in range(16)
+            ])
+            created_date = survey['launch_date'] + ' 00:00:00'
+            
+            for batch_start in range(0, len(survey_respondents), STREAM_BATCH_SIZE):
+                respondents = survey_respondents[batch_start:batch_start + STREAM_BATCH_SIZE]
+                num_responses = len(respondents)
+                employee_ids = [self.employee_ref_list[i].employee_id for i in respondents.tolist()]
+                groups = [groups_by_employee[emp_id] for emp_id in employee_ids]
+                
+                # Tenure and age groups at survey time for every respondent
+                tenure_codes = np.empty(num_responses, dtype=np.int64)
+                age_codes = np.empty(num_responses, dtype=np.int64)
+                _bucketize_demographics(
+                    self.employee_hire_months[respondents], self.employee_birth_ords[respondents],
+                    survey_date.year * 12 + survey_date.month, survey_ord, tenure_codes, age_codes
+                )
                 
-                additional_comments_options = [
-                    "Overall very satisfied with my role and the company",
-                    "Looking forward to continued growth and development",
-                    "Appreciate the supportive management team",
-                    "Happy with the company direction and vision",
-                    "",  # Many skip additional comments
-                    "",
-                    "",
-                    ""
+                # Every rating and free-text answer for every respondent, one draw
+                # per response column; rows are assembled from the columns
+                satisfaction = [
+                    rng.choice(RATING_SCALE, size=num_responses, p=weights).tolist()
+                    for weights in SATISFACTION_WEIGHTS.values()
                 ]
-                
-                response = {
-                    'response_id': f"RESP_{response_id:08d}",
-                    'survey_id': survey['survey_id'],
-                    'employee_id': None if survey['is_anonymous'] else employee['employee_id'],  # Fixed: populate employee_id
-                    'response_date': (survey_date + timedelta(days=random.randint(0, 15))).strftime('%Y-%m-%d %H:%M:%S'),
+                response_offsets = rng.integers(0, 16, num_responses)
+                anonymous = survey['is_anonymous']
+                
+                yield from zip(
+                    [f"RESP_{n:08d}" for n in range(response_id, response_id + num_responses)],
+                    itertools.repeat(survey['survey_id']),
+                    itertools.repeat(None) if anonymous else employee_ids,  # Fixed: populate employee_id
+                    response_dates[response_offsets].tolist(),
                     
                     # Fixed: Add all missing satisfaction rating fields
-                    'overall_satisfaction': overall_satisfaction,
-                    'work_life_balance_rating': work_life_balance,
-                    'compensation_satisfaction': compensation_satisfaction,
-                    'career_development_rating': career_development,
-                    'management_effectiveness': management_effectiveness,
-                    'company_culture_rating': company_culture,
+                    *satisfaction,
                     
                     # Fixed: Add missing text response fields
-                    'likes_most': random.choice(likes_most_options),
-                    'improvement_suggestions': random.choice(improvement_suggestions_options),
-                    'additional_comments': random.choice(additional_comments_options),
+                    rng.choice(SURVEY_LIKES_MOST, num_responses).tolist(),
+                    rng.choice(SURVEY_IMPROVEMENT_SUGGESTIONS, num_responses).tolist(),
+                    rng.choice(SURVEY_ADDITIONAL_COMMENTS, num_responses).tolist(),
                     
                     # Fixed: Add missing demographic grouping fields
-                    'department_group': department_group,
-                    'tenure_group': tenure_group,
-                    'age_group': age_group,
-                    'role_level': role_level,
+                    [department_group for department_group, _ in groups],
+                    [TENURE_GROUPS[code] for code in tenure_codes.tolist()],
+                    [AGE_GROUPS[code] for code in age_codes.tolist()],
+                    [role_level for _, role_level in groups],
                     
                     # Privacy and consent fields
-                    'consent_given': True,
-                    'anonymization_level': 'FULL' if survey['is_anonymous'] else 'PARTIAL',
+                    itertools.repeat(True),
+                    itertools.repeat('FULL' if anonymous else 'PARTIAL'),
                     
-                    'created_date': survey['launch_date'] + ' 00:00:00'
-                }
-                responses.append(response)
-                response_id += 1
+                    itertools.repeat(created_date)
+                )
+                response_id += num_responses
         
-        print(f"Generated {len(surveys)} surveys and {len(responses)} survey responses")
-        return surveys, responses
-    
-    def _get_random_cost_center(self, entity_id: str) -> str:
-        """Get a random cost center for the given entity."""
-        entity_cost_centers = [cc for cc in self.cost_centers if cc.get('entity_id') == entity_id]
-        return random.choice(entity_cost_centers)['cost_center_id'] if entity_cost_centers else ''
-    
-    def _get_country_from_entity(self, entity_id: str) -> str:
-        """Extract country code from entity ID."""
-        for entity in self.finance_entities:
-            if entity['entity_id'] == entity_id:
-                return entity['country_code']
-        return 'NL'  # Default
+        print(f"Generated {response_id - 1} survey responses")
     
     def _get_skills_for_family(self, job_family: str) -> List[str]:
         """Get relevant skills for job family."""
@@ -1568,7 +2431,7 @@ class EuroStyleHRGenerator:
             'MATERNITY': ['Maternity leave', 'Childbirth recovery'],
             'PATERNITY': ['Paternity leave', 'Newborn care']
         }
-        return random.choice(reasons.get(leave_type, ['Personal reasons']))
+        return self.random.choice(reasons.get(leave_type, ['Personal reasons']))
     
     def _get_performance_comment(self, rating: str, is_manager: bool) -> str:
         """Generate performance review comments."""
@@ -1609,7 +2472,7 @@ class EuroStyleHRGenerator:
                 ]
             }
         
-        return random.choice(comments.get(rating, ["Good overall performance with room for growth."]))
+        return self.random.choice(comments.get(rating, ["Good overall performance with room for growth."]))
     
     def _get_development_areas(self) -> str:
         """Generate development areas."""
@@ -1622,7 +2485,7 @@ class EuroStyleHRGenerator:
             "Cross-functional collaboration",
             "Digital transformation and technology adoption"
         ]
-        return random.choice(areas)
+        return self.random.choice(areas)
     
     def _get_development_plan(self) -> str:
         """Generate development plan."""
@@ -1634,30 +2497,21 @@ class EuroStyleHRGenerator:
             "Shadow senior leaders and attend strategic planning sessions.",
             "Complete advanced technical training and gain new certifications."
         ]
-        return random.choice(plans)
+        return self.random.choice(plans)
     
-    def write_csv_file(self, filename: str, data: List[Dict], fieldnames: List[str] = None):
+    def write_csv_file(self, filename: str, data: Iterable, fieldnames: List[str] = None):
         """Write data to compressed CSV file."""
-        if not data:
-            print(f"⚠️ No data to write for {filename}")
-            return
-        
-        if fieldnames is None:
-            fieldnames = list(data[0].keys())
-        
         # Ensure filename has .gz extension
         if not filename.endswith('.gz'):
             filename = filename.replace('.csv', '.csv.gz')
         
-        filepath = os.path.join(self.output_dir, filename)
-        
-        with gzip.open(filepath, 'wt', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+        info = write_compressed_csv(self.output_dir, filename, data, fieldnames, self.compress_level, self.csv_writer)
+        if info is None:
+            print(f"⚠️ No data to write for {filename}")
+            return
         
         # Calculate file size
-        file_size = os.path.getsize(filepath)
+        file_size = info['size']
         if file_size > 1024 * 1024:
             size_str = f"{file_size / (1024 * 1024):.1f} MB"
         elif file_size > 1024:
@@ -1665,13 +2519,45 @@ class EuroStyleHRGenerator:
         else:
             size_str = f"{file_size} bytes"
         
-        print(f"  📄 {filename} ({len(data):,} records, {size_str})")
+        print(f"  📄 {filename} ({info['records']:,} records, {size_str})")
         
-        self.csv_files[filename] = {
-            'records': len(data),
-            'size': file_size,
-            'path': filepath
-        }
+        self.csv_files[filename] = info
+    
+    def reseed(self, seed: int):
+        """Re-seed the scalar, vectorized and Faker random state from one seed."""
+        self.random = random.Random(seed)
+        self.rng = np.random.Generator(np.random.SFC64(seed))
+        for faker in self.fakers.values():
+            faker.seed_instance(seed)
+    
+    def write_stage(self, stage: str):
+        """Generate and write the files of one of PARALLEL_STAGES."""
+        if stage == 'leave':
+            # 4. Leave management
+            print("\n4. Leave Management")
+            leave_requests, leave_balances = self.generate_leave_requests()
+            self.write_csv_file('eurostyle_hr.leave_requests.csv', leave_requests)
+            self.write_csv_file('eurostyle_hr.leave_balances.csv', leave_balances)
+        elif stage == 'performance':
+            # 5. Performance management
+            print("\n5. Performance Management")
+            performance_cycles, performance_reviews = self.generate_performance_data()
+            self.write_csv_file('eurostyle_hr.performance_cycles.csv', performance_cycles)
+            self.write_csv_file('eurostyle_hr.performance_reviews.csv', performance_reviews)
+        elif stage == 'training':
+            # 6. Training and development
+            print("\n6. Training & Development")
+            training_programs, employee_training = self.generate_training_data()
+            self.write_csv_file('eurostyle_hr.training_programs.csv', training_programs)
+            self.write_csv_file('eurostyle_hr.employee_training.csv', employee_training, EMPLOYEE_TRAINING_FIELDS)
+        elif stage == 'surveys':
+            # 7. Employee surveys
+            print("\n7. Employee Surveys")
+            surveys, survey_responses = self.generate_surveys_and_responses()
+            self.write_csv_file('eurostyle_hr.employee_surveys.csv', surveys)
+            self.write_csv_file('eurostyle_hr.survey_responses.csv', survey_responses, SURVEY_RESPONSE_FIELDS)
+        else:
+            raise ValueError(f"Unknown HR stage: {stage}")
     
     def generate_all_hr_data(self):
         """Generate all HR system data."""
@@ -1690,40 +2576,24 @@ class EuroStyleHRGenerator:
         
         # 2. Employee master data
         print("\n2. Employee Master Data")
-        employees = self.generate_employees()
-        self.write_csv_file('eurostyle_hr.employees.csv', employees)
+        # Employees and contracts are streamed to disk as they are generated
+        self.write_csv_file('eurostyle_hr.employees.csv', self.generate_employees())
         
         # 3. Employment contracts and compensation
         print("\n3. Employment Contracts & Compensation")
-        contracts = self.generate_employment_contracts()
-        self.write_csv_file('eurostyle_hr.employment_contracts.csv', contracts)
+        self.write_csv_file('eurostyle_hr.employment_contracts.csv', self.generate_employment_contracts())
         
         compensation = self.generate_compensation_history()
-        self.write_csv_file('eurostyle_hr.compensation_history.csv', compensation)
-        
-        # 4. Leave management
-        print("\n4. Leave Management")
-        leave_requests, leave_balances = self.generate_leave_requests()
-        self.write_csv_file('eurostyle_hr.leave_requests.csv', leave_requests)
-        self.write_csv_file('eurostyle_hr.leave_balances.csv', leave_balances)
-        
-        # 5. Performance management
-        print("\n5. Performance Management")
-        performance_cycles, performance_reviews = self.generate_performance_data()
-        self.write_csv_file('eurostyle_hr.performance_cycles.csv', performance_cycles)
-        self.write_csv_file('eurostyle_hr.performance_reviews.csv', performance_reviews)
-        
-        # 6. Training and development
-        print("\n6. Training & Development")
-        training_programs, employee_training = self.generate_training_data()
-        self.write_csv_file('eurostyle_hr.training_programs.csv', training_programs)
-        self.write_csv_file('eurostyle_hr.employee_training.csv', employee_training)
-        
-        # 7. Employee surveys
-        print("\n7. Employee Surveys")
-        surveys, survey_responses = self.generate_surveys_and_responses()
-        self.write_csv_file('eurostyle_hr.employee_surveys.csv', surveys)
-        self.write_csv_file('eurostyle_hr.survey_responses.csv', survey_responses)
+        self.write_csv_file('eurostyle_hr.compensation_history.csv', compensation, COMPENSATION_HISTORY_FIELDS)
+        
+        # 4-7. Leave, performance, training and surveys only read the state
+        # built above, so each stage runs in its own worker process
+        seeds = self.rng.integers(0, 2**32, size=len(PARALLEL_STAGES)).tolist()
+        max_workers = min(len(PARALLEL_STAGES), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for stage_files in executor.map(run_hr_stage, itertools.repeat(self), PARALLEL_STAGES, seeds):
+                self.csv_files.update(stage_files)
         
         # Summary
         print(f"\n✅ Complete HR data generation finished!")
@@ -1740,13 +2610,54 @@ class EuroStyleHRGenerator:
         total_size_str = f"{total_size / (1024 * 1024):.1f} MB" if total_size > 1024 * 1024 else f"{total_size / 1024:.1f} KB"
         print(f"\n📊 Total: {total_records:,} records, {total_size_str}")
 
+
+def run_hr_stage(generator: EuroStyleHRGenerator, stage: str, seed: int) -> Dict[str, Dict]:
+    """Run one of PARALLEL_STAGES in a worker process and return the files it wrote.
+    
+    The generator arrives as a pickled copy of the parent's; it is re-seeded
+    from ``seed`` so every stage draws its own reproducible stream.
+    """
+    generator.reseed(seed)
+    generator.csv_files = {}
+    generator.write_stage(stage)
+    return generator.csv_files
+
+
 def main():
     """Main function to generate EuroStyle HR data."""
+    parser = argparse.ArgumentParser(description='Generate EuroStyle HR data')
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help=f'Random seed for reproducible output; also caches Faker output in {FAKER_CACHE_DIR}/ (default: unseeded)'
+    )
+    parser.add_argument(
+        '--csv-writer',
+        choices=CSV_WRITERS,
+        default='csv',
+        help='CSV formatting engine: the csv module (default) or pyarrow\'s C++ writer (requires pyarrow)'
+    )
+    parser.add_argument(
+        '--compress-level',
+        type=int,
+        choices=range(1, 10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar='1-9',
+        help=f'gzip compression level: 1 is fastest, 9 smallest (default: {DEFAULT_COMPRESS_LEVEL}; use 6 or higher for published data)'
+    )
+    args = parser.parse_args()
+    
     print("👥 EuroStyle Fashion - HR Data Generator")
     print("========================================")
     
+    if args.csv_writer == 'pyarrow' and pa is None:
+        print("Error: pyarrow is required for --csv-writer pyarrow. Install with: pip install pyarrow")
+        sys.exit(1)
+    
     try:
-        generator = EuroStyleHRGenerator()
+        generator = EuroStyleHRGenerator(seed=args.seed, csv_writer=args.csv_writer,
+                                         compress_level=args.compress_level)
         generator.generate_all_hr_data()
         
         print("\n🎉 HR data generation completed successfully!")
@@ -1758,6 +2669,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    # Initialize faker instance for the main function
-    faker = Faker()
     main()
\ No newline at end of file
@@ -16,12 +16,17 @@ Generates realistic data for all 10 webshop analytics tables:
 """
 
 import csv
+import gzip
+import io
 import random
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 import json
+from operator import itemgetter
+import numpy as np
+import pandas as pd
 
 # Configuration
 COUNTRIES = ['NL', 'BE', 'DE', 'FR', 'LU']
@@ -30,6 +35,14 @@ BROWSERS = ['Chrome', 'Firefox', 'Safari', 'Edge']
 SIZES = ['XS', 'S', 'M', 'L', 'XL', '32', '34', '36', '38', '40', '42']
 COLORS = ['Black', 'White', 'Navy', 'Grey', 'Red', 'Blue', 'Green', 'Pink', 'Brown']
 
+# Output settings: gzip level (1 is fastest, 9 smallest) and raw file buffer size
+COMPRESS_LEVEL = 1
+WRITE_BUFFER_SIZE = 1 << 20
+
+def _format_timestamps(timestamps: np.ndarray) -> np.ndarray:
+    """Format datetime64 values as 'YYYY-MM-DD HH:MM:SS' strings"""
+    return np.char.replace(np.datetime_as_string(timestamps, unit='s'), 'T', ' ')
+
 def load_existing_data():
     """Load existing customer and product data for referential integrity"""
     customers = []
@@ -399,52 +412,55 @@ def generate_email_marketing(customers: List[str], campaigns: List[str], count:
     return events
 
 def generate_product_recommendations(sessions: List[tuple], products: List[str], count: int = 200000):
-    """Generate product recommendations data"""
-    recommendations = []
+    """Generate product recommendations data
+    
+    Every column is drawn for all records at once with NumPy and the
+    records are returned as a DataFrame, not a list of dicts.
+    """
+    rng = np.random.default_rng()
     
     recommendation_types = ['similar_items', 'frequently_bought_together', 'trending', 'personalized', 'cross_sell']
     page_contexts = ['product_page', 'cart_page', 'homepage', 'category_page', 'checkout_page']
     algorithm_versions = ['v1.2', 'collaborative_filtering', 'content_based', 'hybrid_v2', 'ml_boost_v3']
     
-    for i in range(count):
-        session_id, customer_id, country_code = random.choice(sessions)
-        
-        rec_type = random.choice(recommendation_types)
-        source_product = random.choice(products) if rec_type in ['similar_items', 'frequently_bought_together'] else ''
-        recommended_product = random.choice(products)
-        
-        shown_timestamp = datetime(2024, 6, 1) + timedelta(
-            days=random.randint(0, 180),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
-        )
-        
-        clicked = random.random() > 0.85  # 15% CTR
-        added_to_cart = clicked and random.random() > 0.7  # 30% add to cart rate from clicks
-        purchased = added_to_cart and random.random() > 0.6  # 40% purchase rate from adds
-        
-        recommendations.append({
-            'recommendation_id': f"REC_2024_{i+1:08d}",
-            'session_id': session_id,
-            'customer_id': customer_id if customer_id else '',
-            'country_code': country_code,
-            'recommendation_type': rec_type,
-            'source_product_id': source_product,
-            'recommended_product_id': recommended_product,
-            'recommendation_position': random.randint(1, 8),
-            'page_context': random.choice(page_contexts),
-            'algorithm_version': random.choice(algorithm_versions),
-            'confidence_score': round(random.uniform(0.1, 0.99), 4),
-            'shown_timestamp': shown_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            'clicked': clicked,
-            'clicked_timestamp': (shown_timestamp + timedelta(seconds=random.randint(1, 300))).strftime('%Y-%m-%d %H:%M:%S') if clicked else '',
-            'added_to_cart': added_to_cart,
-            'purchased': purchased,
-            'revenue_eur': round(random.uniform(29.99, 159.99), 2) if purchased else '',
-            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
-    
-    return recommendations
+    session_picks = rng.integers(len(sessions), size=count).tolist()
+    product_ids = np.array(products)
+    
+    rec_types = rng.choice(recommendation_types, count)
+    has_source = np.isin(rec_types, ['similar_items', 'frequently_bought_together'])
+    source_products = np.where(has_source, product_ids[rng.integers(len(products), size=count)], '')
+    recommended_products = product_ids[rng.integers(len(products), size=count)]
+    
+    # Shown on a whole minute in the 181 days from 2024-06-01
+    shown_minutes = rng.integers(0, 181 * 24 * 60, count)
+    shown_timestamps = np.datetime64('2024-06-01T00:00:00') + (shown_minutes * 60).astype('timedelta64[s]')
+    clicked_timestamps = shown_timestamps + rng.integers(1, 301, count).astype('timedelta64[s]')
+    
+    clicked = rng.random(count) > 0.85  # 15% CTR
+    added_to_cart = clicked & (rng.random(count) > 0.7)  # 30% add to cart rate from clicks
+    purchased = added_to_cart & (rng.random(count) > 0.6)  # 40% purchase rate from adds
+    revenues = np.where(purchased, np.round(rng.uniform(29.99, 159.99, count), 2), np.nan)  # Written as ''
+    
+    return pd.DataFrame({
+        'recommendation_id': [f"REC_2024_{i:08d}" for i in range(1, count + 1)],
+        'session_id': [sessions[k][0] for k in session_picks],
+        'customer_id': [sessions[k][1] or '' for k in session_picks],
+        'country_code': [sessions[k][2] for k in session_picks],
+        'recommendation_type': rec_types,
+        'source_product_id': source_products,
+        'recommended_product_id': recommended_products,
+        'recommendation_position': rng.integers(1, 9, count),
+        'page_context': rng.choice(page_contexts, count),
+        'algorithm_version': rng.choice(algorithm_versions, count),
+        'confidence_score': np.round(rng.uniform(0.1, 0.99, count), 4),
+        'shown_timestamp': _format_timestamps(shown_timestamps),
+        'clicked': clicked,
+        'clicked_timestamp': np.where(clicked, _format_timestamps(clicked_timestamps), ''),
+        'added_to_cart': added_to_cart,
+        'purchased': purchased,
+        'revenue_eur': revenues,
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    })
 
 def generate_ab_test_results(sessions: List[tuple], count: int = 30000):
     """Generate A/B test results data"""
@@ -501,22 +517,36 @@ def generate_ab_test_results(sessions: List[tuple], count: int = 30000):
     
     return results
 
-def write_csv(data: List[Dict], filename: str):
-    """Write data to CSV file"""
-    if not data:
+def write_csv(data: Union[List[Dict], pd.DataFrame], filename: str):
+    """Write data (a list of dicts or a DataFrame) to a gzipped CSV file
+    
+    The file is written as <filename>.gz through a text wrapper and a large
+    raw file buffer, so gzip and the disk see big blocks rather than one
+    write per row. DataFrames go through pandas' CSV writer. Dict rows are
+    turned into field-ordered tuples by one itemgetter and written by
+    csv.writer in a single writerows call, skipping DictWriter's per-row
+    key check.
+    """
+    if len(data) == 0:
         print(f"No data to write for {filename}")
         return
         
-    output_path = Path('data/csv') / filename
+    output_path = Path('data/csv') / f"{filename}.gz"
     output_path.parent.mkdir(exist_ok=True)
     
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = data[0].keys()
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
-    
-    print(f"Generated {len(data):,} records in {filename}")
+    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as raw_file, \
+            gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=COMPRESS_LEVEL) as gz_file, \
+            io.TextIOWrapper(gz_file, encoding='utf-8', newline='') as csvfile:
+        if isinstance(data, pd.DataFrame):
+            # Same line endings as csv.writer; NaN is written as ''
+            data.to_csv(csvfile, index=False, lineterminator='\r\n')
+        else:
+            fieldnames = list(data[0].keys())
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(map(itemgetter(*fieldnames), data))
+    
+    print(f"Generated {len(data):,} records in {output_path.name}")
 
 def main():
     print("🚀 Generating complete EuroStyle webshop analytics data...")
@@ -565,7 +595,7 @@ def main():
     print("Generated files:")
     
     output_dir = Path('data/csv')
-    for file in sorted(output_dir.glob('eurostyle_webshop.*.csv')):
+    for file in sorted(output_dir.glob('eurostyle_webshop.*.csv.gz')):
         size_mb = file.stat().st_size / (1024 * 1024)
         print(f"  📄 {file.name} ({size_mb:.1f} MB)")
 
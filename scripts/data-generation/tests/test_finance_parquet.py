@@ -0,0 +1,44 @@
+"""Checks for the finance generator's batched Parquet writer."""
+
+import os
+import sys
+from datetime import date
+
+import pytest
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate_complete_finance_data as finance
+
+
+def test_column_all_none_in_first_batch(tmp_path, monkeypatch):
+    """A column that is all None in the first batch keeps its declared type."""
+    monkeypatch.setattr(finance, 'PARQUET_BATCH_SIZE', 10)
+    rows = [('a', None)] * 25 + [('b', 'x')]
+    
+    info = finance.write_parquet(tmp_path, 't.csv', rows, ['k', 'v'])
+    
+    table = pq.read_table(info['path'])
+    assert info['records'] == 26
+    assert str(table.schema.field('v').type) == 'string'
+    assert table.column('v').to_pylist() == [None] * 25 + ['x']
+
+
+def test_declared_column_types(tmp_path):
+    """Amounts, dates and timestamps are cast from their generated strings."""
+    rows = [
+        ('JL_1', '235.05', '1.103643', '2023-01-18', '2024-01-01 00:00:00'),
+        ('JL_2', '0.00', '1.000000', '', '2024-01-01 00:00:00'),
+    ]
+    fieldnames = ['journal_line_id', 'debit_amount', 'exchange_rate', 'disposal_date', 'created_date']
+    
+    info = finance.write_parquet(tmp_path, 't.csv', rows, fieldnames)
+    
+    table = pq.read_table(info['path'])
+    assert str(table.schema.field('debit_amount').type) == 'decimal128(18, 2)'
+    assert str(table.schema.field('exchange_rate').type) == 'decimal128(18, 6)'
+    assert str(table.schema.field('disposal_date').type) == 'date32[day]'
+    assert table.column('disposal_date').to_pylist() == [date(2023, 1, 18), None]
+    assert [str(v) for v in table.column('debit_amount').to_pylist()] == ['235.05', '0.00']